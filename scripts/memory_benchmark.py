@@ -0,0 +1,84 @@
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.memory_benchmark import (
+    charger_budget,
+    executer_benchmark,
+    verifier_budget,
+)
+
+BUDGET_PAR_DEFAUT = os.path.join(os.path.dirname(__file__), "memory_budget.json")
+
+# Structures negligeables a une etape (bruit de mesure) exclues du budget
+SEUIL_BUDGET = 16
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Mesure la memoire par tache et par arc des structures PERT"
+    )
+    parser.add_argument(
+        "--tailles",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 50000],
+        help="Nombres de taches des pipelines synthetiques",
+    )
+    parser.add_argument("--predecesseurs", type=int, default=2)
+    parser.add_argument("--budget", default=BUDGET_PAR_DEFAUT)
+    parser.add_argument(
+        "--enregistrer-budget",
+        action="store_true",
+        help="Enregistre la mesure de la plus grande taille (+10%%) comme budget",
+    )
+    args = parser.parse_args()
+
+    mesures = executer_benchmark(args.tailles, nb_predecesseurs=args.predecesseurs)
+
+    for mesure in mesures:
+        print(
+            f"\n{mesure['nb_taches']} taches, {mesure['nb_arcs']} arcs "
+            f"(pic: {mesure['pic'] / 1e6:.1f} Mo)"
+        )
+        for etape, structures in mesure["etapes"].items():
+            for structure, valeurs in structures.items():
+                print(
+                    f"  {etape:<11} {structure:<16} {valeurs['octets'] / 1e6:>9.2f} Mo"
+                    f" {valeurs['par_tache']:>8.0f} o/tache"
+                    f" {valeurs['par_arc']:>8.0f} o/arc"
+                )
+
+    # Les octets par tache sont juges sur la plus grande taille mesuree
+    plus_grande = mesures[-1]
+
+    if args.enregistrer_budget:
+        budget = {
+            etape: {
+                structure: round(valeurs["par_tache"] * 1.1)
+                for structure, valeurs in structures.items()
+                if structure != "autres" and valeurs["par_tache"] >= SEUIL_BUDGET
+            }
+            for etape, structures in plus_grande["etapes"].items()
+        }
+        with open(args.budget, "w", encoding="utf-8") as fichier:
+            json.dump(budget, fichier, indent=2)
+        print(f"\nBudget enregistre dans {args.budget}")
+        return 0
+
+    depassements = verifier_budget(plus_grande, charger_budget(args.budget))
+    if depassements:
+        print("\nBudget memoire depasse:")
+        for depassement in depassements:
+            print(f"  - {depassement}")
+        return 1
+
+    print("\nBudget memoire respecte")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
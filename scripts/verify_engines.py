@@ -0,0 +1,54 @@
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.verification import FORMES, VerificateurMoteurs
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare tous les moteurs PERT a la reference sur des DAG aleatoires"
+    )
+    parser.add_argument("--formes", nargs="+", default=list(FORMES))
+    parser.add_argument(
+        "--tailles", type=int, nargs="+", default=[1, 2, 5, 20, 100, 500]
+    )
+    parser.add_argument("--graines", type=int, default=5)
+    parser.add_argument("--graine", type=int, default=0)
+    args = parser.parse_args()
+
+    rapport = VerificateurMoteurs().verifier(
+        formes=args.formes,
+        tailles=args.tailles,
+        nb_graines=args.graines,
+        graine=args.graine,
+    )
+
+    print(f"{rapport['nb_cas']} graphes verifies\n")
+    print(f"{'Moteur':<22} {'Taches':>10} {'Secondes':>10} {'Taches/s':>12}")
+    for nom, debit in rapport["debits"].items():
+        print(
+            f"{nom:<22} {debit['taches']:>10} {debit['secondes']:>10.2f}"
+            f" {debit['taches_par_seconde']:>12.0f}"
+        )
+
+    if not rapport["echecs"]:
+        print("\nTous les moteurs concordent avec la reference")
+        return 0
+
+    print(f"\n{len(rapport['echecs'])} echec(s):")
+    for echec in rapport["echecs"]:
+        print(
+            f"\n- {echec['moteur']} sur {echec['forme']} "
+            f"({echec['taille']} taches, graine {echec['graine']})"
+        )
+        print(f"  Cas reduit: {echec['cas']}")
+        for difference in echec["differences"][:5]:
+            print(f"    {difference}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
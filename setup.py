@@ -12,8 +12,14 @@ setup(
         "numpy>=2.4.0",
         "pandas>=2.3.0",
     ],
-    # development dependencies
+    # optional and development dependencies
     extras_require={
+        "arrow": [
+            "pyarrow>=15.0.0",
+        ],
+        "ci": [
+            "pyyaml>=6.0",
+        ],
         "dev": [
             "pytest>=9.0.0",
             "pytest-cov>=7.0.0",
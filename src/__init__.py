@@ -1,7 +1,31 @@
+from .ci_importer import ImportateurCI
+from .concurrency import AnalyseurConcurrence
+from .export import ExportateurPERT
+from .fusion import OptimiseurFusion
 from .graph_builder import GraphePERT
+from .heft import OrdonnanceurHEFT
+from .partitioning import PartitionneurPERT
 from .pert_calculator import CalculateurPERT
+from .queries import RequetesPlanning
+from .reachability import IndexAccessibilite
+from .schedule_diff import ComparateurPERT
+from .simulation import SimulateurFlotte
+from .snapshot import InstantaneAnalyse
+from .verification import VerificateurMoteurs
 
 __all__ = [
     "GraphePERT",
     "CalculateurPERT",
+    "ComparateurPERT",
+    "IndexAccessibilite",
+    "AnalyseurConcurrence",
+    "ImportateurCI",
+    "PartitionneurPERT",
+    "InstantaneAnalyse",
+    "ExportateurPERT",
+    "SimulateurFlotte",
+    "VerificateurMoteurs",
+    "OptimiseurFusion",
+    "OrdonnanceurHEFT",
+    "RequetesPlanning",
 ]
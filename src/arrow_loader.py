@@ -0,0 +1,156 @@
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - dependance optionnelle
+    pa = None
+
+from .graph_builder import analyser_relation
+
+# Noms des colonnes lues par defaut (projection)
+COLONNES_PAR_DEFAUT = {
+    "code": "code",
+    "nom": "nom",
+    "duree": "duree",
+    "predecesseurs": "predecesseurs",
+}
+
+
+def _verifier_pyarrow():
+    """
+    Leve une erreur explicite si pyarrow n'est pas installe
+    """
+    if pa is None:
+        raise ImportError(
+            "pyarrow est requis pour charger des fichiers Parquet/Arrow: "
+            "pip install pert-cpm[arrow]"
+        )
+
+
+def lire_table_taches(chemin: str, colonnes: dict | None = None):
+    """
+    Lit uniquement les colonnes utiles d'un fichier Parquet ou Arrow IPC
+
+    Les fichiers sont ouverts en memory map: les buffers Arrow pointent
+    directement dans le fichier, sans copie.
+
+    Args:
+        chemin: Fichier .parquet, ou .arrow/.feather/.ipc (format IPC)
+        colonnes: Correspondance {'code'|'nom'|'duree'|'predecesseurs': colonne}
+
+    Returns:
+        Table pyarrow restreinte aux colonnes presentes parmi celles demandees
+    """
+    _verifier_pyarrow()
+    noms = {**COLONNES_PAR_DEFAUT, **(colonnes or {})}
+
+    if str(chemin).endswith(".parquet"):
+        disponibles = pq.read_schema(chemin).names
+        projection = [c for c in noms.values() if c in disponibles]
+        return pq.read_table(chemin, columns=projection, memory_map=True)
+
+    # La table reference la projection memoire: ne pas fermer le fichier ici
+    table = pa.ipc.open_file(pa.memory_map(str(chemin), "r")).read_all()
+    projection = [c for c in noms.values() if c in table.column_names]
+    return table.select(projection)
+
+
+def _predecesseurs_aplatis(colonne):
+    """
+    Aplatit la colonne des predecesseurs en (valeurs, ligne de chaque valeur)
+
+    Accepte une colonne de listes de chaines ou une colonne de chaines
+    separees par des virgules (format CSV). Les valeurs nulles ou vides sont
+    ignorees.
+    """
+    if pa.types.is_string(colonne.type) or pa.types.is_large_string(colonne.type):
+        colonne = pc.split_pattern(colonne, ",")
+
+    valeurs = pc.utf8_trim_whitespace(pc.list_flatten(colonne))
+    lignes = pc.list_parent_indices(colonne).to_numpy()
+
+    # Un element nul dans une liste donne une longueur nulle (None): ignore
+    non_vides = pc.fill_null(pc.greater(pc.utf8_length(valeurs), 0), False)
+    valeurs = valeurs.filter(non_vides)
+    lignes = lignes[non_vides.to_numpy(zero_copy_only=False)]
+
+    if isinstance(valeurs, pa.ChunkedArray):
+        valeurs = valeurs.combine_chunks()
+    return valeurs, lignes
+
+
+def remplir_graphe(graphe_pert, table, colonnes: dict | None = None):
+    """
+    Ajoute les taches d'une table Arrow a un GraphePERT
+
+    Les noeuds et les arcs sont construits en bloc a partir des colonnes
+    (add_nodes_from / add_edges_from), sans iterer ligne par ligne sur la
+    table. Seules les relations typees ('A:SS+2') passent par l'analyseur texte.
+
+    Args:
+        graphe_pert: Instance de GraphePERT a remplir
+        table: Table ou RecordBatch pyarrow
+        colonnes: Correspondance {'code'|'nom'|'duree'|'predecesseurs': colonne}
+    """
+    _verifier_pyarrow()
+    noms = {**COLONNES_PAR_DEFAUT, **(colonnes or {})}
+
+    codes = np.asarray(
+        pc.utf8_trim_whitespace(
+            pc.cast(table.column(noms["code"]), pa.string())
+        ).to_pylist(),
+        dtype=object,
+    )
+    colonne_durees = table.column(noms["duree"])
+    if colonne_durees.null_count:
+        manquantes = codes[pc.is_null(colonne_durees).to_numpy(zero_copy_only=False)]
+        raise ValueError(f"Duree manquante pour {', '.join(manquantes)}")
+    durees = colonne_durees.to_numpy().astype(np.int64)
+    durees = (durees + graphe_pert.surcout_job).tolist()
+    if noms["nom"] in table.column_names:
+        libelles = table.column(noms["nom"]).to_pylist()
+    else:
+        libelles = codes.tolist()
+
+    if noms["predecesseurs"] in table.column_names:
+        valeurs, lignes = _predecesseurs_aplatis(table.column(noms["predecesseurs"]))
+    else:
+        valeurs, lignes = pa.array([], type=pa.string()), np.zeros(0, dtype=np.int64)
+
+    # Les valeurs sont groupees par ligne: offsets[i]:offsets[i + 1]
+    offsets = np.searchsorted(lignes, np.arange(len(codes) + 1))
+    predecesseurs = valeurs.to_pylist()
+
+    # Relations simples (FS sans decalage) et relations typees a analyser
+    typees = pc.match_substring(valeurs, ":").to_numpy(zero_copy_only=False)
+    relations_typees = {}
+    for position in np.flatnonzero(typees):
+        relation = analyser_relation(predecesseurs[position])
+        predecesseurs[position] = relation[0]
+        relations_typees[position] = relation
+
+    # Ajout des noeuds et des arcs en bloc
+    graphe_pert.graphe.add_nodes_from(
+        (code, {"duree": duree, "nom": nom})
+        for code, duree, nom in zip(codes.tolist(), durees, libelles)
+    )
+    simples = np.flatnonzero(~typees)
+    graphe_pert.graphe.add_edges_from(
+        zip([predecesseurs[i] for i in simples], codes[lignes[simples]].tolist()),
+        type="FS",
+        decalage=0,
+    )
+    graphe_pert.graphe.add_edges_from(
+        (pred, codes[lignes[position]], {"type": type_relation, "decalage": decalage})
+        for position, (pred, type_relation, decalage) in relations_typees.items()
+    )
+
+    # Informations des taches (meme structure que ajouter_tache)
+    for i, (code, duree, nom) in enumerate(zip(codes.tolist(), durees, libelles)):
+        graphe_pert.taches[code] = {
+            "nom": nom,
+            "duree": duree,
+            "predecesseurs": predecesseurs[offsets[i] : offsets[i + 1]],
+        }
@@ -0,0 +1,361 @@
+import hashlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - dependance optionnelle
+    yaml = None
+
+from .graph_builder import GraphePERT
+
+# Cles de premier niveau d'un .gitlab-ci.yml qui ne sont pas des jobs
+MOTS_RESERVES_GITLAB = {
+    "default",
+    "include",
+    "stages",
+    "variables",
+    "workflow",
+    "image",
+    "services",
+    "cache",
+    "before_script",
+    "after_script",
+}
+
+STAGES_GITLAB_PAR_DEFAUT = [".pre", "build", "test", "deploy", ".post"]
+
+# Fichiers recherches par defaut lors du scan d'un monorepo
+MOTIFS_WORKFLOWS = (
+    "**/.github/workflows/*.yml",
+    "**/.github/workflows/*.yaml",
+    "**/.gitlab-ci.yml",
+)
+
+
+def _verifier_yaml():
+    """
+    Leve une erreur explicite si PyYAML n'est pas installe
+    """
+    if yaml is None:
+        raise ImportError(
+            "PyYAML est requis pour importer des workflows CI: pip install pert-cpm[ci]"
+        )
+
+
+def _combinaisons(axes: dict) -> list[dict]:
+    """
+    Produit cartesien des axes d'une matrice {cle: valeur ou liste}
+    """
+    axes = {cle: v if isinstance(v, list) else [v] for cle, v in axes.items()}
+    return [dict(zip(axes, valeurs)) for valeurs in itertools.product(*axes.values())]
+
+
+def _cellules_github(job: str, definition: dict) -> list[str]:
+    """
+    Codes des taches d'un job GitHub Actions, une par cellule de matrice
+    """
+    matrice = (definition.get("strategy") or {}).get("matrix")
+    if not isinstance(matrice, dict):
+        # Pas de matrice, ou matrice dynamique (${{ fromJson(...) }})
+        return [job]
+
+    axes = {k: v for k, v in matrice.items() if k not in ("include", "exclude")}
+    cellules = _combinaisons(axes) if axes else []
+
+    for exclusion in matrice.get("exclude") or []:
+        cellules = [
+            c for c in cellules if any(c.get(k) != v for k, v in exclusion.items())
+        ]
+    for inclusion in matrice.get("include") or []:
+        # Un include qui ne correspond a aucune cellule existante en ajoute une
+        # (s'il correspond, il ne fait qu'ajouter des variables a la cellule)
+        cles = [cle for cle in inclusion if cle in axes]
+        correspond = any(all(c.get(k) == inclusion[k] for k in cles) for c in cellules)
+        if not axes or (cles and not correspond):
+            cellules.append(dict(inclusion))
+
+    if not cellules:
+        return [job]
+    return [f"{job} ({', '.join(str(v) for v in c.values())})" for c in cellules]
+
+
+def _cellules_gitlab(job: str, definition: dict) -> list[str]:
+    """
+    Codes des taches d'un job GitLab CI (parallel: N ou parallel: matrix)
+    """
+    parallele = definition.get("parallel")
+    if isinstance(parallele, int):
+        return [f"{job} {i}/{parallele}" for i in range(1, parallele + 1)]
+    if isinstance(parallele, dict) and isinstance(parallele.get("matrix"), list):
+        cellules = []
+        for axes in parallele["matrix"]:
+            cellules += _combinaisons(axes)
+        return [f"{job}: [{', '.join(str(v) for v in c.values())}]" for c in cellules]
+    return [job]
+
+
+def _jobs_github(contenu: dict) -> list[tuple[str, str, list[str]]]:
+    """
+    Extrait (job, cellule, needs) d'un workflow GitHub Actions
+    """
+    jobs = []
+    for job, definition in (contenu.get("jobs") or {}).items():
+        definition = definition or {}
+        besoins = definition.get("needs") or []
+        if isinstance(besoins, str):
+            besoins = [besoins]
+        for cellule in _cellules_github(job, definition):
+            jobs.append((job, cellule, list(besoins)))
+    return jobs
+
+
+def _besoins_gitlab(besoins: list, definitions: dict) -> list[str]:
+    """
+    Jobs requis par un 'needs' GitLab, limites au pipeline courant
+
+    Les besoins vers un autre projet ('project:') ou un pipeline parent
+    ('pipeline:') ne sont que des telechargements d'artefacts: ils sont
+    ignores, comme les besoins 'optional: true' vers un job absent.
+    """
+    jobs = []
+    for besoin in besoins or []:
+        if not isinstance(besoin, dict):
+            jobs.append(besoin)
+        elif "project" in besoin or "pipeline" in besoin:
+            continue
+        elif besoin.get("optional") and besoin["job"] not in definitions:
+            continue
+        else:
+            jobs.append(besoin["job"])
+    return jobs
+
+
+def _jobs_gitlab(contenu: dict) -> list[tuple[str, str, list[str]]]:
+    """
+    Extrait (job, cellule, needs) d'un .gitlab-ci.yml
+
+    Sans 'needs', un job depend de tous les jobs du stage precedent non vide.
+    Les stages '.pre' et '.post' existent toujours, en premier et en dernier.
+    """
+    stages = list(contenu.get("stages") or STAGES_GITLAB_PAR_DEFAUT)
+    if ".pre" not in stages:
+        stages.insert(0, ".pre")
+    if ".post" not in stages:
+        stages.append(".post")
+    definitions = {
+        job: definition
+        for job, definition in contenu.items()
+        if isinstance(definition, dict)
+        and job not in MOTS_RESERVES_GITLAB
+        and not str(job).startswith(".")
+    }
+
+    par_stage = {}
+    for job, definition in definitions.items():
+        stage = definition.get("stage", "test")
+        if stage not in stages:
+            raise ValueError(f"Job '{job}': stage non declare '{stage}'")
+        par_stage.setdefault(stage, []).append(job)
+
+    jobs = []
+    precedents = []
+    for stage in stages:
+        for job in par_stage.get(stage, []):
+            definition = definitions[job]
+            if "needs" in definition:
+                besoins = _besoins_gitlab(definition["needs"], definitions)
+            else:
+                besoins = list(precedents)
+            for cellule in _cellules_gitlab(job, definition):
+                jobs.append((job, cellule, besoins))
+        if par_stage.get(stage):
+            precedents = par_stage[stage]
+    return jobs
+
+
+def analyser_workflow(texte: bytes | str) -> list[tuple[str, str, list[str]]]:
+    """
+    Analyse le contenu YAML d'un workflow GitHub Actions ou GitLab CI
+
+    Args:
+        texte: Contenu du fichier
+
+    Returns:
+        Liste de tuples (job, code de la tache, jobs requis), une entree par
+        cellule de matrice
+    """
+    _verifier_yaml()
+    contenu = yaml.safe_load(texte) or {}
+
+    if isinstance(contenu.get("jobs"), dict):
+        return _jobs_github(contenu)
+    return _jobs_gitlab(contenu)
+
+
+class ImportateurCI:
+    """
+    Classe pour importer des workflows CI (GitHub Actions / GitLab CI) en GraphePERT
+    """
+
+    def __init__(
+        self,
+        durees=None,
+        duree_defaut: int = 1,
+        fichier_cache: str | None = None,
+        nb_processus: int | None = None,
+    ):
+        """
+        Args:
+            durees: Table des durees {code: minutes} ou chemin d'un CSV
+                'code,duree'. Une cellule de matrice sans duree propre prend
+                celle de son job.
+            duree_defaut: Duree des jobs absents de la table
+            fichier_cache: Fichier JSON ou conserver le cache entre executions
+            nb_processus: Nombre de processus pour l'analyse YAML (None: CPU)
+        """
+        if isinstance(durees, (str, os.PathLike)):
+            df = pd.read_csv(durees)
+            df.columns = df.columns.str.strip()
+            durees = dict(zip(df["code"].astype(str).str.strip(), df["duree"]))
+        self.durees = {str(k): int(v) for k, v in (durees or {}).items()}
+        self.duree_defaut = duree_defaut
+        self.fichier_cache = fichier_cache
+        self.nb_processus = nb_processus
+
+        # {chemin: {'mtime': ns, 'taille': octets, 'empreinte': sha256, 'jobs': [...]}}
+        self.cache = {}
+        if fichier_cache and os.path.exists(fichier_cache):
+            with open(fichier_cache, encoding="utf-8") as f:
+                self.cache = json.load(f)
+
+    def sauvegarder_cache(self):
+        """
+        Ecrit le cache dans fichier_cache (si defini)
+        """
+        if self.fichier_cache:
+            with open(self.fichier_cache, "w", encoding="utf-8") as f:
+                json.dump(self.cache, f)
+
+    def _jobs_fichiers(self, chemins: list[str]) -> dict[str, list]:
+        """
+        Retourne les jobs de chaque fichier, en n'analysant que les fichiers
+        modifies (mtime/taille puis empreinte du contenu), en parallele
+        """
+        resultats = {}
+        a_analyser = {}
+
+        for chemin in chemins:
+            infos = os.stat(chemin)
+            entree = self.cache.get(chemin)
+            if (
+                entree
+                and entree["mtime"] == infos.st_mtime_ns
+                and entree["taille"] == infos.st_size
+            ):
+                resultats[chemin] = entree["jobs"]
+                continue
+
+            contenu = Path(chemin).read_bytes()
+            empreinte = hashlib.sha256(contenu).hexdigest()
+            if entree and entree["empreinte"] == empreinte:
+                # Fichier touche mais contenu identique
+                entree.update(mtime=infos.st_mtime_ns, taille=infos.st_size)
+                resultats[chemin] = entree["jobs"]
+                continue
+
+            a_analyser[chemin] = (contenu, empreinte, infos)
+
+        if len(a_analyser) > 1 and self.nb_processus != 1:
+            with ProcessPoolExecutor(max_workers=self.nb_processus) as executeur:
+                analyses = executeur.map(
+                    analyser_workflow,
+                    [contenu for contenu, _, _ in a_analyser.values()],
+                    chunksize=16,
+                )
+                analyses = list(analyses)
+        else:
+            analyses = [analyser_workflow(c) for c, _, _ in a_analyser.values()]
+
+        for (chemin, (_, empreinte, infos)), jobs in zip(a_analyser.items(), analyses):
+            jobs = [list(job) for job in jobs]
+            self.cache[chemin] = {
+                "mtime": infos.st_mtime_ns,
+                "taille": infos.st_size,
+                "empreinte": empreinte,
+                "jobs": jobs,
+            }
+            resultats[chemin] = jobs
+
+        return resultats
+
+    def _duree(self, job: str, cellule: str) -> int:
+        """
+        Duree d'une cellule: la sienne, sinon celle du job, sinon la valeur defaut
+        """
+        return self.durees.get(cellule, self.durees.get(job, self.duree_defaut))
+
+    def construire_graphe(self, jobs: list) -> GraphePERT:
+        """
+        Construit un GraphePERT a partir des jobs analyses d'un workflow
+
+        Args:
+            jobs: Liste de (job, cellule, jobs requis)
+
+        Returns:
+            GraphePERT avec une tache par cellule de matrice
+        """
+        cellules = {}
+        for job, cellule, _ in jobs:
+            cellules.setdefault(job, []).append(cellule)
+
+        graphe = GraphePERT()
+        for job, cellule, besoins in jobs:
+            predecesseurs = []
+            for besoin in besoins:
+                if besoin not in cellules:
+                    raise ValueError(f"Job '{job}': besoin inconnu '{besoin}'")
+                # Un job qui depend d'une matrice attend toutes ses cellules
+                predecesseurs += [(c, "FS", 0) for c in cellules[besoin]]
+            graphe.ajouter_tache(
+                cellule, cellule, self._duree(job, cellule), predecesseurs
+            )
+
+        return graphe
+
+    def charger_fichier(self, chemin: str) -> GraphePERT:
+        """
+        Importe un seul fichier de workflow
+
+        Args:
+            chemin: Fichier YAML GitHub Actions ou GitLab CI
+
+        Returns:
+            GraphePERT du workflow
+        """
+        chemin = str(chemin)
+        return self.construire_graphe(self._jobs_fichiers([chemin])[chemin])
+
+    def scanner(self, racine: str, motifs=MOTIFS_WORKFLOWS) -> dict[str, GraphePERT]:
+        """
+        Importe tous les workflows d'un monorepo
+
+        Args:
+            racine: Dossier racine du depot
+            motifs: Motifs glob des fichiers de workflow
+
+        Returns:
+            Dictionnaire {chemin du fichier: GraphePERT}
+        """
+        chemins = sorted(
+            {str(chemin) for motif in motifs for chemin in Path(racine).glob(motif)}
+        )
+        jobs = self._jobs_fichiers(chemins)
+        self.sauvegarder_cache()
+
+        return {chemin: self.construire_graphe(jobs[chemin]) for chemin in chemins}
@@ -0,0 +1,148 @@
+import numpy as np
+
+from .graph_builder import GraphePERT
+from .pert_calculator import CalculateurPERT
+
+
+def profil_depuis_intervalles(debuts, fins) -> dict:
+    """
+    Calcule la courbe de concurrence d'un ensemble d'intervalles [debut, fin)
+
+    Balayage d'evenements en O(n log n): chaque debut compte +1, chaque fin -1,
+    les evenements simultanes sont regroupes avant la somme cumulee. Une tache
+    qui se termine a t et une autre qui commence a t ne se chevauchent pas.
+    Les intervalles vides (duree nulle) n'occupent aucun runner.
+
+    Args:
+        debuts: Dates de debut
+        fins: Dates de fin
+
+    Returns:
+        Dictionnaire {'temps', 'nombre', 'pic', 'fenetre_pic', 'aire'} ou
+        nombre[i] est le nombre de taches actives sur [temps[i], temps[i + 1])
+    """
+    debuts = np.asarray(debuts, dtype=np.int64)
+    fins = np.asarray(fins, dtype=np.int64)
+    actifs = fins > debuts
+    debuts, fins = debuts[actifs], fins[actifs]
+
+    if len(debuts) == 0:
+        return {
+            "temps": np.zeros(1, dtype=np.int64),
+            "nombre": np.zeros(1, dtype=np.int64),
+            "pic": 0,
+            "fenetre_pic": (0, 0),
+            "aire": 0,
+        }
+
+    instants = np.concatenate([debuts, fins])
+    variations = np.concatenate(
+        [np.ones(len(debuts), dtype=np.int64), -np.ones(len(fins), dtype=np.int64)]
+    )
+
+    temps, inverse = np.unique(instants, return_inverse=True)
+    cumul = np.zeros(len(temps), dtype=np.int64)
+    np.add.at(cumul, inverse, variations)
+    nombre = np.cumsum(cumul)
+
+    # Fenetre du premier pic, etendue aux segments consecutifs au meme niveau
+    i_pic = int(np.argmax(nombre))
+    j_pic = i_pic + 1
+    while nombre[j_pic] == nombre[i_pic]:
+        j_pic += 1
+    aire = int(np.sum(nombre[:-1] * np.diff(temps)))
+
+    return {
+        "temps": temps,
+        "nombre": nombre,
+        "pic": int(nombre[i_pic]),
+        "fenetre_pic": (int(temps[i_pic]), int(temps[j_pic])),
+        "aire": aire,
+    }
+
+
+class AnalyseurConcurrence:
+    """
+    Classe pour calculer le nombre de jobs simultanes d'un planning PERT
+    """
+
+    def __init__(self, calculateur):
+        """
+        Args:
+            calculateur: Instance de CalculateurPERT (analyse executee)
+        """
+        self.calc = calculateur
+
+    def _intervalles(self, dates: str = "tot"):
+        """
+        Retourne les tableaux (debuts, fins) au plus tot ou au plus tard
+        """
+        if dates == "tot":
+            source, cle_debut, cle_fin = self.calc.dates_tot, "ES", "EF"
+        elif dates == "tard":
+            source, cle_debut, cle_fin = self.calc.dates_tard, "LS", "LF"
+        else:
+            raise ValueError(f"Dates inconnues: {dates} (attendu 'tot' ou 'tard')")
+
+        debuts = np.fromiter(
+            (source[t][cle_debut] for t in self.calc.graphe.nodes()), dtype=np.int64
+        )
+        fins = np.fromiter(
+            (source[t][cle_fin] for t in self.calc.graphe.nodes()), dtype=np.int64
+        )
+        return debuts, fins
+
+    def calculer_profil(self, dates: str = "tot") -> dict:
+        """
+        Calcule la courbe de concurrence du planning
+
+        Args:
+            dates: 'tot' (ES/EF) ou 'tard' (LS/LF)
+
+        Returns:
+            Dictionnaire {'temps', 'nombre', 'pic', 'fenetre_pic', 'aire'}
+            ('aire' en runner-minutes)
+        """
+        return profil_depuis_intervalles(*self._intervalles(dates))
+
+    @staticmethod
+    def calculer_profil_lot(
+        plannings, dates: str = "tot", decalages: list[int] | None = None
+    ) -> dict:
+        """
+        Calcule la courbe de concurrence cumulee de plusieurs plannings
+
+        Permet de dimensionner une flotte de runners partagee: par defaut tous
+        les pipelines demarrent a t=0 (pire cas), sinon au decalage donne.
+
+        Args:
+            plannings: Liste de CalculateurPERT, GraphePERT ou chemins CSV
+            dates: 'tot' (ES/EF) ou 'tard' (LS/LF)
+            decalages: Instant de demarrage de chaque planning
+
+        Returns:
+            Profil cumule, avec en plus 'pics' (pic de chaque planning)
+        """
+        if decalages is None:
+            decalages = [0] * len(plannings)
+
+        tous_debuts, toutes_fins, pics = [], [], []
+        for planning, decalage in zip(plannings, decalages):
+            if not isinstance(planning, CalculateurPERT):
+                if not isinstance(planning, GraphePERT):
+                    planning = GraphePERT(planning)
+                planning = CalculateurPERT(planning)
+            if not planning.dates_tot:
+                planning.executer_analyse_complete()
+
+            debuts, fins = AnalyseurConcurrence(planning)._intervalles(dates)
+            tous_debuts.append(debuts + decalage)
+            toutes_fins.append(fins + decalage)
+            pics.append(profil_depuis_intervalles(debuts, fins)["pic"])
+
+        profil = profil_depuis_intervalles(
+            np.concatenate(tous_debuts) if tous_debuts else [],
+            np.concatenate(toutes_fins) if toutes_fins else [],
+        )
+        profil["pics"] = pics
+        return profil
@@ -0,0 +1,215 @@
+import json
+from contextlib import contextmanager, nullcontext
+from xml.sax.saxutils import escape, quoteattr
+
+import networkx as nx
+
+# Attributs numeriques exportes pour chaque tache (cle GraphML, type)
+ATTRIBUTS_TACHE = (
+    ("duree", "long"),
+    ("ES", "long"),
+    ("EF", "long"),
+    ("LS", "long"),
+    ("LF", "long"),
+    ("marge", "long"),
+    ("marge_libre", "long"),
+)
+
+
+@contextmanager
+def _ouvrir(sortie):
+    """
+    Ouvre un chemin en ecriture, ou utilise tel quel un objet fichier
+    """
+    if isinstance(sortie, str) or hasattr(sortie, "__fspath__"):
+        with open(sortie, "w", encoding="utf-8") as fichier:
+            yield fichier
+    else:
+        with nullcontext(sortie) as fichier:
+            yield fichier
+
+
+def _texte_dot(valeur) -> str:
+    """
+    Chaine DOT entre guillemets
+    """
+    texte = str(valeur).replace("\\", "\\\\").replace('"', '\\"')
+    return '"' + texte.replace("\n", "\\n") + '"'
+
+
+class ExportateurPERT:
+    """
+    Classe pour exporter un graphe PERT analyse en DOT, GraphML ou JSON
+
+    Les fichiers sont ecrits au fil d'un parcours topologique, une tache (et
+    ses arcs entrants) a la fois: aucune representation complete de la sortie
+    n'est construite en memoire.
+    """
+
+    def __init__(self, calculateur):
+        """
+        Args:
+            calculateur: Instance de CalculateurPERT (l'analyse est executee
+                si elle ne l'a pas encore ete)
+        """
+        if not calculateur.marges_libres:
+            calculateur.executer_analyse_complete()
+
+        self.calc = calculateur
+        self.graphe = calculateur.graphe
+
+    def _taches(self):
+        """
+        Genere (code, attributs) pour chaque tache en ordre topologique
+        """
+        calc = self.calc
+        for tache in nx.topological_sort(self.graphe):
+            noeud = self.graphe.nodes[tache]
+            yield tache, {
+                "nom": noeud["nom"],
+                "duree": noeud["duree"],
+                "ES": calc.dates_tot[tache]["ES"],
+                "EF": calc.dates_tot[tache]["EF"],
+                "LS": calc.dates_tard[tache]["LS"],
+                "LF": calc.dates_tard[tache]["LF"],
+                "marge": calc.marges[tache],
+                "marge_libre": calc.marges_libres[tache],
+                "critique": calc.est_critique(tache),
+            }
+
+    def _arcs_entrants(self, tache: str):
+        """
+        Genere (pred, succ, attributs) pour les arcs entrants d'une tache
+        """
+        for pred, arc in self.graphe.pred[tache].items():
+            yield pred, tache, {
+                "type": arc.get("type", "FS"),
+                "decalage": arc.get("decalage", 0),
+                "critique": self.calc.est_arc_critique(pred, tache),
+            }
+
+    def exporter_dot(self, sortie):
+        """
+        Exporte au format DOT (Graphviz)
+
+        Les taches et arcs critiques sont en rouge.
+
+        Args:
+            sortie: Chemin du fichier ou objet fichier ouvert en ecriture
+        """
+        with _ouvrir(sortie) as fichier:
+            fichier.write("digraph PERT {\n  rankdir=LR;\n  node [shape=box];\n")
+
+            for tache, attributs in self._taches():
+                etiquette = (
+                    f"{tache} - {attributs['nom']}\n"
+                    f"[{attributs['ES']}-{attributs['EF']}] "
+                    f"marge {attributs['marge']}"
+                )
+                couleur = ' color="red"' if attributs["critique"] else ""
+                fichier.write(
+                    f"  {_texte_dot(tache)} [label={_texte_dot(etiquette)}"
+                    f" duree={attributs['duree']} ES={attributs['ES']}"
+                    f" EF={attributs['EF']} LS={attributs['LS']}"
+                    f" LF={attributs['LF']} marge={attributs['marge']}"
+                    f" marge_libre={attributs['marge_libre']}"
+                    f" critique={str(attributs['critique']).lower()}{couleur}];\n"
+                )
+
+                for pred, succ, arc in self._arcs_entrants(tache):
+                    couleur = ' color="red"' if arc["critique"] else ""
+                    fichier.write(
+                        f"  {_texte_dot(pred)} -> {_texte_dot(succ)}"
+                        f" [type={arc['type']} decalage={arc['decalage']}"
+                        f" critique={str(arc['critique']).lower()}{couleur}];\n"
+                    )
+
+            fichier.write("}\n")
+
+    def exporter_graphml(self, sortie):
+        """
+        Exporte au format GraphML (lisible par networkx, Gephi, yEd...)
+
+        Args:
+            sortie: Chemin du fichier ou objet fichier ouvert en ecriture
+        """
+        with _ouvrir(sortie) as fichier:
+            fichier.write(
+                '<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+                '  <key id="nom" for="node" attr.name="nom" attr.type="string"/>\n'
+            )
+            for cle, type_graphml in ATTRIBUTS_TACHE:
+                fichier.write(
+                    f'  <key id="{cle}" for="node" attr.name="{cle}"'
+                    f' attr.type="{type_graphml}"/>\n'
+                )
+            fichier.write(
+                '  <key id="critique" for="node" attr.name="critique"'
+                ' attr.type="boolean"/>\n'
+                '  <key id="type" for="edge" attr.name="type" attr.type="string"/>\n'
+                '  <key id="decalage" for="edge" attr.name="decalage"'
+                ' attr.type="long"/>\n'
+                '  <key id="arc_critique" for="edge" attr.name="critique"'
+                ' attr.type="boolean"/>\n'
+                '  <graph id="PERT" edgedefault="directed">\n'
+            )
+
+            for tache, attributs in self._taches():
+                fichier.write(f"    <node id={quoteattr(tache)}>\n")
+                fichier.write(
+                    f'      <data key="nom">{escape(str(attributs["nom"]))}</data>\n'
+                )
+                for cle, _ in ATTRIBUTS_TACHE:
+                    fichier.write(f'      <data key="{cle}">{attributs[cle]}</data>\n')
+                fichier.write(
+                    f'      <data key="critique">'
+                    f'{str(attributs["critique"]).lower()}</data>\n'
+                    "    </node>\n"
+                )
+
+                for pred, succ, arc in self._arcs_entrants(tache):
+                    fichier.write(
+                        f"    <edge source={quoteattr(pred)} target={quoteattr(succ)}>\n"
+                        f'      <data key="type">{arc["type"]}</data>\n'
+                        f'      <data key="decalage">{arc["decalage"]}</data>\n'
+                        f'      <data key="arc_critique">'
+                        f'{str(arc["critique"]).lower()}</data>\n'
+                        "    </edge>\n"
+                    )
+
+            fichier.write("  </graph>\n</graphml>\n")
+
+    def exporter_json(self, sortie):
+        """
+        Exporte au format JSON pour les visualiseurs web
+
+        Format: {"duree_totale": T, "chemin_critique": [...],
+        "taches": [{"code", "nom", "duree", "ES", ...}],
+        "arcs": [{"source", "cible", "type", "decalage", "critique"}]}
+
+        Args:
+            sortie: Chemin du fichier ou objet fichier ouvert en ecriture
+        """
+        with _ouvrir(sortie) as fichier:
+            fichier.write(
+                f'{{"duree_totale": {json.dumps(self.calc.duree_totale)}, '
+                f'"chemin_critique": {json.dumps(self.calc.chemin_critique)},\n'
+                '"taches": ['
+            )
+            separateur = "\n"
+            for tache, attributs in self._taches():
+                fichier.write(separateur + json.dumps({"code": tache, **attributs}))
+                separateur = ",\n"
+
+            # Second parcours topologique pour les arcs (pas de liste en memoire)
+            fichier.write('\n],\n"arcs": [')
+            separateur = "\n"
+            for tache in nx.topological_sort(self.graphe):
+                for pred, succ, arc in self._arcs_entrants(tache):
+                    fichier.write(
+                        separateur + json.dumps({"source": pred, "cible": succ, **arc})
+                    )
+                    separateur = ",\n"
+
+            fichier.write("\n]}\n")
@@ -0,0 +1,236 @@
+import copy
+
+import networkx as nx
+
+from .pert_calculator import CalculateurPERT
+
+
+class OptimiseurFusion:
+    """
+    Classe pour proposer des fusions de jobs qui reduisent le surcout de demarrage
+
+    Chaque job paie le surcout fixe surcout_job du GraphePERT. Deux familles de
+    fusions sont evaluees sur une copie du graphe:
+
+    - chaines: u -> v ou v est le seul successeur de u et u le seul
+      predecesseur de v; la fusion ne peut que raccourcir le planning;
+    - freres: jobs ayant les memes predecesseurs, executes a la suite sur un
+      seul runner; la fusion n'est retenue que si le job obtenu tient dans sa
+      marge (le chemin critique ne s'allonge pas). La marge est bornee par la
+      duree totale hors echeances: une echeance posterieure a la fin du
+      pipeline ne donne pas de marge supplementaire.
+
+    Une fusion acceptee ne relance pas l'analyse complete: seules les dates du
+    job fusionne, de ses descendants (au plus tot) et de ses ancetres (au plus
+    tard) sont recalculees, ainsi que les queues hors echeances des ancetres.
+    """
+
+    def __init__(self, graphe_pert, duree_max: int | None = None):
+        """
+        Args:
+            graphe_pert: Instance de GraphePERT (non modifiee)
+            duree_max: Duree maximale d'un job fusionne (limite de temps des
+                jobs de la CI), sans limite par defaut
+        """
+        self.graphe_pert = graphe_pert
+        self.duree_max = duree_max
+        self.graphe_fusionne = None
+        self._calc = None
+        self._queues = {}
+
+    def _fusionnable(self, tache: str) -> bool:
+        """
+        Un job est fusionnable si toutes ses relations sont FS et s'il n'est
+        pas instable (une relance rejouerait tout le job fusionne)
+        """
+        graphe = self.graphe_fusionne.graphe
+        if graphe.nodes[tache].get("proba_echec"):
+            return False
+        return all(
+            arc.get("type", "FS") == "FS"
+            for arcs in (
+                graphe.in_edges(tache, data=True),
+                graphe.out_edges(tache, data=True),
+            )
+            for _, _, arc in arcs
+        )
+
+    def _duree_fusion(self, taches) -> int:
+        """
+        Duree du job obtenu en fusionnant des taches
+        """
+        graphe = self.graphe_fusionne.graphe
+        surcout = self.graphe_fusionne.surcout_job
+        return sum(graphe.nodes[t]["duree"] for t in taches) - surcout * (
+            len(taches) - 1
+        )
+
+    def _trop_long(self, taches) -> bool:
+        """
+        Le job fusionne depasserait la duree maximale
+        """
+        return (
+            self.duree_max is not None and self._duree_fusion(taches) > self.duree_max
+        )
+
+    def _candidats_chaines(self) -> list[list[str]]:
+        """
+        Chaines maximales de jobs fusionnables (arcs FS sans decalage), coupees
+        pour respecter duree_max
+        """
+        graphe = self.graphe_fusionne.graphe
+
+        def maillon(pred, succ):
+            return (
+                graphe.out_degree(pred) == 1
+                and graphe.in_degree(succ) == 1
+                and graphe.edges[pred, succ].get("decalage", 0) == 0
+                and self._fusionnable(pred)
+                and self._fusionnable(succ)
+            )
+
+        chaines = []
+        for tache in nx.topological_sort(graphe):
+            preds = list(graphe.predecessors(tache))
+            if len(preds) == 1 and maillon(preds[0], tache):
+                continue
+
+            chaine = [tache]
+            while graphe.out_degree(chaine[-1]) == 1:
+                succ = next(iter(graphe.successors(chaine[-1])))
+                if not maillon(chaine[-1], succ):
+                    break
+                if self._trop_long(chaine + [succ]):
+                    if len(chaine) > 1:
+                        chaines.append(chaine)
+                    chaine = [succ]
+                else:
+                    chaine.append(succ)
+            if len(chaine) > 1:
+                chaines.append(chaine)
+
+        return chaines
+
+    def _mettre_a_jour_queues(self, tache: str):
+        """
+        Recalcule la queue hors echeances d'une tache et propage aux ancetres
+        dont la queue change
+        """
+        calc = self._calc
+        graphe = self.graphe_fusionne.graphe
+        a_traiter = [tache]
+        while a_traiter:
+            courante = a_traiter.pop()
+            queue = max(
+                (
+                    self._queues[succ] + calc._poids_arc(courante, succ)
+                    for succ in graphe.successors(courante)
+                ),
+                default=0,
+            )
+            queue = max(queue, 0)
+            if self._queues.get(courante) != queue:
+                self._queues[courante] = queue
+                a_traiter.extend(graphe.predecessors(courante))
+
+    def _appliquer(self, taches: list[str], genre: str) -> dict:
+        """
+        Fusionne des taches dans la copie et met les dates a jour localement
+        """
+        calc = self._calc
+        duree_totale = calc.duree_totale
+        surcout = self.graphe_fusionne.surcout_job
+        code = self.graphe_fusionne.fusionner_taches(taches, verifier=False)
+
+        for tache in taches:
+            calc.dates_tot.pop(tache, None)
+            calc.dates_tard.pop(tache, None)
+            self._queues.pop(tache, None)
+        self._mettre_a_jour_queues(code)
+        calc.recalculer_dates_au_plus_tot([code])
+        calc.recalculer_dates_au_plus_tard(
+            [code, *self.graphe_fusionne.graphe.predecessors(code)],
+            duree_totale_precedente=duree_totale,
+        )
+
+        return {
+            "type": genre,
+            "taches": list(taches),
+            "code": code,
+            "duree": self.graphe_fusionne.graphe.nodes[code]["duree"],
+            "gain_minutes_runner": surcout * (len(taches) - 1),
+            "gain_duree_totale": duree_totale - calc.duree_totale,
+        }
+
+    def _fusion_freres_possible(self, x: str, y: str) -> bool:
+        """
+        Le job x puis y, demarre au plus tot, finit avant sa date au plus tard
+        et sans allonger la duree totale
+        """
+        calc = self._calc
+        debut = max(calc.dates_tot[x]["ES"], calc.dates_tot[y]["ES"])
+        fin_au_plus_tard = min(
+            calc.dates_tard[x]["LF"],
+            calc.dates_tard[y]["LF"],
+            calc.duree_totale - max(self._queues[x], self._queues[y]),
+        )
+        return debut + self._duree_fusion([x, y]) <= fin_au_plus_tard
+
+    def proposer(self) -> dict:
+        """
+        Propose une suite de fusions (chaines puis freres) et l'applique a une
+        copie du graphe (disponible dans self.graphe_fusionne)
+
+        Returns:
+            Dictionnaire {'fusions', 'duree_totale_avant', 'duree_totale_apres',
+            'minutes_runner_avant', 'minutes_runner_apres'} ou chaque fusion est
+            {'type', 'taches', 'code', 'duree', 'gain_minutes_runner',
+            'gain_duree_totale'}
+        """
+        self.graphe_fusionne = copy.deepcopy(self.graphe_pert)
+        graphe = self.graphe_fusionne.graphe
+        self._calc = calc = CalculateurPERT(self.graphe_fusionne)
+        calc.calculer_dates_au_plus_tot()
+        calc.calculer_dates_au_plus_tard()
+        self._queues, _ = calc._queues_et_limites(
+            list(nx.topological_sort(graphe)), echeances=False
+        )
+
+        duree_totale_avant = calc.duree_totale
+        minutes_runner_avant = sum(duree for _, duree in graphe.nodes(data="duree"))
+        fusions = []
+
+        if self.graphe_fusionne.surcout_job > 0:
+            for chaine in self._candidats_chaines():
+                fusions.append(self._appliquer(chaine, "chaine"))
+
+            # Freres: memes predecesseurs, du plus court au plus long
+            groupes = {}
+            for tache in nx.topological_sort(graphe):
+                if self._fusionnable(tache):
+                    cle = frozenset(graphe.predecessors(tache))
+                    groupes.setdefault(cle, []).append(tache)
+
+            for groupe in groupes.values():
+                groupe.sort(key=lambda tache: graphe.nodes[tache]["duree"])
+                courant = groupe[0]
+                for tache in groupe[1:]:
+                    paire = [courant, tache]
+                    if not self._trop_long(paire) and self._fusion_freres_possible(
+                        courant, tache
+                    ):
+                        fusion = self._appliquer(paire, "freres")
+                        fusions.append(fusion)
+                        courant = fusion["code"]
+                    else:
+                        courant = tache
+
+        return {
+            "fusions": fusions,
+            "duree_totale_avant": duree_totale_avant,
+            "duree_totale_apres": calc.duree_totale,
+            "minutes_runner_avant": minutes_runner_avant,
+            "minutes_runner_apres": sum(
+                duree for _, duree in graphe.nodes(data="duree")
+            ),
+        }
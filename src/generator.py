@@ -0,0 +1,51 @@
+import csv
+import random
+
+
+def generer_taches(
+    nb_taches: int,
+    nb_predecesseurs: int = 2,
+    fenetre: int = 50,
+    duree_max: int = 30,
+    graine: int = 0,
+):
+    """
+    Genere un pipeline synthetique acyclique, tache par tache
+
+    Chaque tache depend d'au plus `nb_predecesseurs` taches choisies parmi les
+    `fenetre` precedentes, ce qui donne un graphe profond et localement dense,
+    proche des gros pipelines de build.
+
+    Args:
+        nb_taches: Nombre de taches
+        nb_predecesseurs: Nombre maximal de predecesseurs par tache
+        fenetre: Nombre de taches precedentes parmi lesquelles choisir
+        duree_max: Duree maximale d'une tache (minutes)
+        graine: Graine du generateur aleatoire (reproductibilite)
+
+    Returns:
+        Generateur de tuples (code, nom, duree, predecesseurs)
+    """
+    aleatoire = random.Random(graine)
+
+    for i in range(nb_taches):
+        debut = max(0, i - fenetre)
+        nb = min(nb_predecesseurs, i - debut)
+        predecesseurs = [f"T{j}" for j in sorted(aleatoire.sample(range(debut, i), nb))]
+        yield f"T{i}", f"Tache {i}", aleatoire.randint(1, duree_max), predecesseurs
+
+
+def generer_csv(chemin: str, nb_taches: int, **options):
+    """
+    Ecrit un pipeline synthetique au format CSV de GraphePERT
+
+    Args:
+        chemin: Fichier CSV de sortie
+        nb_taches: Nombre de taches
+        **options: Options de generer_taches (nb_predecesseurs, fenetre, ...)
+    """
+    with open(chemin, "w", newline="", encoding="utf-8") as fichier:
+        ecrivain = csv.writer(fichier)
+        ecrivain.writerow(["code", "nom", "duree", "predecesseurs"])
+        for code, nom, duree, predecesseurs in generer_taches(nb_taches, **options):
+            ecrivain.writerow([code, nom, duree, ",".join(predecesseurs)])
@@ -1,19 +1,86 @@
+import re
+
 import networkx as nx
 import pandas as pd
 
+# Types de relations de precedence supportes (debut/fin -> debut/fin)
+TYPES_RELATIONS = ("FS", "SS", "FF", "SF")
+
+# Syntaxe texte d'une relation typee: "A:SS+2", "B:FF", "C:FS-1"
+_MOTIF_RELATION = re.compile(r"^(FS|SS|FF|SF)\s*([+-]\s*\d+)?$")
+
+# Suffixe qui ressemble a une relation (deux lettres suivies d'un decalage, ou
+# deux lettres F/S): s'il n'est pas valide, c'est une faute de frappe et non
+# une partie du code ('deploy:qa' reste un code)
+_MOTIF_RELATION_APPROCHEE = re.compile(r"^([A-Z]{2}\s*[+-]|[FS]{2}\b)")
+
+# Colonnes optionnelles de l'estimation trois points (PERT probabiliste)
+COLONNES_ESTIMATION = ("optimiste", "probable", "pessimiste")
+
+# Colonnes optionnelles des jobs instables (echecs intermittents relances)
+COLONNES_RELANCES = ("proba_echec", "max_relances")
+
+# Prefixe des colonnes de duree par classe de runner ("duree_rapide", ...)
+PREFIXE_DUREE_CLASSE = "duree_"
+
+
+def analyser_relation(predecesseur) -> tuple[str, str, int]:
+    """
+    Normalise un predecesseur en relation (code, type, decalage)
+
+    Args:
+        predecesseur: Code simple ('A'), texte type ('A:SS+2') ou
+            tuple (code, type) / (code, type, decalage). Un suffixe ':' qui
+            n'a pas la forme d'une relation ('ns:job') fait partie du code.
+
+    Returns:
+        Tuple (code, type, decalage)
+    """
+    if isinstance(predecesseur, (tuple, list)):
+        code = str(predecesseur[0]).strip()
+        type_relation = (
+            str(predecesseur[1]).strip().upper() if len(predecesseur) > 1 else "FS"
+        )
+        decalage = int(predecesseur[2]) if len(predecesseur) > 2 else 0
+    else:
+        code, type_relation, decalage = str(predecesseur).strip(), "FS", 0
+        if ":" in code:
+            base, suffixe = code.rsplit(":", 1)
+            suffixe = suffixe.strip().upper()
+            correspondance = _MOTIF_RELATION.match(suffixe)
+            if correspondance:
+                code = base.strip()
+                type_relation = correspondance.group(1)
+                if correspondance.group(2):
+                    decalage = int(correspondance.group(2).replace(" ", ""))
+            elif _MOTIF_RELATION_APPROCHEE.match(suffixe):
+                raise ValueError(
+                    f"Relation invalide: {code} (attendu: 'A:SS+2', types "
+                    f"{', '.join(TYPES_RELATIONS)})"
+                )
+
+    if type_relation not in TYPES_RELATIONS:
+        raise ValueError(f"Type de relation inconnu: {type_relation}")
+
+    return code, type_relation, decalage
+
 
 class GraphePERT:
     """
     Classe pour construire et manipuler un graphe PERT/CPM
     """
 
-    def __init__(self, fichier_csv: str | None = None):
+    def __init__(self, fichier_csv: str | None = None, surcout_job: int = 0):
         """
         Args:
             fichier_csv: Chemin vers le fichier CSV des taches
+            surcout_job: Cout fixe de demarrage de chaque job en minutes
+                (provisionnement du runner, checkout, restauration du cache),
+                ajoute a la duree de chaque tache
         """
         self.graphe = nx.DiGraph()
         self.taches = {}
+        self.surcout_job = surcout_job
 
         if fichier_csv:
             self.charger_donnees(fichier_csv)
@@ -40,10 +107,75 @@ class GraphePERT:
             else:
                 predecesseurs = []
 
-            self.ajouter_tache(code, nom, duree, predecesseurs)
+            # Estimation trois points optionnelle (colonnes optimiste/probable/pessimiste)
+            estimation = None
+            if all(colonne in df.columns for colonne in COLONNES_ESTIMATION):
+                valeurs = [row[colonne] for colonne in COLONNES_ESTIMATION]
+                if not any(pd.isna(valeur) for valeur in valeurs):
+                    estimation = tuple(float(valeur) for valeur in valeurs)
+
+            # Echeance optionnelle (jalon ou SLA, en minutes depuis le debut)
+            echeance = None
+            if "echeance" in df.columns and not pd.isna(row["echeance"]):
+                echeance = int(row["echeance"])
+
+            # Instabilite optionnelle: probabilite d'echec et nombre de relances
+            relances = None
+            if "proba_echec" in df.columns and not pd.isna(row["proba_echec"]):
+                max_relances = row.get("max_relances")
+                relances = (
+                    float(row["proba_echec"]),
+                    0 if pd.isna(max_relances) else int(max_relances),
+                )
+
+            # Durees optionnelles par classe de runner (colonnes duree_<classe>)
+            durees_classes = {
+                colonne[len(PREFIXE_DUREE_CLASSE) :]: int(row[colonne])
+                for colonne in df.columns
+                if colonne.startswith(PREFIXE_DUREE_CLASSE)
+                and not pd.isna(row[colonne])
+            }
+
+            self.ajouter_tache(
+                code,
+                nom,
+                duree,
+                predecesseurs,
+                estimation,
+                echeance=echeance,
+                relances=relances,
+                durees_classes=durees_classes or None,
+            )
+
+    def charger_arrow(self, source, colonnes: dict | None = None):
+        """
+        Charge les taches depuis un fichier Parquet/Arrow ou une table pyarrow
+
+        Necessite la dependance optionnelle pyarrow. Seules les colonnes utiles
+        sont lues, et les fichiers sont ouverts en memory map.
+
+        Args:
+            source: Chemin .parquet / .arrow / .feather, ou table pyarrow
+            colonnes: Correspondance {'code'|'nom'|'duree'|'predecesseurs': colonne}
+                si le fichier utilise d'autres noms de colonnes
+        """
+        from .arrow_loader import lire_table_taches, remplir_graphe
+
+        if isinstance(source, str) or hasattr(source, "__fspath__"):
+            source = lire_table_taches(source, colonnes)
+
+        remplir_graphe(self, source, colonnes)
 
     def ajouter_tache(
-        self, code: str, nom: str, duree: int, predecesseurs: list[str] | None = None
+        self,
+        code: str,
+        nom: str,
+        duree: int,
+        predecesseurs: list[str] | None = None,
+        estimation: tuple[float, float, float] | None = None,
+        echeance: int | None = None,
+        relances: tuple[float, int] | None = None,
+        durees_classes: dict[str, int] | None = None,
     ):
         """
         Ajoute une tache au graphe
@@ -51,21 +183,227 @@ class GraphePERT:
         Args:
             code: Code de la tache (ex: 'A')
             nom: Nom descriptif de la tache
-            duree: Duree en minutes
-            predecesseurs: Liste des codes des taches predecesseurs
+            duree: Duree en minutes, hors surcout de demarrage du job
+            predecesseurs: Liste des predecesseurs, chacun etant un code
+                (relation FS sans decalage), un texte 'A:SS+2' ou un tuple
+                (code, type, decalage) avec type parmi FS, SS, FF, SF
+            estimation: Estimation trois points (optimiste, probable, pessimiste)
+                utilisee par l'analyse probabiliste
+            echeance: Date limite de fin de la tache (jalon ou SLA); remplace
+                la duree totale comme borne du calcul au plus tard
+            relances: Tuple (proba_echec, max_relances) d'un job instable: chaque
+                tentative echoue avec la probabilite proba_echec et le job est
+                relance au plus max_relances fois
+            durees_classes: Duree du job sur chaque classe de runner
+                ({'rapide': 6, 'eco': 15}); la duree de reference s'applique
+                aux classes absentes
         """
         if predecesseurs is None:
             predecesseurs = []
 
+        relations = [analyser_relation(pred) for pred in predecesseurs]
+        duree += self.surcout_job
+
+        attributs = {}
+        if estimation is not None:
+            optimiste, probable, pessimiste = estimation
+            if not optimiste <= probable <= pessimiste:
+                raise ValueError(
+                    f"Estimation invalide pour {code}: il faut "
+                    "optimiste <= probable <= pessimiste"
+                )
+            attributs = dict(zip(COLONNES_ESTIMATION, estimation))
+        if echeance is not None:
+            attributs["echeance"] = echeance
+        if relances is not None:
+            proba_echec, max_relances = relances
+            if not 0 <= proba_echec < 1 or max_relances < 0:
+                raise ValueError(
+                    f"Relances invalides pour {code}: il faut "
+                    "0 <= proba_echec < 1 et max_relances >= 0"
+                )
+            attributs.update(zip(COLONNES_RELANCES, (proba_echec, max_relances)))
+        if durees_classes:
+            if any(valeur < 0 for valeur in durees_classes.values()):
+                raise ValueError(f"Duree negative pour {code}")
+            attributs["durees_classes"] = {
+                classe: valeur + self.surcout_job
+                for classe, valeur in durees_classes.items()
+            }
+
         # Stocker les informations de la tache
-        self.taches[code] = {"nom": nom, "duree": duree, "predecesseurs": predecesseurs}
+        self.taches[code] = {
+            "nom": nom,
+            "duree": duree,
+            "predecesseurs": [pred for pred, _, _ in relations],
+            **attributs,
+        }
 
         # Ajouter le noeud au graphe
-        self.graphe.add_node(code, duree=duree, nom=nom)
+        self.graphe.add_node(code, duree=duree, nom=nom, **attributs)
+
+        # Ajouter les arcs depuis le predecesseurs (type et decalage sur l'arc)
+        for pred, type_relation, decalage in relations:
+            self.graphe.add_edge(pred, code, type=type_relation, decalage=decalage)
+
+    def definir_echeance(self, code: str, echeance: int | None):
+        """
+        Definit (ou retire avec None) l'echeance d'une tache existante
+
+        Args:
+            code: Code de la tache
+            echeance: Date limite de fin en minutes, ou None
+        """
+        if echeance is None:
+            self.graphe.nodes[code].pop("echeance", None)
+            self.taches[code].pop("echeance", None)
+        else:
+            self.graphe.nodes[code]["echeance"] = echeance
+            self.taches[code]["echeance"] = echeance
+
+    def fusionner_taches(
+        self, codes: list[str], code: str | None = None, verifier: bool = True
+    ) -> str:
+        """
+        Fusionne plusieurs taches en un seul job qui les execute a la suite
+
+        Le job fusionne ne paie qu'une fois le surcout de demarrage: sa duree est
+        la somme des durees moins (len(codes) - 1) * surcout_job. Il herite des
+        relations externes des taches fusionnees; quand plusieurs relations
+        relient la meme tache externe, la plus contraignante (plus grand
+        decalage) est gardee. Seules les relations FS sont supportees.
+
+        Args:
+            codes: Taches a fusionner, dans leur ordre d'execution
+            code: Code du job fusionne (par defaut: codes joints par '+')
+            verifier: Verifier que la fusion ne cree pas de cycle (un chemin
+                entre deux taches fusionnees passant par une autre tache)
+
+        Returns:
+            Code du job fusionne
+        """
+        fusionnees = set(codes)
+        if len(fusionnees) < 2:
+            raise ValueError("Il faut au moins deux taches a fusionner")
+        code = code or "+".join(codes)
+        if code in self.graphe and code not in fusionnees:
+            raise ValueError(f"La tache {code} existe deja")
+
+        predecesseurs, successeurs = {}, {}
+        for tache in codes:
+            for voisins, arcs in (
+                (predecesseurs, self.graphe.in_edges(tache, data=True)),
+                (successeurs, self.graphe.out_edges(tache, data=True)),
+            ):
+                for pred, succ, arc in arcs:
+                    if arc.get("type", "FS") != "FS":
+                        raise ValueError(
+                            f"Relation {arc['type']} {pred} -> {succ}: seules les "
+                            "relations FS peuvent etre fusionnees"
+                        )
+                    externe = succ if pred == tache else pred
+                    if externe not in fusionnees:
+                        voisins[externe] = max(
+                            voisins.get(externe, arc.get("decalage", 0)),
+                            arc.get("decalage", 0),
+                        )
+
+        if verifier:
+            # Un descendant externe qui remonte vers une tache fusionnee: cycle
+            pile, vus = list(successeurs), set(successeurs)
+            while pile:
+                for succ in self.graphe.successors(pile.pop()):
+                    if succ in fusionnees:
+                        raise ValueError(
+                            f"Fusion impossible: un chemin externe relie des "
+                            f"taches de {', '.join(codes)}"
+                        )
+                    if succ not in vus:
+                        vus.add(succ)
+                        pile.append(succ)
+
+        noeuds = [self.graphe.nodes[tache] for tache in codes]
+        nom = " + ".join(noeud["nom"] for noeud in noeuds)
+        duree = sum(noeud["duree"] for noeud in noeuds)
+        duree -= (len(codes) - 1) * self.surcout_job
+        attributs = {}
+        echeances = [noeud["echeance"] for noeud in noeuds if "echeance" in noeud]
+        if echeances:
+            attributs["echeance"] = min(echeances)
+        classes = {c for noeud in noeuds for c in noeud.get("durees_classes", {})}
+        if classes:
+            attributs["durees_classes"] = {
+                classe: sum(
+                    noeud.get("durees_classes", {}).get(classe, noeud["duree"])
+                    for noeud in noeuds
+                )
+                - (len(codes) - 1) * self.surcout_job
+                for classe in classes
+            }
+
+        self.graphe.remove_nodes_from(codes)
+        for tache in codes:
+            self.taches.pop(tache, None)
+
+        self.graphe.add_node(code, duree=duree, nom=nom, **attributs)
+        for pred, decalage in predecesseurs.items():
+            self.graphe.add_edge(pred, code, type="FS", decalage=decalage)
+        for succ, decalage in successeurs.items():
+            self.graphe.add_edge(code, succ, type="FS", decalage=decalage)
+            if succ in self.taches:
+                anciens = self.taches[succ]["predecesseurs"]
+                self.taches[succ]["predecesseurs"] = [
+                    pred for pred in anciens if pred not in fusionnees
+                ] + [code]
+        self.taches[code] = {
+            "nom": nom,
+            "duree": duree,
+            "predecesseurs": list(predecesseurs),
+            **attributs,
+        }
+
+        return code
+
+    def reduire_arcs_redondants(self) -> int:
+        """
+        Retire les arcs redondants (reduction transitive) sans changer le planning
+
+        Un arc FS sans decalage u -> v est redondant s'il existe un autre chemin
+        de u a v forme d'arcs FS a decalage positif ou nul: ce chemin impose deja
+        une contrainte au moins aussi forte. Les dates, marges et marges libres
+        restent identiques. Les relations SS/FF/SF et les arcs avec decalage
+        sont toujours conserves.
+
+        La detection utilise des bitsets de descendants construits en ordre
+        topologique inverse, liberes des que possible pour rester utilisable sur
+        des DAG denses.
+
+        Returns:
+            Nombre d'arcs retires
+        """
+        from .reachability import construire_fermeture
+
+        # Seuls les arcs FS a decalage >= 0 peuvent rendre un autre arc redondant
+        sous_graphe = nx.subgraph_view(
+            self.graphe,
+            filter_edge=lambda u, v: self.graphe.edges[u, v].get("type", "FS") == "FS"
+            and self.graphe.edges[u, v].get("decalage", 0) >= 0,
+        )
+        ordre = list(nx.topological_sort(self.graphe))
+        _, arcs_redondants = construire_fermeture(
+            sous_graphe, ordre, conserver_masques=False
+        )
+
+        retires = 0
+        for pred, succ in arcs_redondants:
+            if self.graphe.edges[pred, succ].get("decalage", 0) != 0:
+                continue
+            self.graphe.remove_edge(pred, succ)
+            if succ in self.taches:
+                self.taches[succ]["predecesseurs"].remove(pred)
+            retires += 1
 
-        # Ajouter les arcs depuis le predecesseurs
-        for pred in predecesseurs:
-            self.graphe.add_edge(pred, code)
+        return retires
 
     def obtenir_taches_initiales(self) -> list[str]:
         """
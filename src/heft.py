@@ -0,0 +1,193 @@
+import heapq
+
+import networkx as nx
+
+
+class OrdonnanceurHEFT:
+    """
+    Classe pour affecter les jobs a des classes de runners heterogenes
+
+    Ordonnancement de liste a la HEFT (Heterogeneous Earliest Finish Time):
+    le rang ascendant d'un job est sa duree moyenne sur les classes plus la
+    plus longue chaine (decalages compris) jusqu'a la fin du pipeline. Parmi
+    les jobs prets (tas par rang decroissant), le plus prioritaire est place
+    sur la classe qui minimise sa fin, eventuellement penalisee par son cout.
+    Chaque classe garde un tas de ses runners par date de disponibilite: un
+    placement coute O(C log R), l'ordonnancement O(V log V + E + V C log R).
+    Les relations sont traitees comme fin-debut, le decalage retardant le job.
+    Le graphe est compile (listes indexees, rangs) au premier ordonnancement.
+    """
+
+    def __init__(self, graphe_pert, classes: dict[str, dict]):
+        """
+        Args:
+            graphe_pert: Instance de GraphePERT (durees par classe dans
+                l'attribut durees_classes des taches)
+            classes: Classes de runners {nom: {'nb_runners': int,
+                'cout_minute': float}}
+        """
+        if not classes:
+            raise ValueError("Il faut au moins une classe de runners")
+        for nom, classe in classes.items():
+            if classe.get("nb_runners", 0) < 1:
+                raise ValueError(f"La classe {nom} doit avoir au moins un runner")
+
+        self.graphe_pert = graphe_pert
+        self.graphe = graphe_pert.graphe
+        self.classes = classes
+        self.noms_classes = list(classes)
+        self._modele = None
+
+    def _compiler(self) -> dict:
+        """
+        Convertit le graphe en listes indexees et calcule les rangs ascendants
+        """
+        graphe = self.graphe
+        ordre = list(nx.topological_sort(graphe))
+        index = {tache: i for i, tache in enumerate(ordre)}
+
+        durees = []
+        for tache in ordre:
+            noeud = graphe.nodes[tache]
+            par_classe = noeud.get("durees_classes", {})
+            inconnues = set(par_classe) - set(self.classes)
+            if inconnues:
+                raise ValueError(
+                    f"Classe(s) de runner inconnue(s) pour {tache}: "
+                    f"{', '.join(sorted(inconnues))}"
+                )
+            durees.append(
+                [par_classe.get(classe, noeud["duree"]) for classe in self.noms_classes]
+            )
+
+        successeurs = [
+            [
+                (index[succ], arc.get("decalage", 0))
+                for succ, arc in graphe.succ[tache].items()
+            ]
+            for tache in ordre
+        ]
+
+        rangs = [0.0] * len(ordre)
+        for i in range(len(ordre) - 1, -1, -1):
+            rangs[i] = sum(durees[i]) / len(durees[i]) + max(
+                (rangs[j] + decalage for j, decalage in successeurs[i]), default=0
+            )
+
+        self._modele = {
+            "ordre": ordre,
+            "durees": durees,
+            "successeurs": successeurs,
+            "degres": [graphe.in_degree(tache) for tache in ordre],
+            "rangs": rangs,
+        }
+        return self._modele
+
+    def ordonnancer(self, poids_cout: float = 0.0) -> dict:
+        """
+        Ordonnance le pipeline sur les classes de runners
+
+        Args:
+            poids_cout: Minutes de duree totale qu'on accepte de perdre par
+                unite de cout economisee (0: minimiser la fin de chaque job)
+
+        Returns:
+            Dictionnaire {'duree_totale', 'cout', 'minutes_par_classe',
+            'affectation'} ou affectation est {tache: {'classe', 'runner',
+            'debut', 'fin'}}
+        """
+        modele = self._modele or self._compiler()
+        durees, successeurs, rangs = (
+            modele["durees"],
+            modele["successeurs"],
+            modele["rangs"],
+        )
+        couts = [self.classes[nom].get("cout_minute", 0.0) for nom in self.noms_classes]
+        heappush, heappop, heapreplace = (
+            heapq.heappush,
+            heapq.heappop,
+            heapq.heapreplace,
+        )
+
+        # Un tas (disponibilite, runner) par classe
+        runners = [
+            [(0, runner) for runner in range(self.classes[nom]["nb_runners"])]
+            for nom in self.noms_classes
+        ]
+        restants = list(modele["degres"])
+        prets = [0] * len(durees)
+        debuts = [0] * len(durees)
+        fins = [0] * len(durees)
+        affectes = [None] * len(durees)
+        minutes = [0] * len(couts)
+
+        file_prets = [(-rangs[i], i) for i, degre in enumerate(restants) if degre == 0]
+        heapq.heapify(file_prets)
+
+        while file_prets:
+            _, i = heappop(file_prets)
+            meilleur = None
+            for c, duree in enumerate(durees[i]):
+                debut = max(prets[i], runners[c][0][0])
+                fin = debut + duree
+                cout = duree * couts[c]
+                cle = (fin + poids_cout * cout, fin, cout)
+                if meilleur is None or cle < meilleur[0]:
+                    meilleur = (cle, c, debut, fin)
+
+            _, c, debut, fin = meilleur
+            runner = runners[c][0][1]
+            heapreplace(runners[c], (fin, runner))
+            debuts[i], fins[i], affectes[i] = debut, fin, (c, runner)
+            minutes[c] += durees[i][c]
+
+            for j, decalage in successeurs[i]:
+                prets[j] = max(prets[j], fin + decalage)
+                restants[j] -= 1
+                if restants[j] == 0:
+                    heappush(file_prets, (-rangs[j], j))
+
+        return {
+            "duree_totale": max(fins, default=0),
+            "cout": sum(m * cout for m, cout in zip(minutes, couts)),
+            "minutes_par_classe": dict(zip(self.noms_classes, minutes)),
+            "affectation": {
+                tache: {
+                    "classe": self.noms_classes[affectes[i][0]],
+                    "runner": affectes[i][1],
+                    "debut": debuts[i],
+                    "fin": fins[i],
+                }
+                for i, tache in enumerate(modele["ordre"])
+            },
+        }
+
+    def compromis(self, poids_couts=(0, 1, 10, 100, 1000)) -> list[dict]:
+        """
+        Compare duree totale et cout pour plusieurs ponderations du cout
+
+        Args:
+            poids_couts: Valeurs de poids_cout a evaluer
+
+        Returns:
+            Liste de {'poids_cout', 'duree_totale', 'cout', 'pareto'} triee
+            par cout croissant; pareto indique les solutions non dominees
+        """
+        solutions = []
+        for poids_cout in poids_couts:
+            resultat = self.ordonnancer(poids_cout)
+            solutions.append(
+                {
+                    "poids_cout": poids_cout,
+                    "duree_totale": resultat["duree_totale"],
+                    "cout": resultat["cout"],
+                }
+            )
+
+        solutions.sort(key=lambda s: (s["cout"], s["duree_totale"]))
+        meilleure_duree = float("inf")
+        for solution in solutions:
+            solution["pareto"] = solution["duree_totale"] < meilleure_duree
+            meilleure_duree = min(meilleure_duree, solution["duree_totale"])
+
+        return solutions
@@ -0,0 +1,144 @@
+import gc
+import json
+import os
+import tempfile
+import tracemalloc
+
+from .generator import generer_csv
+from .graph_builder import GraphePERT
+from .pert_calculator import CalculateurPERT
+
+# Structure a laquelle est attribuee une allocation, selon le fichier source
+# de la ligne qui l'a faite
+STRUCTURES = (
+    ("networkx", "graphe_networkx"),
+    ("graph_builder.py", "taches"),
+    ("pert_calculator.py", "resultats"),
+    ("snapshot.py", "instantane"),
+)
+
+
+def _structure(fichier: str) -> str:
+    """
+    Nom de la structure correspondant au fichier d'une allocation
+    """
+    for motif, structure in STRUCTURES:
+        if motif in fichier:
+            return structure
+    return "autres"
+
+
+def _octets_par_structure(avant, apres) -> dict[str, int]:
+    """
+    Octets alloues entre deux instantanes tracemalloc, par structure
+    """
+    octets = {}
+    for difference in apres.compare_to(avant, "filename"):
+        structure = _structure(difference.traceback[0].filename)
+        octets[structure] = octets.get(structure, 0) + difference.size_diff
+    return octets
+
+
+def mesurer_memoire(fichier_csv: str) -> dict:
+    """
+    Mesure la memoire retenue par chaque structure pour un pipeline CSV
+
+    Deux etapes sont mesurees: apres charger_donnees (graphe networkx et
+    dictionnaire GraphePERT.taches) et apres executer_analyse_complete
+    (dictionnaires de resultats et instantane). Les objets temporaires liberes
+    (DataFrame pandas...) ne comptent que dans le pic.
+
+    Args:
+        fichier_csv: Chemin du fichier CSV des taches
+
+    Returns:
+        Dictionnaire {'nb_taches', 'nb_arcs', 'etapes', 'pic'} ou etapes vaut
+        {'chargement'|'analyse': {structure: {'octets', 'par_tache', 'par_arc'}}}
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        debut = tracemalloc.take_snapshot()
+        graphe = GraphePERT(fichier_csv)
+        gc.collect()
+        apres_chargement = tracemalloc.take_snapshot()
+
+        calculateur = CalculateurPERT(graphe)
+        calculateur.executer_analyse_complete()
+        gc.collect()
+        apres_analyse = tracemalloc.take_snapshot()
+        pic = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    nb_taches = graphe.graphe.number_of_nodes()
+    nb_arcs = graphe.graphe.number_of_edges()
+
+    etapes = {}
+    for etape, (avant, apres) in {
+        "chargement": (debut, apres_chargement),
+        "analyse": (apres_chargement, apres_analyse),
+    }.items():
+        octets = _octets_par_structure(avant, apres)
+        octets["total"] = sum(octets.values())
+        etapes[etape] = {
+            structure: {
+                "octets": valeur,
+                "par_tache": valeur / max(nb_taches, 1),
+                "par_arc": valeur / max(nb_arcs, 1),
+            }
+            for structure, valeur in octets.items()
+        }
+
+    return {"nb_taches": nb_taches, "nb_arcs": nb_arcs, "etapes": etapes, "pic": pic}
+
+
+def executer_benchmark(tailles, **options) -> list[dict]:
+    """
+    Mesure la memoire pour des pipelines synthetiques de differentes tailles
+
+    Args:
+        tailles: Nombres de taches a generer
+        **options: Options du generateur (nb_predecesseurs, fenetre, graine...)
+
+    Returns:
+        Liste des mesures (voir mesurer_memoire), une par taille
+    """
+    mesures = []
+    with tempfile.TemporaryDirectory() as dossier:
+        for taille in tailles:
+            chemin = os.path.join(dossier, f"taches_{taille}.csv")
+            generer_csv(chemin, taille, **options)
+            mesures.append(mesurer_memoire(chemin))
+    return mesures
+
+
+def charger_budget(chemin: str) -> dict:
+    """
+    Charge un budget {etape: {structure: octets par tache max}} depuis un JSON
+    """
+    with open(chemin, encoding="utf-8") as fichier:
+        return json.load(fichier)
+
+
+def verifier_budget(mesure: dict, budget: dict) -> list[str]:
+    """
+    Compare les octets par tache d'une mesure au budget
+
+    Args:
+        mesure: Resultat de mesurer_memoire
+        budget: Dictionnaire {etape: {structure: octets par tache max}}
+
+    Returns:
+        Liste des depassements (vide si le budget est respecte)
+    """
+    depassements = []
+    for etape, limites in budget.items():
+        for structure, limite in limites.items():
+            valeur = mesure["etapes"][etape].get(structure, {"par_tache": 0})
+            if valeur["par_tache"] > limite:
+                depassements.append(
+                    f"{etape}/{structure}: {valeur['par_tache']:.0f} octets/tache "
+                    f"> budget {limite}"
+                )
+    return depassements
@@ -0,0 +1,224 @@
+import networkx as nx
+
+from .concurrency import profil_depuis_intervalles
+from .graph_builder import GraphePERT
+from .pert_calculator import CalculateurPERT
+
+
+class PartitionneurPERT:
+    """
+    Classe pour repartir les taches d'un pipeline PERT sur plusieurs machines
+
+    Heuristique gloutonne en ordre topologique (chaque tache rejoint la
+    partition ou sont deja ses voisins, dans la limite de la charge), suivie
+    de passes de raffinement qui deplacent une tache lorsque cela reduit le
+    poids des arcs coupes. Chaque passe est en O(V + E).
+    """
+
+    def __init__(
+        self,
+        graphe_pert,
+        nb_partitions: int,
+        cout_transfert: int = 0,
+        tolerance: float = 0.1,
+    ):
+        """
+        Args:
+            graphe_pert: Instance de GraphePERT
+            nb_partitions: Nombre de machines de build
+            cout_transfert: Duree ajoutee a un arc coupe (transfert d'artefact)
+            tolerance: Desequilibre de charge admis (0.1 = 10% au-dessus de la
+                charge moyenne)
+        """
+        if nb_partitions < 1:
+            raise ValueError("Le nombre de partitions doit etre au moins 1")
+
+        self.graphe_pert = graphe_pert
+        self.graphe = graphe_pert.graphe
+        self.nb_partitions = nb_partitions
+        self.cout_transfert = cout_transfert
+        self.tolerance = tolerance
+        self.affectation = {}
+
+    def _poids_arcs(self) -> tuple[dict[tuple[str, str], int], set[str]]:
+        """
+        Poids de coupe des arcs: 1, ou plus que tous les autres arcs reunis
+        pour un arc du chemin critique (arc serre entre deux taches critiques)
+
+        Returns:
+            Tuple (poids des arcs, taches critiques)
+        """
+        calc = CalculateurPERT(self.graphe_pert)
+        calc.calculer_dates_au_plus_tot()
+        calc.calculer_dates_au_plus_tard()
+        calc.calculer_marges()
+        critiques = {tache for tache in calc.marges if calc.est_critique(tache)}
+        poids_critique = self.graphe.number_of_edges() + 1
+
+        poids = {}
+        for pred, succ in self.graphe.edges():
+            critique = calc.est_arc_critique(pred, succ)
+            poids[pred, succ] = poids_critique if critique else 1
+
+        return poids, critiques
+
+    def _connexions(self, tache: str, poids: dict) -> dict[int, int]:
+        """
+        Poids des arcs reliant une tache a chaque partition (voisins affectes)
+        """
+        connexions = {}
+        for pred in self.graphe.predecessors(tache):
+            if pred in self.affectation:
+                partition = self.affectation[pred]
+                connexions[partition] = (
+                    connexions.get(partition, 0) + poids[pred, tache]
+                )
+        for succ in self.graphe.successors(tache):
+            if succ in self.affectation:
+                partition = self.affectation[succ]
+                connexions[partition] = (
+                    connexions.get(partition, 0) + poids[tache, succ]
+                )
+        return connexions
+
+    def partitionner(self, nb_passes: int = 2) -> dict[str, int]:
+        """
+        Affecte chaque tache a une partition
+
+        Args:
+            nb_passes: Nombre de passes de raffinement apres l'affectation gloutonne
+
+        Returns:
+            Dictionnaire {code_tache: numero de partition}
+        """
+        poids, critiques = self._poids_arcs()
+        durees = nx.get_node_attributes(self.graphe, "duree")
+        ordre = list(nx.topological_sort(self.graphe))
+
+        charge_moyenne = sum(durees.values()) / self.nb_partitions
+        capacite = (1 + self.tolerance) * charge_moyenne
+        charges = [0] * self.nb_partitions
+        self.affectation = {}
+
+        # Affectation gloutonne, taches critiques d'abord pour que le chemin
+        # critique soit regroupe. Score d'une partition: poids des arcs vers ses
+        # taches, penalise par son remplissage (equilibrage progressif); a
+        # defaut de voisin, la partition la moins chargee.
+        for tache in sorted(ordre, key=lambda t: t not in critiques):
+            duree = durees[tache]
+            partition = min(range(self.nb_partitions), key=charges.__getitem__)
+            meilleur_score = 0
+            for candidate, connexion in self._connexions(tache, poids).items():
+                if charges[candidate] + duree > capacite:
+                    continue
+                score = connexion * (1 - charges[candidate] / capacite)
+                if score > meilleur_score:
+                    partition, meilleur_score = candidate, score
+
+            self.affectation[tache] = partition
+            charges[partition] += duree
+
+        # Raffinement: deplacer une tache si le poids coupe diminue
+        for _ in range(nb_passes):
+            deplacements = 0
+            for tache in ordre:
+                duree = durees[tache]
+                actuelle = self.affectation[tache]
+                connexions = self._connexions(tache, poids)
+                gain, cible = max(
+                    (
+                        (connexions[p] - connexions.get(actuelle, 0), p)
+                        for p in connexions
+                        if p != actuelle and charges[p] + duree <= capacite
+                    ),
+                    default=(0, actuelle),
+                )
+                if gain > 0:
+                    self.affectation[tache] = cible
+                    charges[actuelle] -= duree
+                    charges[cible] += duree
+                    deplacements += 1
+            if not deplacements:
+                break
+
+        return self.affectation
+
+    def arcs_coupes(self) -> list[tuple[str, str]]:
+        """
+        Retourne les arcs entre deux partitions differentes (transferts)
+        """
+        return [
+            (pred, succ)
+            for pred, succ in self.graphe.edges()
+            if self.affectation[pred] != self.affectation[succ]
+        ]
+
+    def construire_graphe_distribue(self) -> GraphePERT:
+        """
+        Construit le pipeline ou chaque arc coupe porte le cout de transfert
+        en decalage supplementaire
+        """
+        if not self.affectation:
+            self.partitionner()
+
+        graphe_distribue = GraphePERT()
+        for tache in nx.topological_sort(self.graphe):
+            noeud = self.graphe.nodes[tache]
+            predecesseurs = []
+            for pred, arc in self.graphe.pred[tache].items():
+                decalage = arc.get("decalage", 0)
+                if self.affectation[pred] != self.affectation[tache]:
+                    decalage += self.cout_transfert
+                predecesseurs.append((pred, arc.get("type", "FS"), decalage))
+            graphe_distribue.ajouter_tache(
+                tache, noeud["nom"], noeud["duree"], predecesseurs
+            )
+
+        return graphe_distribue
+
+    def estimer_planning(self) -> dict:
+        """
+        Calcule le planning de chaque partition et la duree totale estimee
+
+        Chaque machine est supposee executer ses taches des que leurs
+        dependances le permettent; le pic de concurrence indique le nombre de
+        runners necessaires sur la machine.
+
+        Returns:
+            Dictionnaire {'duree_totale', 'duree_totale_sans_transfert',
+            'arcs_coupes', 'partitions'} ou partitions est une liste de
+            {'taches', 'charge', 'debut', 'fin', 'pic'}
+        """
+        if not self.affectation:
+            self.partitionner()
+
+        reference = CalculateurPERT(self.graphe_pert)
+        reference.calculer_dates_au_plus_tot()
+        calc = CalculateurPERT(self.construire_graphe_distribue())
+        calc.calculer_dates_au_plus_tot()
+
+        membres = [[] for _ in range(self.nb_partitions)]
+        for tache in nx.topological_sort(self.graphe):
+            membres[self.affectation[tache]].append(tache)
+
+        partitions = []
+        for taches in membres:
+            taches.sort(key=lambda t: calc.dates_tot[t]["ES"])
+            debuts = [calc.dates_tot[t]["ES"] for t in taches]
+            fins = [calc.dates_tot[t]["EF"] for t in taches]
+            partitions.append(
+                {
+                    "taches": taches,
+                    "charge": sum(self.graphe.nodes[t]["duree"] for t in taches),
+                    "debut": min(debuts, default=0),
+                    "fin": max(fins, default=0),
+                    "pic": profil_depuis_intervalles(debuts, fins)["pic"],
+                }
+            )
+
+        return {
+            "duree_totale": calc.duree_totale,
+            "duree_totale_sans_transfert": reference.duree_totale,
+            "arcs_coupes": self.arcs_coupes(),
+            "partitions": partitions,
+        }
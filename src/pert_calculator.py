@@ -1,4 +1,86 @@
+import heapq
+import math
+import threading
+from collections import ChainMap
+from itertools import count
+
 import networkx as nx
+import numpy as np
+
+from .queries import RequetesPlanning
+from .snapshot import InstantaneAnalyse
+
+
+def poids_relation(type_relation: str, decalage, duree_pred, duree_succ):
+    """
+    Ecart minimal impose par une relation entre EF(pred) et EF(succ)
+
+    Toutes les relations se ramenent a une contrainte EF(succ) >= EF(pred) + poids,
+    ce qui permet un calcul de plus long chemin sur des arcs ponderes.
+
+    Args:
+        type_relation: 'FS', 'SS', 'FF' ou 'SF'
+        decalage: Decalage (lag) de la relation en minutes
+        duree_pred: Duree du predecesseur
+        duree_succ: Duree du successeur
+
+    Returns:
+        Poids de l'arc pred -> succ
+    """
+    if type_relation == "FS":
+        return decalage + duree_succ
+    if type_relation == "SS":
+        return decalage - duree_pred + duree_succ
+    if type_relation == "FF":
+        return decalage
+    if type_relation == "SF":
+        return decalage - duree_pred
+    raise ValueError(f"Type de relation inconnu: {type_relation}")
+
+
+def _fusionner_tas(a, b):
+    """
+    Fusion persistante de deux tas gauches (min-tas sur la cle)
+
+    Les noeuds sont des tuples (cle, rang, valeur, gauche, droite) jamais
+    modifies, ce qui permet de partager les sous-tas entre plusieurs versions.
+    """
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if b[0] < a[0]:
+        a, b = b, a
+    cle, _, valeur, gauche, droite = a
+    droite = _fusionner_tas(droite, b)
+    if gauche is None or gauche[1] < droite[1]:
+        gauche, droite = droite, gauche
+    rang = droite[1] + 1 if droite is not None else 1
+    return (cle, rang, valeur, gauche, droite)
+
+
+def _max_clark(moyenne_1, variance_1, moyenne_2, variance_2):
+    """
+    Moyenne et variance de max(X, Y) pour X, Y normales independantes
+
+    Approximation de Clark (1961): le max est ramene a une normale de memes
+    deux premiers moments.
+    """
+    ecart = math.sqrt(variance_1 + variance_2)
+    if ecart == 0:
+        return max(moyenne_1, moyenne_2), 0.0
+
+    alpha = (moyenne_1 - moyenne_2) / ecart
+    phi = math.exp(-alpha * alpha / 2) / math.sqrt(2 * math.pi)
+    cdf = 0.5 * (1 + math.erf(alpha / math.sqrt(2)))
+
+    moment_1 = moyenne_1 * cdf + moyenne_2 * (1 - cdf) + ecart * phi
+    moment_2 = (
+        (moyenne_1**2 + variance_1) * cdf
+        + (moyenne_2**2 + variance_2) * (1 - cdf)
+        + (moyenne_1 + moyenne_2) * ecart * phi
+    )
+    return moment_1, max(moment_2 - moment_1**2, 0.0)
 
 
 class CalculateurPERT:
@@ -18,7 +100,80 @@ class CalculateurPERT:
         self.marges = {}
         self.marges_libres = {}
         self.chemin_critique = []
+        self.marge_critique = 0
         self.duree_totale = 0
+        self.avancement = {}
+        self.maintenant = 0
+        self._suivi = None
+        self.distributions = {}
+        self.distribution_fin = {}
+        self.instantane = None
+        self._requetes = None
+        self._verrou_ecriture = threading.Lock()
+        self._versions = count(1)
+
+    def _poids_arc(self, pred: str, succ: str) -> int:
+        """
+        Poids de l'arc pred -> succ (contrainte EF(succ) >= EF(pred) + poids)
+        """
+        arc = self.graphe.edges[pred, succ]
+        return poids_relation(
+            arc.get("type", "FS"),
+            arc.get("decalage", 0),
+            self.graphe.nodes[pred]["duree"],
+            self.graphe.nodes[succ]["duree"],
+        )
+
+    def _calculer_dates_tot_tache(self, tache: str) -> dict[str, int]:
+        """
+        Calcule ES/EF d'une tache a partir des dates de ses predecesseurs
+        """
+        duree = self.graphe.nodes[tache]["duree"]
+
+        # Dates reelles connues (execution en cours): elles priment sur le planning
+        avancement = self.avancement.get(tache)
+        if avancement is not None:
+            debut = avancement["debut"]
+            if avancement["fin"] is not None:
+                return {"ES": debut, "EF": avancement["fin"]}
+            return {"ES": debut, "EF": debut + max(duree, avancement["ecoule"])}
+
+        # EF = max(duree, EF des predecesseurs + poids des relations)
+        # Pour une relation FS sans decalage: ES = max des EF des predecesseurs
+        # Une tache non demarree ne peut pas demarrer avant le dernier evenement
+        ef = max(
+            (
+                self.dates_tot[pred]["EF"] + self._poids_arc(pred, tache)
+                for pred in self.graphe.predecessors(tache)
+            ),
+            default=duree,
+        )
+        ef = max(ef, self.maintenant + duree)
+
+        return {"ES": ef - duree, "EF": ef}
+
+    def _calculer_dates_tard_tache(self, tache: str) -> dict[str, int]:
+        """
+        Calcule LS/LF d'une tache a partir des dates de ses successeurs
+        """
+        duree = self.graphe.nodes[tache]["duree"]
+
+        # Une echeance (jalon, SLA) remplace la duree totale comme borne
+        echeance = self.graphe.nodes[tache].get("echeance")
+        borne = self.duree_totale if echeance is None else echeance
+
+        # LF = min des LF des successeurs moins le poids des relations
+        # Pour une relation FS sans decalage: LF = min des LS des successeurs
+        lf = min(
+            (
+                self.dates_tard[succ]["LF"] - self._poids_arc(tache, succ)
+                for succ in self.graphe.successors(tache)
+            ),
+            default=borne,
+        )
+        lf = min(lf, borne)
+
+        return {"LS": lf - duree, "LF": lf}
 
     def calculer_dates_au_plus_tot(self) -> dict[str, dict[str, int]]:
         """
@@ -29,23 +184,10 @@ class CalculateurPERT:
         """
         # Tri topologique pour traiter les taches dans l'ordre
         ordre_topo = list(nx.topological_sort(self.graphe))
+        self._suivi = None
 
         for tache in ordre_topo:
-            duree = self.graphe.nodes[tache]["duree"]
-
-            # Predecesseurs de la tache
-            predecesseurs = list(self.graphe.predecessors(tache))
-
-            if not predecesseurs:
-                # Tache initiale
-                es = 0
-            else:
-                # ES = max des EF des predecesseurs
-                es = max(self.dates_tot[pred]["EF"] for pred in predecesseurs)
-
-            ef = es + duree
-
-            self.dates_tot[tache] = {"ES": es, "EF": ef}
+            self.dates_tot[tache] = self._calculer_dates_tot_tache(tache)
 
         # La duree totale est le max des EF
         self.duree_totale = max(data["EF"] for data in self.dates_tot.values())
@@ -63,23 +205,227 @@ class CalculateurPERT:
         ordre_topo_inverse = list(reversed(list(nx.topological_sort(self.graphe))))
 
         for tache in ordre_topo_inverse:
-            duree = self.graphe.nodes[tache]["duree"]
+            self.dates_tard[tache] = self._calculer_dates_tard_tache(tache)
 
-            # Successeurs de la tache
-            successeurs = list(self.graphe.successors(tache))
+        return self.dates_tard
 
-            if not successeurs:
-                # Tache finale
-                lf = self.duree_totale
-            else:
-                # LF = min des LS des successeurs
-                lf = min(self.dates_tard[succ]["LS"] for succ in successeurs)
+    def _zone_affectee(self, taches, voisins) -> list[str]:
+        """
+        Taches donnees et toutes celles atteintes via `voisins`, chaque tache
+        avant ses voisins (ordre topologique pour les successeurs, inverse pour
+        les predecesseurs)
 
-            ls = lf - duree
+        Tri de Kahn sur des dictionnaires: la zone etant fermee par `voisins`,
+        les degres se comptent sans vue de sous-graphe networkx.
+        """
+        zone = set(taches)
+        pile = list(zone)
+        while pile:
+            for voisin in voisins(pile.pop()):
+                if voisin not in zone:
+                    zone.add(voisin)
+                    pile.append(voisin)
 
-            self.dates_tard[tache] = {"LS": ls, "LF": lf}
+        degres = dict.fromkeys(zone, 0)
+        for tache in zone:
+            for voisin in voisins(tache):
+                degres[voisin] += 1
 
-        return self.dates_tard
+        ordre = [tache for tache, degre in degres.items() if degre == 0]
+        for tache in ordre:
+            for voisin in voisins(tache):
+                degres[voisin] -= 1
+                if degres[voisin] == 0:
+                    ordre.append(voisin)
+
+        return ordre
+
+    def recalculer_dates_au_plus_tot(self, taches) -> set[str]:
+        """
+        Recalcule ES/EF des taches donnees et de leurs descendants uniquement
+
+        Les autres taches conservent leurs dates, qui doivent etre a jour.
+        La propagation s'arrete aux taches dont les dates ne changent pas.
+        Les dates sont ecrites dans une copie du dictionnaire (les resultats
+        deja retournes ne changent pas); aucun instantane n'est publie, les
+        marges restant a recalculer par l'appelant.
+
+        Args:
+            taches: Taches dont la duree ou les predecesseurs ont change
+
+        Returns:
+            Ensemble des taches dont les dates au plus tot ont change
+        """
+        taches = set(taches)
+        modifiees = set()
+
+        with self._verrou_ecriture:
+            self._suivi = None
+            dates_tot = dict(self.dates_tot)
+            self.dates_tot = dates_tot
+
+            for tache in self._zone_affectee(taches, self.graphe.successors):
+                if tache not in taches and modifiees.isdisjoint(
+                    self.graphe.predecessors(tache)
+                ):
+                    continue
+
+                dates = self._calculer_dates_tot_tache(tache)
+                if dates != dates_tot.get(tache):
+                    dates_tot[tache] = dates
+                    modifiees.add(tache)
+
+            self.duree_totale = max(
+                dates_tot[tache]["EF"] for tache in self.graphe.nodes()
+            )
+
+        return modifiees
+
+    def _taches_avec_echeance(self) -> list[str]:
+        """
+        Taches portant une echeance (jalon ou SLA)
+        """
+        return [
+            tache
+            for tache, echeance in self.graphe.nodes(data="echeance")
+            if echeance is not None
+        ]
+
+    def _queues_et_limites(
+        self, ordre: list[str], echeances: bool = True
+    ) -> tuple[dict, dict]:
+        """
+        Decompose les dates au plus tard en deux termes independants de la
+        duree totale T: LF = min(T - Q, L)
+
+        Q (queue) est la plus longue contrainte entre la fin de la tache et une
+        tache finale sans echeance (-inf s'il n'y en a pas); L (limite) est la
+        date imposee par les echeances de la tache et de ses descendants
+        (+inf s'il n'y en a pas).
+
+        Args:
+            ordre: Ordre topologique des taches
+            echeances: Si False, les echeances sont ignorees: Q est alors la
+                plus longue contrainte jusqu'a n'importe quelle tache finale
+                (EF + Q = T pour les taches du plus long chemin)
+
+        Returns:
+            Tuple (queues, limites)
+        """
+        queues = {}
+        limites = {}
+        for tache in reversed(ordre):
+            echeance = self.graphe.nodes[tache].get("echeance") if echeances else None
+            queue = 0 if echeance is None else -math.inf
+            limite = math.inf if echeance is None else echeance
+            for succ in self.graphe.successors(tache):
+                poids = self._poids_arc(tache, succ)
+                queue = max(queue, queues[succ] + poids)
+                limite = min(limite, limites[succ] - poids)
+            queues[tache] = queue
+            limites[tache] = limite
+
+        return queues, limites
+
+    def calculer_debuts_au_plus_tard(self, echeances) -> dict:
+        """
+        Dates de debut au plus tard pour plusieurs echeances du projet a la fois
+
+        Chaque echeance remplace la duree totale comme borne des taches finales
+        sans echeance propre. Grace a la decomposition LF = min(T - Q, L), un
+        seul parcours arriere suffit pour toutes les echeances.
+
+        Args:
+            echeances: Une echeance ou une liste d'echeances du projet
+
+        Returns:
+            Dictionnaire {'taches', 'LS', 'marges'} ou LS et marges sont des
+            tableaux numpy (taches x echeances); une marge negative signale
+            une echeance intenable
+        """
+        if not self.dates_tot:
+            self.calculer_dates_au_plus_tot()
+
+        ordre = list(nx.topological_sort(self.graphe))
+        queues, limites = self._queues_et_limites(ordre)
+        echeances = np.atleast_1d(np.asarray(echeances, dtype=float))
+
+        queues = np.array([queues[tache] for tache in ordre], dtype=float)
+        limites = np.array([limites[tache] for tache in ordre], dtype=float)
+        durees = np.array([self.graphe.nodes[t]["duree"] for t in ordre], dtype=float)
+        debuts = np.array([self.dates_tot[t]["ES"] for t in ordre], dtype=float)
+
+        lf = np.minimum(echeances[None, :] - queues[:, None], limites[:, None])
+        ls = lf - durees[:, None]
+
+        return {"taches": ordre, "LS": ls, "marges": ls - debuts[:, None]}
+
+    def echeances_depassees(self) -> dict[str, int]:
+        """
+        Retourne les taches dont l'echeance n'est pas tenue au plus tot
+
+        Returns:
+            Dictionnaire {code_tache: retard} (EF - echeance > 0)
+        """
+        return {
+            tache: self.dates_tot[tache]["EF"] - self.graphe.nodes[tache]["echeance"]
+            for tache in self._taches_avec_echeance()
+            if self.dates_tot[tache]["EF"] > self.graphe.nodes[tache]["echeance"]
+        }
+
+    def recalculer_dates_au_plus_tard(
+        self, taches, duree_totale_precedente: int | None = None
+    ) -> set[str]:
+        """
+        Recalcule LS/LF des taches donnees et de leurs ancetres uniquement
+
+        LF = duree_totale - (plus longue queue apres la tache): si la duree totale
+        a change, toutes les dates au plus tard sont d'abord decalees d'autant,
+        puis seuls les ancetres des taches donnees sont recalcules.
+
+        Args:
+            taches: Taches dont la duree ou les successeurs ont change
+            duree_totale_precedente: Duree totale avec laquelle les dates au plus
+                tard actuelles ont ete calculees (par defaut: inchangee)
+
+        Returns:
+            Ensemble des taches dont les dates au plus tard ont change
+            (en plus du decalage global)
+        """
+        with self._verrou_ecriture:
+            # Copie sur ecriture, comme recalculer_dates_au_plus_tot
+            dates_tard = dict(self.dates_tard)
+            self.dates_tard = dates_tard
+
+            if duree_totale_precedente is not None:
+                decalage = self.duree_totale - duree_totale_precedente
+                if decalage and self._taches_avec_echeance():
+                    # Les dates bornees par une echeance ne suivent pas la
+                    # duree totale: pas de decalage global possible
+                    self.calculer_dates_au_plus_tard()
+                    return set(self.graphe.nodes())
+                if decalage:
+                    for tache, dates in dates_tard.items():
+                        dates_tard[tache] = {
+                            "LS": dates["LS"] + decalage,
+                            "LF": dates["LF"] + decalage,
+                        }
+
+            taches = set(taches)
+            modifiees = set()
+
+            for tache in self._zone_affectee(taches, self.graphe.predecessors):
+                if tache not in taches and modifiees.isdisjoint(
+                    self.graphe.successors(tache)
+                ):
+                    continue
+
+                dates = self._calculer_dates_tard_tache(tache)
+                if dates != dates_tard.get(tache):
+                    dates_tard[tache] = dates
+                    modifiees.add(tache)
+
+        return modifiees
 
     def calculer_marges(self) -> dict[str, int]:
         """
@@ -93,8 +439,49 @@ class CalculateurPERT:
             marge = self.dates_tard[tache]["LS"] - self.dates_tot[tache]["ES"]
             self.marges[tache] = marge
 
+        # 0 sans echeance; negative quand un jalon est intenable
+        self.marge_critique = min(self.marges.values(), default=0)
+
         return self.marges
 
+    def est_critique(self, tache: str) -> bool:
+        """
+        Indique si une tache est critique: sa marge est la plus petite marge
+        du projet (0 sans echeance, negative si un jalon est intenable)
+        """
+        return self.marges[tache] == self.marge_critique
+
+    def est_arc_critique(self, pred: str, succ: str) -> bool:
+        """
+        Indique si l'arc pred -> succ est sur un chemin critique: les deux
+        taches sont critiques et la relation impose la date de succ
+        """
+        return (
+            self.est_critique(pred)
+            and self.est_critique(succ)
+            and self.dates_tot[pred]["EF"] + self._poids_arc(pred, succ)
+            == self.dates_tot[succ]["EF"]
+        )
+
+    def _calculer_marge_libre_tache(self, tache: str) -> int:
+        """
+        Calcule la marge libre d'une tache (dates et marge totale a jour)
+        """
+        successeurs = list(self.graphe.successors(tache))
+
+        if not successeurs:
+            # Tache finale: FF = TF (pas de successeurs a retarder)
+            return self.marges[tache]
+
+        # FF = min des ES des successeurs - EF de cette tache
+        # (generalise aux relations typees via le poids des arcs)
+        return min(
+            self.dates_tot[succ]["EF"]
+            - self._poids_arc(tache, succ)
+            - self.dates_tot[tache]["EF"]
+            for succ in successeurs
+        )
+
     def calculer_marges_libres(self) -> dict[str, int]:
         """
         Calcule la marge libre pour chaque tache
@@ -104,38 +491,34 @@ class CalculateurPERT:
             Dictionnaire {code_tache: marge_libre}
         """
         for tache in self.graphe.nodes():
-            successeurs = list(self.graphe.successors(tache))
-
-            if not successeurs:
-                # Tache finale: FF = TF (pas de successeurs a retarder)
-                ff = self.marges[tache]
-            else:
-                # FF = min des ES des successeurs - EF de cette tache
-                min_es_successeurs = min(
-                    self.dates_tot[succ]["ES"] for succ in successeurs
-                )
-                ff = min_es_successeurs - self.dates_tot[tache]["EF"]
-
-            self.marges_libres[tache] = ff
+            self.marges_libres[tache] = self._calculer_marge_libre_tache(tache)
 
         return self.marges_libres
 
     def identifier_chemin_critique(self) -> list[str]:
         """
-        Identifie le chemin critique (taches avec marge = 0)
+        Identifie le chemin critique (taches de marge minimale)
+
+        Sans echeance la marge critique est 0; avec un jalon intenable, c'est
+        la marge negative de la chaine qui le depasse le plus.
 
         Returns:
             Liste ordonnee des taches du chemin critique
         """
-        # Taches critiques sont celles avec marge = 0
-        taches_critiques = [tache for tache, marge in self.marges.items() if marge == 0]
+        taches_critiques = [tache for tache in self.marges if self.est_critique(tache)]
 
         # Construire le sous-graphe des taches critiques
         sous_graphe = self.graphe.subgraph(taches_critiques)
 
         # Trouver un chemin du debut a la fin
         taches_initiales = self.graphe_pert.obtenir_taches_initiales()
+        # Une chaine critique peut s'arreter sur un jalon (tache avec echeance)
         taches_finales = self.graphe_pert.obtenir_taches_finales()
+        taches_finales += [
+            tache
+            for tache in self._taches_avec_echeance()
+            if tache not in taches_finales
+        ]
 
         for debut in taches_initiales:
             for fin in taches_finales:
@@ -150,27 +533,802 @@ class CalculateurPERT:
 
         return []
 
+    def identifier_chemins_quasi_critiques(self, k: int = 10) -> list[dict]:
+        """
+        Enumere les k plus longs chemins debut -> fin par duree decroissante
+
+        Enumeration par deviations (sidetracks) a la Eppstein: chaque tache suit
+        par defaut son meilleur successeur, et les deviations possibles le long
+        d'un chemin glouton sont rangees dans des tas gauches persistants
+        partages entre chemins. Chaque chemin extrait ne pousse qu'un nombre
+        constant de candidats dans le tas principal.
+
+        Args:
+            k: Nombre de chemins a retourner
+
+        Returns:
+            Liste de dictionnaires {'chemin': [...], 'duree': val, 'marge': val}
+            ou la marge est relative a la duree totale du projet
+        """
+        if not self.dates_tot:
+            self.calculer_dates_au_plus_tot()
+
+        durees = dict(self.graphe.nodes(data="duree"))
+
+        # Plus longue queue depuis la fin de chaque tache jusqu'a une tache
+        # finale, et meilleur successeur (celui qui realise cette queue)
+        queues = {}
+        valeurs = {}
+        meilleurs = {}
+        profondeurs = {}
+        for tache in reversed(list(nx.topological_sort(self.graphe))):
+            valeurs[tache] = [
+                (
+                    poids_relation(
+                        arc.get("type", "FS"),
+                        arc.get("decalage", 0),
+                        durees[tache],
+                        durees[succ],
+                    )
+                    + queues[succ],
+                    succ,
+                )
+                for succ, arc in self.graphe.succ[tache].items()
+            ]
+            if valeurs[tache]:
+                queue, meilleur = max(valeurs[tache], key=lambda option: option[0])
+                meilleurs[tache] = meilleur
+                profondeurs[tache] = profondeurs[meilleur] + 1
+            else:
+                queue = 0
+                meilleurs[tache] = None
+                profondeurs[tache] = 0
+            queues[tache] = queue
+
+        # Choix tries par ecart croissant a la queue (calcules a la demande).
+        # Le tri stable garde le meilleur successeur en tete en cas d'egalite.
+        choix = {}
+
+        def options(tache):
+            if tache not in choix:
+                choix[tache] = sorted(
+                    ((queues[tache] - valeur, succ) for valeur, succ in valeurs[tache]),
+                    key=lambda option: option[0],
+                )
+            return choix[tache]
+
+        # La racine virtuelle (None) a pour choix les taches initiales
+        debuts = sorted(
+            (
+                (durees[t] + queues[t], t)
+                for t in self.graphe.nodes()
+                if self.graphe.in_degree(t) == 0
+            ),
+            key=lambda option: -option[0],
+        )
+        if not debuts or k <= 0:
+            return []
+        choix[None] = [(debuts[0][0] - valeur, t) for valeur, t in debuts]
+
+        # Tas persistant des deviations disponibles sur le chemin glouton
+        # partant de chaque tache (construit a la demande)
+        tas_suffixes = {None: None}
+
+        def tas_suffixe(tache):
+            pile = []
+            while tache not in tas_suffixes:
+                pile.append(tache)
+                tache = meilleurs[tache]
+            tas = tas_suffixes[tache]
+            for noeud in reversed(pile):
+                if len(valeurs[noeud]) > 1:
+                    tas = _fusionner_tas(
+                        tas, (options(noeud)[1][0], 1, noeud, None, None)
+                    )
+                tas_suffixes[noeud] = tas
+            return tas
+
+        chemins = []
+        compteur = count()
+        # Candidats: (-duree, ordre, parent, position, noeud du tas, indice du choix)
+        # - parent/position: chemin parent et position du debut de sa partie
+        #   gloutonne dans laquelle se trouve la deviation
+        # - noeud du tas: deviation (None pour le choix de la tache initiale)
+        candidats = [(-debuts[0][0], next(compteur), -1, -1, None, 0)]
+
+        while candidats and len(chemins) < k:
+            neg_duree, _, parent, position, noeud_tas, indice = heapq.heappop(candidats)
+            duree = -neg_duree
+
+            # Reconstruire le chemin: prefixe du parent, deviation, puis glouton
+            if noeud_tas is None:
+                deviation, prefixe = None, []
+            else:
+                deviation = noeud_tas[2]
+                chemin_parent = chemins[parent]["chemin"]
+                debut_glouton = chemin_parent[position]
+                position_deviation = (
+                    position + profondeurs[debut_glouton] - profondeurs[deviation]
+                )
+                prefixe = chemin_parent[: position_deviation + 1]
+
+            ecart, suivant = options(deviation)[indice]
+            chemin = prefixe + [suivant]
+            while meilleurs[chemin[-1]] is not None:
+                chemin.append(meilleurs[chemin[-1]])
+
+            chemins.append(
+                {"chemin": chemin, "duree": duree, "marge": self.duree_totale - duree}
+            )
+
+            # Choix suivant a la meme deviation
+            if indice + 1 < len(options(deviation)):
+                heapq.heappush(
+                    candidats,
+                    (
+                        -(duree + ecart - options(deviation)[indice + 1][0]),
+                        next(compteur),
+                        parent,
+                        position,
+                        noeud_tas,
+                        indice + 1,
+                    ),
+                )
+
+            # Autres deviations du meme tas (enfants dans le tas gauche)
+            if noeud_tas is not None and indice == 1:
+                for enfant in noeud_tas[3:]:
+                    if enfant is not None:
+                        heapq.heappush(
+                            candidats,
+                            (
+                                -(duree + ecart - enfant[0]),
+                                next(compteur),
+                                parent,
+                                position,
+                                enfant,
+                                1,
+                            ),
+                        )
+
+            # Premiere deviation sur la nouvelle partie gloutonne
+            tas = tas_suffixe(suivant)
+            if tas is not None:
+                heapq.heappush(
+                    candidats,
+                    (
+                        -(duree - tas[0]),
+                        next(compteur),
+                        len(chemins) - 1,
+                        len(prefixe),
+                        tas,
+                        1,
+                    ),
+                )
+
+        return chemins
+
+    def calculer_drag(self) -> dict[str, int]:
+        """
+        Calcule le drag de chaque tache: reduction de la duree totale obtenue
+        si la tache durait zero (0 pour les taches non critiques)
+
+        drag = min(duree, duree_totale - plus long chemin evitant la tache).
+        Le plus long chemin evitant une tache se deduit des resultats des passes
+        avant/arriere en un seul balayage de l'ordre topologique: un tel chemin
+        se termine avant la tache, commence apres elle, ou l'enjambe par un arc
+        (u, v) de longueur EF(u) + poids(u, v) + queue(v). Les arcs qui
+        enjambent la position courante sont gardes dans un tas.
+
+        Le calcul suppose que toute la duree de la tache est sur les chemins
+        qui la traversent (relations FS); avec des relations SS/SF le drag
+        obtenu est une borne superieure.
+
+        La duree totale etant le plus long chemin, les echeances n'y jouent
+        aucun role: les queues sont calculees sans elles (avec un jalon,
+        duree_totale - LF ne serait plus une queue).
+
+        Returns:
+            Dictionnaire {code_tache: drag}
+        """
+        ordre = list(nx.topological_sort(self.graphe))
+        position = {tache: i for i, tache in enumerate(ordre)}
+        durees = [self.graphe.nodes[tache]["duree"] for tache in ordre]
+
+        # Plus longue contrainte apres la fin de chaque tache
+        queues_par_tache, _ = self._queues_et_limites(ordre, echeances=False)
+        queues = [queues_par_tache[tache] for tache in ordre]
+
+        # Meilleur chemin commencant strictement apres chaque position
+        apres = [float("-inf")] * (len(ordre) + 1)
+        for i in range(len(ordre) - 1, -1, -1):
+            apres[i] = max(apres[i + 1], durees[i] + queues[i])
+
+        drag = {}
+        avant = float("-inf")
+        enjambants = []
+
+        for i, tache in enumerate(ordre):
+            # Retirer les arcs qui se terminent au plus tard ici
+            while enjambants and enjambants[0][1] <= i:
+                heapq.heappop(enjambants)
+
+            # Seules les taches du plus long chemin ont un drag
+            ef = self.dates_tot[tache]["EF"]
+            if ef + queues[i] == self.duree_totale:
+                sans_tache = max(
+                    avant,
+                    apres[i + 1],
+                    -enjambants[0][0] if enjambants else float("-inf"),
+                )
+                drag[tache] = int(
+                    max(0, min(durees[i], self.duree_totale - sans_tache))
+                )
+            else:
+                drag[tache] = 0
+
+            avant = max(avant, ef)
+            for succ in self.graphe.successors(tache):
+                longueur = ef + self._poids_arc(tache, succ) + queues[position[succ]]
+                heapq.heappush(enjambants, (-longueur, position[succ]))
+
+        return drag
+
+    def calculer_sensibilites(self) -> dict[str, dict]:
+        """
+        Calcule de combien chaque duree peut varier sans changer le chemin critique
+
+        - Tache du plus long chemin: reduction possible = drag (au-dela, un
+          autre chemin devient critique), allongement illimite (None).
+        - Autre tache: reduction jusqu'a zero, allongement jusqu'a ce qu'elle
+          allonge la duree totale ou devienne critique. Sans echeance, c'est
+          la marge totale.
+
+        Returns:
+            Dictionnaire {code_tache: {'reduction_max': val, 'allongement_max': val}}
+        """
+        drag = self.calculer_drag()
+        ordre = list(nx.topological_sort(self.graphe))
+        queues, _ = self._queues_et_limites(ordre, echeances=False)
+        sensibilites = {}
+
+        for tache in ordre:
+            reserve = self.duree_totale - self.dates_tot[tache]["EF"] - queues[tache]
+            if reserve == 0:
+                sensibilites[tache] = {
+                    "reduction_max": drag[tache],
+                    "allongement_max": None,
+                }
+            else:
+                sensibilites[tache] = {
+                    "reduction_max": self.graphe.nodes[tache]["duree"],
+                    "allongement_max": min(
+                        reserve, self.marges[tache] - self.marge_critique
+                    ),
+                }
+
+        return sensibilites
+
+    def _initialiser_suivi(self):
+        """
+        Prepare le suivi en direct: positions topologiques, queues et tas des EF
+
+        Les dates au plus tard sont gardees sous la forme LF = min(T - Q, L)
+        (voir _queues_et_limites): Q et L ne dependent pas de la duree totale T.
+        """
+        if not self.dates_tot:
+            self.calculer_dates_au_plus_tot()
+
+        ordre = list(nx.topological_sort(self.graphe))
+        queues, limites = self._queues_et_limites(ordre)
+
+        tas_fins = [(-self.dates_tot[tache]["EF"], tache) for tache in ordre]
+        heapq.heapify(tas_fins)
+        tas_debuts = [(self.dates_tot[tache]["ES"], tache) for tache in ordre]
+        heapq.heapify(tas_debuts)
+
+        self._suivi = {
+            "position": {tache: i for i, tache in enumerate(ordre)},
+            "queues": queues,
+            "limites": limites,
+            "tas_fins": tas_fins,
+            "tas_debuts": tas_debuts,
+        }
+
+    def _avancer_horloge(self, instant: int) -> list[str]:
+        """
+        Avance l'instant courant au dernier evenement signale
+
+        Returns:
+            Taches non demarrees dont le debut prevu est maintenant depasse
+            (entrees perimees du tas des ES supprimees paresseusement)
+        """
+        if self._suivi is None:
+            self._initialiser_suivi()
+        if instant <= self.maintenant:
+            return []
+        self.maintenant = instant
+
+        tas_debuts = self._suivi["tas_debuts"]
+        en_retard = []
+        while tas_debuts and tas_debuts[0][0] < instant:
+            es, tache = heapq.heappop(tas_debuts)
+            avancement = self.avancement.get(tache)
+            demarree = avancement is not None and avancement["debut"] is not None
+            if not demarree and self.dates_tot[tache]["ES"] == es:
+                en_retard.append(tache)
+
+        return en_retard
+
+    def _propager_avancement(self, tache: str, instant: int) -> int:
+        """
+        Propage le changement de dates d'une tache a ses descendants
+
+        Les taches non demarrees dont le debut prevu precede l'instant de
+        l'evenement sont decalees a cet instant. Les taches sont traitees dans
+        l'ordre topologique via un tas; la propagation s'arrete aux taches dont
+        les dates ne changent pas.
+
+        Comme executer_analyse_complete, les dates sont ecrites dans de
+        nouveaux dictionnaires et un instantane est publie, sous le verrou
+        d'ecriture.
+
+        Returns:
+            Duree totale prevue
+        """
+        with self._verrou_ecriture:
+            taches = [tache, *self._avancer_horloge(instant)]
+            position = self._suivi["position"]
+            tas_fins = self._suivi["tas_fins"]
+            tas_debuts = self._suivi["tas_debuts"]
+            dates_tot = dict(self.dates_tot)
+            self.dates_tot = dates_tot
+
+            a_traiter = [(position[t], t) for t in taches]
+            heapq.heapify(a_traiter)
+            en_attente = set(taches)
+            while a_traiter:
+                _, courante = heapq.heappop(a_traiter)
+                en_attente.discard(courante)
+
+                dates = self._calculer_dates_tot_tache(courante)
+                if dates == dates_tot.get(courante):
+                    continue
+                dates_tot[courante] = dates
+                heapq.heappush(tas_fins, (-dates["EF"], courante))
+                heapq.heappush(tas_debuts, (dates["ES"], courante))
+
+                for succ in self.graphe.successors(courante):
+                    if succ not in en_attente:
+                        en_attente.add(succ)
+                        heapq.heappush(a_traiter, (position[succ], succ))
+
+            duree_totale = self._duree_totale_prevue()
+            self._completer_prevision()
+
+        return duree_totale
+
+    def _completer_prevision(self):
+        """
+        Recalcule dates au plus tard, marges et chemin critique de la prevision
+        courante et publie l'instantane (appele sous le verrou d'ecriture)
+
+        Les dates au plus tard se deduisent des queues et limites du suivi,
+        LF = min(T - Q, L), sans nouveau tri topologique.
+        """
+        queues = self._suivi["queues"]
+        limites = self._suivi["limites"]
+        dates_tard = {}
+        for tache, duree in self.graphe.nodes(data="duree"):
+            lf = min(self.duree_totale - queues[tache], limites[tache])
+            dates_tard[tache] = {"LS": lf - duree, "LF": lf}
+
+        self.dates_tard = dates_tard
+        self.marges = {}
+        self.marges_libres = {}
+        self.chemin_critique = []
+        self.calculer_marges()
+        self.calculer_marges_libres()
+        self.identifier_chemin_critique()
+        self._publier_instantane()
+
+    def _duree_totale_prevue(self) -> int:
+        """
+        Met a jour la duree totale depuis le tas des EF (entrees perimees
+        supprimees paresseusement)
+        """
+        tas_fins = self._suivi["tas_fins"]
+        while -tas_fins[0][0] != self.dates_tot[tas_fins[0][1]]["EF"]:
+            heapq.heappop(tas_fins)
+        self.duree_totale = -tas_fins[0][0]
+
+        return self.duree_totale
+
+    def _avancement_tache(self, tache: str) -> dict:
+        if tache not in self.graphe:
+            raise ValueError(f"Tache inconnue: {tache}")
+        return self.avancement.setdefault(
+            tache, {"debut": None, "fin": None, "ecoule": 0}
+        )
+
+    def signaler_debut(self, tache: str, instant: int) -> int:
+        """
+        Enregistre le demarrage reel d'une tache et met a jour la prevision
+
+        Args:
+            tache: Code de la tache demarree
+            instant: Instant reel de demarrage
+
+        Returns:
+            Duree totale prevue
+        """
+        self._avancement_tache(tache)["debut"] = instant
+        return self._propager_avancement(tache, instant)
+
+    def signaler_progression(self, tache: str, instant: int, ecoule: int) -> int:
+        """
+        Enregistre qu'une tache est toujours en cours apres `ecoule` unites
+
+        La fin prevue est debut + max(duree, ecoule): une tache qui depasse sa
+        duree estimee est supposee se terminer immediatement.
+
+        Args:
+            tache: Code de la tache en cours
+            instant: Instant de l'observation
+            ecoule: Temps ecoule depuis le demarrage
+
+        Returns:
+            Duree totale prevue
+        """
+        avancement = self._avancement_tache(tache)
+        if avancement["debut"] is None:
+            avancement["debut"] = instant - ecoule
+        avancement["ecoule"] = ecoule
+        return self._propager_avancement(tache, instant)
+
+    def signaler_fin(self, tache: str, instant: int) -> int:
+        """
+        Enregistre la fin reelle d'une tache et met a jour la prevision
+
+        Args:
+            tache: Code de la tache terminee
+            instant: Instant reel de fin
+
+        Returns:
+            Duree totale prevue
+        """
+        avancement = self._avancement_tache(tache)
+        if avancement["debut"] is None:
+            avancement["debut"] = instant - self.graphe.nodes[tache]["duree"]
+        avancement["fin"] = instant
+        return self._propager_avancement(tache, instant)
+
+    def marge_prevue(self, tache: str) -> int:
+        """
+        Marge totale d'une tache selon la prevision courante
+
+        Marge = min(duree_totale - Q, L) - EF, ou Q et L sont la queue et la
+        limite imposee par les echeances apres la tache (calculees avec les
+        durees estimees des taches restantes). Negative si une echeance ne
+        peut plus etre tenue.
+        """
+        if self._suivi is None:
+            self._initialiser_suivi()
+        lf = min(
+            self.duree_totale - self._suivi["queues"][tache],
+            self._suivi["limites"][tache],
+        )
+        return lf - self.dates_tot[tache]["EF"]
+
+    def chemin_critique_restant(self) -> list[str]:
+        """
+        Chemin critique restant selon la prevision courante
+
+        Remonte depuis la tache qui finit le plus tard en suivant les
+        predecesseurs qui imposent sa date; s'arrete aux taches deja
+        demarrees. Les taches terminees sont exclues.
+
+        Returns:
+            Liste ordonnee des taches non terminees du chemin critique
+        """
+        if self._suivi is None:
+            self._initialiser_suivi()
+        self._duree_totale_prevue()
+
+        tache = self._suivi["tas_fins"][0][1]
+        chemin = []
+        while tache is not None:
+            avancement = self.avancement.get(tache)
+            if avancement is not None and avancement["fin"] is not None:
+                break
+            chemin.append(tache)
+            if avancement is not None:
+                break
+
+            ef = self.dates_tot[tache]["EF"]
+            tache = next(
+                (
+                    pred
+                    for pred in self.graphe.predecessors(tache)
+                    if self.dates_tot[pred]["EF"] + self._poids_arc(pred, tache) == ef
+                ),
+                None,
+            )
+
+        return list(reversed(chemin))
+
+    def _loi_duree(self, tache: str) -> tuple[float, float]:
+        """
+        Moyenne et variance de la duree d'une tache
+
+        Estimation trois points: moyenne (a + 4m + b) / 6, variance ((b - a) / 6)^2.
+        Sans estimation, la duree est consideree certaine.
+        """
+        noeud = self.graphe.nodes[tache]
+        if "probable" not in noeud:
+            return float(noeud["duree"]), 0.0
+
+        optimiste, probable, pessimiste = (
+            noeud["optimiste"],
+            noeud["probable"],
+            noeud["pessimiste"],
+        )
+        return (
+            (optimiste + 4 * probable + pessimiste) / 6,
+            ((pessimiste - optimiste) / 6) ** 2,
+        )
+
+    def calculer_distributions(self) -> dict[str, dict[str, float]]:
+        """
+        Propage la loi (normale) de la date de fin de chaque tache
+
+        Un seul parcours topologique en O(V + E): la date de debut d'une tache
+        est le max (approximation de Clark) des contraintes de ses predecesseurs
+        et de zero, les lois etant supposees independantes. Les relations
+        autres que FS sont decalees avec les durees moyennes. La loi de la
+        duree totale est le max des fins des taches finales.
+
+        Returns:
+            Dictionnaire {code_tache: {'moyenne': val, 'variance': val}}
+            (la loi de la duree totale est dans self.distribution_fin)
+        """
+        lois = {tache: self._loi_duree(tache) for tache in self.graphe.nodes()}
+        self.distributions = {}
+
+        for tache in nx.topological_sort(self.graphe):
+            moyenne_duree, variance_duree = lois[tache]
+            moyenne, variance = None, 0.0
+            plancher = False
+            for pred, arc in self.graphe.pred[tache].items():
+                # Debut impose par la relation: EF(pred) + poids - duree(tache)
+                decalage = (
+                    poids_relation(
+                        arc.get("type", "FS"),
+                        arc.get("decalage", 0),
+                        lois[pred][0],
+                        moyenne_duree,
+                    )
+                    - moyenne_duree
+                )
+                fin_pred = self.distributions[pred]
+                plancher = plancher or decalage < 0
+                if moyenne is None:
+                    moyenne, variance = (
+                        fin_pred["moyenne"] + decalage,
+                        fin_pred["variance"],
+                    )
+                else:
+                    moyenne, variance = _max_clark(
+                        moyenne,
+                        variance,
+                        fin_pred["moyenne"] + decalage,
+                        fin_pred["variance"],
+                    )
+
+            # Debut >= 0: seul un decalage negatif peut rendre ce plancher actif
+            if moyenne is None:
+                moyenne = 0.0
+            elif plancher:
+                moyenne, variance = _max_clark(moyenne, variance, 0.0, 0.0)
+
+            self.distributions[tache] = {
+                "moyenne": moyenne + moyenne_duree,
+                "variance": variance + variance_duree,
+            }
+
+        moyenne, variance = None, 0.0
+        for tache in self.graphe_pert.obtenir_taches_finales():
+            fin = self.distributions[tache]
+            if moyenne is None:
+                moyenne, variance = fin["moyenne"], fin["variance"]
+            else:
+                moyenne, variance = _max_clark(
+                    moyenne, variance, fin["moyenne"], fin["variance"]
+                )
+        self.distribution_fin = {"moyenne": moyenne, "variance": variance}
+
+        return self.distributions
+
+    def probabilites_echeances(self, echeances) -> np.ndarray:
+        """
+        Probabilite de terminer le pipeline avant chaque echeance
+
+        Args:
+            echeances: Une echeance ou une liste d'echeances (minutes)
+
+        Returns:
+            Tableau numpy des probabilites P(fin <= echeance)
+        """
+        if not self.distribution_fin:
+            self.calculer_distributions()
+
+        echeances = np.atleast_1d(np.asarray(echeances, dtype=float))
+        moyenne = self.distribution_fin["moyenne"]
+        ecart_type = math.sqrt(self.distribution_fin["variance"])
+
+        if ecart_type == 0:
+            return (echeances >= moyenne).astype(float)
+
+        z = (echeances - moyenne) / (ecart_type * math.sqrt(2))
+        return 0.5 * (1 + np.vectorize(math.erf)(z))
+
+    def _propager_tirages(self, ordre, durees, fins, nb_tirages: int):
+        """
+        Passe avant vectorisee sur des tirages de durees
+
+        durees[t] est un scalaire (duree certaine) ou un tableau d'un element
+        par tirage; fins[t] recoit le tableau des EF de t. Seules les taches de
+        ordre sont calculees, les autres sont lues dans fins.
+        """
+        for tache in ordre:
+            duree = durees[tache]
+            fin = np.zeros(nb_tirages) + duree
+            for pred, arc in self.graphe.pred[tache].items():
+                np.maximum(
+                    fin,
+                    fins[pred]
+                    + poids_relation(
+                        arc.get("type", "FS"),
+                        arc.get("decalage", 0),
+                        durees[pred],
+                        duree,
+                    ),
+                    out=fin,
+                )
+            fins[tache] = fin
+
+    def analyser_relances(
+        self, nb_tirages: int = 2000, centiles=(50, 90, 99), graine=None
+    ) -> dict:
+        """
+        Duree totale attendue avec les relances automatiques des jobs instables
+
+        Chaque tentative d'un job instable (attribut proba_echec) echoue avec
+        cette probabilite et le job est relance au plus max_relances fois; sa
+        duree est le nombre de tentatives fois sa duree. Les tirages sont
+        traites ensemble: une passe avant vectorisee par tache, en O((V + E) x
+        nb_tirages). Un run dont toutes les tentatives echouent compte pour la
+        duree de ses tentatives.
+
+        La contribution d'un job instable est la reduction moyenne de la duree
+        totale si on ne le relancait jamais, mesuree sur les memes tirages et
+        en ne recalculant que ses descendants.
+
+        Args:
+            nb_tirages: Nombre de tirages Monte Carlo
+            centiles: Centiles de la duree totale a rapporter
+            graine: Graine du generateur aleatoire (resultats reproductibles)
+
+        Returns:
+            Dictionnaire {'duree_esperee', 'centiles', 'proba_echec',
+            'surcouts', 'contributions', 'durees_totales'} ou surcouts est la
+            duree moyenne ajoutee a chaque job instable par ses relances
+            (valeur exacte) et contributions est trie par ordre decroissant
+        """
+        generateur = np.random.default_rng(graine)
+        ordre = list(nx.topological_sort(self.graphe))
+        position = {tache: i for i, tache in enumerate(ordre)}
+        durees = {tache: self.graphe.nodes[tache]["duree"] for tache in ordre}
+        instables = [
+            tache for tache in ordre if self.graphe.nodes[tache].get("proba_echec", 0)
+        ]
+
+        proba_succes = 1.0
+        surcouts = {}
+        for tache in instables:
+            noeud = self.graphe.nodes[tache]
+            proba_echec, tentatives_max = (
+                noeud["proba_echec"],
+                noeud["max_relances"] + 1,
+            )
+            tentatives = generateur.geometric(1 - proba_echec, nb_tirages)
+            durees[tache] = np.minimum(tentatives, tentatives_max) * noeud["duree"]
+
+            # Esperance d'une loi geometrique tronquee a tentatives_max
+            proba_abandon = proba_echec**tentatives_max
+            proba_succes *= 1 - proba_abandon
+            surcouts[tache] = noeud["duree"] * (
+                (1 - proba_abandon) / (1 - proba_echec) - 1
+            )
+
+        fins = {}
+        self._propager_tirages(ordre, durees, fins, nb_tirages)
+        durees_totales = np.zeros(nb_tirages)
+        for fin in fins.values():
+            np.maximum(durees_totales, fin, out=durees_totales)
+
+        contributions = {}
+        for tache in instables:
+            descendants = nx.descendants(self.graphe, tache)
+            descendants.add(tache)
+            sans_relance = np.zeros(nb_tirages)
+            for autre, fin in fins.items():
+                if autre not in descendants:
+                    np.maximum(sans_relance, fin, out=sans_relance)
+
+            fins_sans = ChainMap({}, fins)
+            self._propager_tirages(
+                sorted(descendants, key=position.__getitem__),
+                ChainMap({tache: self.graphe.nodes[tache]["duree"]}, durees),
+                fins_sans,
+                nb_tirages,
+            )
+            for fin in fins_sans.maps[0].values():
+                np.maximum(sans_relance, fin, out=sans_relance)
+            contributions[tache] = float((durees_totales - sans_relance).mean())
+
+        valeurs_centiles = np.percentile(durees_totales, centiles) if centiles else []
+        return {
+            "duree_esperee": float(durees_totales.mean()),
+            "centiles": {
+                centile: float(valeur)
+                for centile, valeur in zip(centiles, valeurs_centiles)
+            },
+            "proba_echec": 1 - proba_succes,
+            "surcouts": surcouts,
+            "contributions": dict(
+                sorted(contributions.items(), key=lambda item: -item[1])
+            ),
+            "durees_totales": durees_totales,
+        }
+
     def executer_analyse_complete(self) -> dict:
         """
         Execute l'analyse PERT complete
 
+        Les resultats sont calcules dans de nouveaux dictionnaires (ceux d'une
+        analyse precedente ne sont pas modifies), puis publies dans
+        self.instantane, un InstantaneAnalyse fige: les lecteurs d'autres
+        threads lisent toujours un instantane complet et coherent, sans verrou.
+        Les ecritures concurrentes sont serialisees.
+
         Returns:
             Dictionnaire avec tous les resultats
         """
-        # Etape 1: Dates au plus tot
-        self.calculer_dates_au_plus_tot()
+        with self._verrou_ecriture:
+            self.dates_tot = {}
+            self.dates_tard = {}
+            self.marges = {}
+            self.marges_libres = {}
+            self.chemin_critique = []
 
-        # Etape 2: Dates au plus tard
-        self.calculer_dates_au_plus_tard()
+            # Etape 1: Dates au plus tot
+            self.calculer_dates_au_plus_tot()
 
-        # Etape 3: Marges Totales
-        self.calculer_marges()
+            # Etape 2: Dates au plus tard
+            self.calculer_dates_au_plus_tard()
 
-        # Etape 4: Marges Libres
-        self.calculer_marges_libres()
+            # Etape 3: Marges Totales
+            self.calculer_marges()
 
-        # Etape 5: Chemin critique
-        self.identifier_chemin_critique()
+            # Etape 4: Marges Libres
+            self.calculer_marges_libres()
+
+            # Etape 5: Chemin critique
+            self.identifier_chemin_critique()
+
+            # Etape 6: Publication atomique (reaffectation d'une reference)
+            self._publier_instantane()
 
         return {
             "duree_totale": self.duree_totale,
@@ -181,6 +1339,38 @@ class CalculateurPERT:
             "chemin_critique": self.chemin_critique,
         }
 
+    def _publier_instantane(self):
+        """
+        Fige les resultats courants dans un nouvel instantane (appele sous le
+        verrou d'ecriture): la reaffectation de la reference est atomique
+        """
+        self.instantane = InstantaneAnalyse.depuis_calculateur(
+            self, next(self._versions)
+        )
+
+    def obtenir_instantane(self) -> InstantaneAnalyse:
+        """
+        Retourne le dernier instantane publie, en executant l'analyse si aucun
+        n'existe encore
+        """
+        instantane = self.instantane
+        if instantane is None:
+            self.executer_analyse_complete()
+            instantane = self.instantane
+        return instantane
+
+    def obtenir_requetes(self) -> RequetesPlanning:
+        """
+        Retourne l'index de requetes du dernier instantane, construit une seule
+        fois par analyse (reconstruit quand un nouvel instantane est publie)
+        """
+        instantane = self.obtenir_instantane()
+        requetes = self._requetes
+        if requetes is None or requetes.instantane is not instantane:
+            requetes = RequetesPlanning(instantane)
+            self._requetes = requetes
+        return requetes
+
     def generer_tableau_resultats(self) -> list[dict]:
         """
         Genere un tableau des resultats
@@ -203,7 +1393,7 @@ class CalculateurPERT:
                 "LF": self.dates_tard[tache]["LF"],
                 "Marge": self.marges[tache],
                 "Marge_Libre": self.marges_libres[tache],
-                "Critique": "Oui" if self.marges[tache] == 0 else "Non",
+                "Critique": "Oui" if self.est_critique(tache) else "Non",
             }
 
             resultats.append(ligne)
@@ -218,6 +1408,13 @@ class CalculateurPERT:
         print(f"Chemin critique: {' -> '.join(self.chemin_critique)}")
         print(f"Nombre de taches critiques: {len(self.chemin_critique)}")
 
+        depassements = self.echeances_depassees()
+        if depassements:
+            print("\nEcheances depassees:")
+            for tache, retard in depassements.items():
+                echeance = self.graphe.nodes[tache]["echeance"]
+                print(f"  {tache}: echeance {echeance}, retard de {retard} minutes")
+
         print("\nTaches non-critiques (avec marge):")
         for tache, marge in self.marges.items():
             if marge > 0:
@@ -0,0 +1,225 @@
+import numpy as np
+
+# Champs interrogeables de l'instantane (memes cles que dates_tache)
+CHAMPS = {
+    "ES": "es",
+    "EF": "ef",
+    "LS": "ls",
+    "LF": "lf",
+    "marge": "marges",
+    "marge_libre": "marges_libres",
+}
+
+# Intervalles d'execution: plan au plus tot [ES, EF) ou au plus tard [LS, LF)
+PLANS = {"tot": ("es", "ef"), "tard": ("ls", "lf")}
+
+
+class _ArbreIntervalles:
+    """
+    Arbre d'intervalles centre, statique, sur des intervalles [debut, fin)
+
+    Chaque noeud garde les intervalles qui contiennent son centre, tries par
+    debut et par fin: une requete descend une branche et prend a chaque
+    noeud une tranche trouvee par recherche dichotomique, en O(log^2 n + k).
+    Les intervalles vides (taches de duree nulle) ne sont jamais actifs.
+    """
+
+    def __init__(self, debuts: np.ndarray, fins: np.ndarray):
+        self.noeuds = []
+        self.racine = self._construire(debuts, fins, np.flatnonzero(fins > debuts))
+
+    def _construire(self, debuts, fins, indices) -> int:
+        if len(indices) == 0:
+            return -1
+
+        # Mediane inferieure des extremites: chaque cote a strictement moins
+        # d'intervalles que le noeud
+        extremites = np.sort(np.concatenate((debuts[indices], fins[indices])))
+        centre = extremites[len(indices) - 1]
+        d, f = debuts[indices], fins[indices]
+        au_centre = indices[(d <= centre) & (f > centre)]
+
+        par_debut = au_centre[np.argsort(debuts[au_centre], kind="stable")]
+        par_fin = au_centre[np.argsort(fins[au_centre], kind="stable")]
+        position = len(self.noeuds)
+        self.noeuds.append(None)
+        gauche = self._construire(debuts, fins, indices[f <= centre])
+        droite = self._construire(debuts, fins, indices[d > centre])
+        self.noeuds[position] = (
+            centre,
+            par_debut,
+            debuts[par_debut],
+            par_fin,
+            fins[par_fin],
+            gauche,
+            droite,
+        )
+        return position
+
+    def interroger(self, instant) -> np.ndarray:
+        """
+        Indices (tries) des intervalles tels que debut <= instant < fin
+        """
+        morceaux = []
+        noeud = self.racine
+        while noeud != -1:
+            centre, par_debut, debuts, par_fin, fins, gauche, droite = self.noeuds[
+                noeud
+            ]
+            if instant < centre:
+                # fin > centre > instant: il suffit que debut <= instant
+                morceaux.append(par_debut[: np.searchsorted(debuts, instant, "right")])
+                noeud = gauche
+            else:
+                # debut <= centre <= instant: il suffit que fin > instant
+                morceaux.append(par_fin[np.searchsorted(fins, instant, "right") :])
+                noeud = droite
+
+        if not morceaux:
+            return np.zeros(0, dtype=np.intp)
+        return np.sort(np.concatenate(morceaux))
+
+
+class RequetesPlanning:
+    """
+    Classe pour interroger les resultats d'une analyse en temps logarithmique
+
+    Construite une fois a partir d'un InstantaneAnalyse (fige, donc partageable
+    entre threads): un arbre d'intervalles par plan ([ES, EF) et [LS, LF)) et
+    un index trie par champ (ES, EF, LS, LF, marge, marge_libre). Les
+    resultats sont des listes de taches en ordre topologique.
+    """
+
+    def __init__(self, instantane):
+        """
+        Args:
+            instantane: InstantaneAnalyse d'une analyse executee
+        """
+        self.instantane = instantane
+        self._taches = np.array(instantane.taches, dtype=object)
+
+        self._arbres = {}
+        self._bornes_triees = {}
+        for plan, (debut, fin) in PLANS.items():
+            debuts = getattr(instantane, debut)
+            fins = getattr(instantane, fin)
+            self._arbres[plan] = _ArbreIntervalles(debuts, fins)
+            self._bornes_triees[plan] = (np.sort(debuts), np.sort(fins))
+
+        self._index = {}
+        for champ, attribut in CHAMPS.items():
+            valeurs = getattr(instantane, attribut)
+            ordre = np.argsort(valeurs, kind="stable")
+            self._index[champ] = (ordre, valeurs[ordre])
+
+    def _verifier_plan(self, plan: str):
+        if plan not in PLANS:
+            raise ValueError(f"Plan inconnu: {plan} (attendu: {', '.join(PLANS)})")
+
+    def _valeurs_triees(self, champ: str) -> tuple[np.ndarray, np.ndarray]:
+        if champ not in CHAMPS:
+            raise ValueError(f"Champ inconnu: {champ} (attendu: {', '.join(CHAMPS)})")
+        return self._index[champ]
+
+    def _codes(self, indices) -> list[str]:
+        """
+        Codes des taches, en ordre topologique
+        """
+        return self._taches[np.sort(indices)].tolist()
+
+    def actives(self, instant, plan: str = "tot") -> list[str]:
+        """
+        Taches en cours a un instant (debut <= instant < fin)
+
+        Args:
+            instant: Minute interrogee
+            plan: 'tot' pour [ES, EF), 'tard' pour [LS, LF)
+
+        Returns:
+            Liste des taches actives
+        """
+        self._verifier_plan(plan)
+        return self._taches[self._arbres[plan].interroger(instant)].tolist()
+
+    def actives_par_lot(self, instants, plan: str = "tot") -> list[list[str]]:
+        """
+        Taches en cours pour chaque instant d'une liste
+
+        Args:
+            instants: Minutes interrogees
+            plan: 'tot' pour [ES, EF), 'tard' pour [LS, LF)
+
+        Returns:
+            Une liste de taches actives par instant
+        """
+        self._verifier_plan(plan)
+        arbre = self._arbres[plan]
+        return [self._taches[arbre.interroger(t)].tolist() for t in instants]
+
+    def nb_actives(self, instants, plan: str = "tot") -> np.ndarray:
+        """
+        Nombre de taches en cours a chaque instant, entierement vectorise
+
+        Une tache est active si debut <= t et non fin <= t; comme debut <= fin,
+        le compte est #(debut <= t) - #(fin <= t), deux recherches dichotomiques.
+
+        Args:
+            instants: Une minute ou une liste de minutes
+            plan: 'tot' pour [ES, EF), 'tard' pour [LS, LF)
+
+        Returns:
+            Tableau numpy des nombres de taches actives
+        """
+        self._verifier_plan(plan)
+        debuts, fins = self._bornes_triees[plan]
+        instants = np.atleast_1d(np.asarray(instants))
+        return np.searchsorted(debuts, instants, "right") - np.searchsorted(
+            fins, instants, "right"
+        )
+
+    def dans_intervalle(self, champ: str, debut, fin) -> list[str]:
+        """
+        Taches dont le champ est dans [debut, fin]
+
+        Args:
+            champ: 'ES', 'EF', 'LS', 'LF', 'marge' ou 'marge_libre'
+            debut: Borne inferieure incluse
+            fin: Borne superieure incluse
+
+        Returns:
+            Liste des taches (ex: champ='ES' pour les taches demarrant dans
+            la fenetre)
+        """
+        return self.dans_intervalle_par_lot(champ, [debut], [fin])[0]
+
+    def dans_intervalle_par_lot(self, champ: str, debuts, fins) -> list[list[str]]:
+        """
+        Taches dont le champ est dans [debuts[i], fins[i]], pour chaque fenetre
+
+        Les bornes de toutes les fenetres sont cherchees en un seul appel
+        vectorise de searchsorted.
+
+        Returns:
+            Une liste de taches par fenetre
+        """
+        ordre, valeurs = self._valeurs_triees(champ)
+        gauches = np.searchsorted(valeurs, np.asarray(debuts), "left")
+        droites = np.searchsorted(valeurs, np.asarray(fins), "right")
+        return [
+            self._codes(ordre[gauche:droite])
+            for gauche, droite in zip(gauches.tolist(), droites.tolist())
+        ]
+
+    def sous_seuil(self, champ: str, seuil) -> list[str]:
+        """
+        Taches dont le champ est strictement inferieur au seuil
+
+        Args:
+            champ: 'ES', 'EF', 'LS', 'LF', 'marge' ou 'marge_libre'
+            seuil: Valeur exclue (ex: champ='marge', seuil=5)
+
+        Returns:
+            Liste des taches
+        """
+        ordre, valeurs = self._valeurs_triees(champ)
+        return self._codes(ordre[: np.searchsorted(valeurs, seuil, "left")])
@@ -0,0 +1,185 @@
+import networkx as nx
+import numpy as np
+
+from .graph_builder import GraphePERT
+from .pert_calculator import CalculateurPERT
+
+
+def construire_fermeture(
+    graphe: nx.DiGraph, ordre: list[str], conserver_masques: bool = True
+):
+    """
+    Construit la fermeture transitive d'un DAG sous forme de bitsets
+
+    Le bit i du masque d'une tache correspond a la tache en position i dans
+    l'ordre topologique. Les successeurs sont parcourus par position croissante:
+    un successeur deja couvert par un successeur precedent est atteint par un
+    autre chemin, son arc est redondant et son masque n'est pas fusionne.
+
+    Args:
+        graphe: Graphe oriente acyclique
+        ordre: Ordre topologique des noeuds du graphe
+        conserver_masques: Si False, le masque d'une tache est libere des que
+            tous ses predecesseurs ont ete traites (seuls les arcs redondants
+            sont alors utiles), ce qui borne la memoire a la "frontiere" du
+            parcours
+
+    Returns:
+        Tuple (masques, arcs_redondants): masque des descendants (tache incluse)
+        de chaque position, et liste des arcs de la reduction transitive retires
+    """
+    position = {tache: i for i, tache in enumerate(ordre)}
+    masques = [0] * len(ordre)
+    arcs_redondants = []
+    restants = None if conserver_masques else [graphe.in_degree(t) for t in ordre]
+
+    for i in range(len(ordre) - 1, -1, -1):
+        tache = ordre[i]
+        masque = 1 << i
+        successeurs = sorted(position[succ] for succ in graphe.successors(tache))
+        for j in successeurs:
+            if masque >> j & 1:
+                arcs_redondants.append((tache, ordre[j]))
+            else:
+                masque |= masques[j]
+        masques[i] = masque
+
+        if restants is not None:
+            for j in successeurs:
+                restants[j] -= 1
+                if restants[j] == 0:
+                    masques[j] = 0
+
+    return masques, arcs_redondants
+
+
+class IndexAccessibilite:
+    """
+    Index de fermeture transitive pour les requetes d'accessibilite
+
+    Chaque tache possede un bitset de ses descendants, construit une fois en
+    O(E * V / 64) mots machine et occupant V * V / 8 octets au total. Les
+    requetes n'effectuent plus de parcours du graphe. L'index doit etre
+    reconstruit si le graphe est modifie.
+    """
+
+    def __init__(self, graphe_pert):
+        """
+        Args:
+            graphe_pert: Instance de GraphePERT
+        """
+        self.graphe_pert = graphe_pert
+        self.graphe = graphe_pert.graphe
+        self.ordre = list(nx.topological_sort(self.graphe))
+        self.position = {tache: i for i, tache in enumerate(self.ordre)}
+        self.masques, self.arcs_redondants = construire_fermeture(
+            self.graphe, self.ordre
+        )
+
+    def _decoder(self, masque: int) -> list[str]:
+        """
+        Convertit un bitset en liste de taches (ordre topologique)
+        """
+        if not masque:
+            return []
+        octets = masque.to_bytes((len(self.ordre) + 7) // 8, "little")
+        bits = np.unpackbits(np.frombuffer(octets, dtype=np.uint8), bitorder="little")
+        return [self.ordre[i] for i in np.flatnonzero(bits)]
+
+    def masque_descendants(self, taches) -> int:
+        """
+        Bitset des taches donnees et de tous leurs descendants
+
+        Args:
+            taches: Code d'une tache ou liste de codes
+
+        Returns:
+            Entier dont le bit i represente la tache self.ordre[i]
+        """
+        if isinstance(taches, str):
+            taches = [taches]
+
+        masque = 0
+        for tache in taches:
+            masque |= self.masques[self.position[tache]]
+        return masque
+
+    def est_ancetre(self, ancetre: str, tache: str) -> bool:
+        """
+        Indique si `tache` est atteignable depuis `ancetre`
+
+        Args:
+            ancetre: Code de l'ancetre suppose
+            tache: Code de la tache
+
+        Returns:
+            True si un chemin non vide va de ancetre a tache
+        """
+        if ancetre == tache:
+            return False
+        return bool(self.masques[self.position[ancetre]] >> self.position[tache] & 1)
+
+    def taches_affectees(self, taches) -> list[str]:
+        """
+        Retourne les taches modifiees et toutes celles qui en dependent
+
+        Args:
+            taches: Code d'une tache ou liste de codes touches par un changement
+
+        Returns:
+            Liste des taches affectees, en ordre topologique
+        """
+        return self._decoder(self.masque_descendants(taches))
+
+    def construire_sous_pipeline(self, taches) -> GraphePERT:
+        """
+        Construit le sous-pipeline des taches affectees
+
+        Les arcs vers des taches non affectees (dont le resultat est reutilise)
+        sont retires: le sous-pipeline demarre a zero.
+
+        Args:
+            taches: Code d'une tache ou liste de codes touches par un changement
+
+        Returns:
+            Nouveau GraphePERT restreint aux taches affectees
+        """
+        masque = self.masque_descendants(taches)
+        sous_pipeline = GraphePERT(surcout_job=self.graphe_pert.surcout_job)
+
+        for tache in self._decoder(masque):
+            # Copie de tous les attributs (estimation, echeance, relances, durees
+            # par classe): les durees incluent deja le surcout de demarrage
+            attributs = dict(self.graphe.nodes[tache])
+            if "durees_classes" in attributs:
+                attributs["durees_classes"] = dict(attributs["durees_classes"])
+            predecesseurs = [
+                pred
+                for pred in self.graphe.pred[tache]
+                if masque >> self.position[pred] & 1
+            ]
+            sous_pipeline.graphe.add_node(tache, **attributs)
+            for pred in predecesseurs:
+                sous_pipeline.graphe.add_edge(
+                    pred, tache, **self.graphe.edges[pred, tache]
+                )
+            sous_pipeline.taches[tache] = {
+                **attributs,
+                "predecesseurs": predecesseurs,
+            }
+
+        return sous_pipeline
+
+    def analyser_sous_pipeline(self, taches) -> CalculateurPERT:
+        """
+        Calcule le planning du seul sous-pipeline affecte
+
+        Args:
+            taches: Code d'une tache ou liste de codes touches par un changement
+
+        Returns:
+            CalculateurPERT du sous-pipeline, analyse complete executee
+        """
+        calculateur = CalculateurPERT(self.construire_sous_pipeline(taches))
+        calculateur.executer_analyse_complete()
+        return calculateur
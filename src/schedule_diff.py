@@ -0,0 +1,212 @@
+from .graph_builder import GraphePERT
+from .pert_calculator import CalculateurPERT
+
+
+class ComparateurPERT:
+    """
+    Classe pour comparer les plannings de deux versions d'un pipeline
+    """
+
+    def __init__(self, base, nouveau):
+        """
+        Args:
+            base: Version de reference (GraphePERT, chemin CSV, ou CalculateurPERT
+                deja analyse dont les resultats sont reutilises)
+            nouveau: Nouvelle version (GraphePERT ou chemin CSV)
+        """
+        if isinstance(base, CalculateurPERT):
+            self.calc_base = base
+        else:
+            self.calc_base = CalculateurPERT(self._charger(base))
+        self.base = self.calc_base.graphe_pert
+        self.nouveau = self._charger(nouveau)
+        self.calc_nouveau = None
+
+    @staticmethod
+    def _charger(graphe_pert) -> GraphePERT:
+        """
+        Accepte un GraphePERT ou un chemin vers un fichier CSV
+        """
+        if isinstance(graphe_pert, GraphePERT):
+            return graphe_pert
+        return GraphePERT(graphe_pert)
+
+    def detecter_modifications(self) -> dict:
+        """
+        Compare la structure des deux versions
+
+        Returns:
+            Dictionnaire avec les taches ajoutees, supprimees, les durees et
+            echeances modifiees et les taches dont les arcs entrants ou sortants
+            ont change
+        """
+        g_base = self.base.graphe
+        g_nouveau = self.nouveau.graphe
+
+        ajoutees = [t for t in g_nouveau.nodes() if t not in g_base]
+        supprimees = [t for t in g_base.nodes() if t not in g_nouveau]
+        communes = [t for t in g_nouveau.nodes() if t in g_base]
+
+        durees_modifiees = {
+            t: {
+                "avant": g_base.nodes[t]["duree"],
+                "apres": g_nouveau.nodes[t]["duree"],
+            }
+            for t in communes
+            if g_base.nodes[t]["duree"] != g_nouveau.nodes[t]["duree"]
+        }
+
+        echeances_modifiees = {
+            t: {
+                "avant": g_base.nodes[t].get("echeance"),
+                "apres": g_nouveau.nodes[t].get("echeance"),
+            }
+            for t in communes
+            if g_base.nodes[t].get("echeance") != g_nouveau.nodes[t].get("echeance")
+        }
+
+        arcs_entrants_modifies = [
+            t for t in communes if dict(g_base.pred[t]) != dict(g_nouveau.pred[t])
+        ]
+        arcs_sortants_modifies = [
+            t for t in communes if dict(g_base.succ[t]) != dict(g_nouveau.succ[t])
+        ]
+
+        return {
+            "taches_ajoutees": ajoutees,
+            "taches_supprimees": supprimees,
+            "durees_modifiees": durees_modifiees,
+            "echeances_modifiees": echeances_modifiees,
+            "arcs_entrants_modifies": arcs_entrants_modifies,
+            "arcs_sortants_modifies": arcs_sortants_modifies,
+        }
+
+    def _analyser_nouveau(self, modifications: dict) -> set[str]:
+        """
+        Analyse la nouvelle version en partant des resultats de la base et en ne
+        recalculant que les descendants (au plus tot) et les ancetres (au plus
+        tard) des taches modifiees
+
+        Returns:
+            Ensemble des taches dont les dates ont ete recalculees
+        """
+        base = self.calc_base
+        calc = CalculateurPERT(self.nouveau)
+
+        # Reprendre les resultats de la base pour les taches conservees
+        for tache in self.nouveau.graphe.nodes():
+            if tache in base.dates_tot:
+                calc.dates_tot[tache] = dict(base.dates_tot[tache])
+                calc.dates_tard[tache] = dict(base.dates_tard[tache])
+                calc.marges_libres[tache] = base.marges_libres[tache]
+        calc.duree_totale = base.duree_totale
+
+        changements = set(modifications["taches_ajoutees"]) | set(
+            modifications["durees_modifiees"]
+        )
+        modifiees_tot = calc.recalculer_dates_au_plus_tot(
+            changements | set(modifications["arcs_entrants_modifies"])
+        )
+        # Une echeance ne borne que les dates au plus tard
+        echeances = set(modifications["echeances_modifiees"])
+        modifiees_tard = calc.recalculer_dates_au_plus_tard(
+            changements | echeances | set(modifications["arcs_sortants_modifies"]),
+            duree_totale_precedente=base.duree_totale,
+        )
+
+        calc.calculer_marges()
+
+        # Marges libres: seules changent les taches dont les dates au plus tot
+        # ou celles d'un successeur ont change (et les taches finales, FF = TF)
+        a_recalculer = (
+            set(changements) | echeances | set(modifications["arcs_sortants_modifies"])
+        )
+        for tache in modifiees_tot:
+            a_recalculer.add(tache)
+            a_recalculer.update(calc.graphe.predecessors(tache))
+        if calc.duree_totale != base.duree_totale:
+            a_recalculer.update(self.nouveau.obtenir_taches_finales())
+        for tache in a_recalculer:
+            calc.marges_libres[tache] = calc._calculer_marge_libre_tache(tache)
+
+        calc.identifier_chemin_critique()
+
+        self.calc_nouveau = calc
+        return modifiees_tot | modifiees_tard
+
+    def comparer(self) -> dict:
+        """
+        Calcule le delta de planning entre les deux versions
+
+        Returns:
+            Dictionnaire avec la duree totale avant/apres, les taches ajoutees et
+            supprimees, les durees, echeances et marges modifiees et les
+            changements de criticite
+        """
+        if not self.calc_base.dates_tot:
+            self.calc_base.executer_analyse_complete()
+
+        modifications = self.detecter_modifications()
+        recalculees = self._analyser_nouveau(modifications)
+
+        avant = self.calc_base.marges
+        apres = self.calc_nouveau.marges
+        communes = [t for t in apres if t in avant]
+
+        marges_modifiees = {
+            t: {"avant": avant[t], "apres": apres[t]}
+            for t in communes
+            if avant[t] != apres[t]
+        }
+        critique_avant = self.calc_base.est_critique
+        critique_apres = self.calc_nouveau.est_critique
+        devenues_critiques = [
+            t for t in communes if not critique_avant(t) and critique_apres(t)
+        ]
+        devenues_non_critiques = [
+            t for t in communes if critique_avant(t) and not critique_apres(t)
+        ]
+
+        return {
+            "duree_totale": {
+                "avant": self.calc_base.duree_totale,
+                "apres": self.calc_nouveau.duree_totale,
+                "delta": self.calc_nouveau.duree_totale - self.calc_base.duree_totale,
+            },
+            "taches_ajoutees": modifications["taches_ajoutees"],
+            "taches_supprimees": modifications["taches_supprimees"],
+            "durees_modifiees": modifications["durees_modifiees"],
+            "echeances_modifiees": modifications["echeances_modifiees"],
+            "marges_modifiees": marges_modifiees,
+            "devenues_critiques": devenues_critiques,
+            "devenues_non_critiques": devenues_non_critiques,
+            "chemin_critique": {
+                "avant": self.calc_base.chemin_critique,
+                "apres": self.calc_nouveau.chemin_critique,
+            },
+            "taches_recalculees": len(recalculees),
+        }
+
+    def afficher_resume(self):
+        """
+        Affiche un resume de la comparaison
+        """
+        diff = self.comparer()
+        duree = diff["duree_totale"]
+
+        print(
+            f"Duree totale: {duree['avant']} -> {duree['apres']} minutes "
+            f"({duree['delta']:+d})"
+        )
+        print(f"Taches ajoutees: {', '.join(diff['taches_ajoutees']) or '-'}")
+        print(f"Taches supprimees: {', '.join(diff['taches_supprimees']) or '-'}")
+
+        for tache, valeurs in diff["durees_modifiees"].items():
+            print(f"  {tache}: duree {valeurs['avant']} -> {valeurs['apres']} min")
+        for tache, valeurs in diff["echeances_modifiees"].items():
+            print(f"  {tache}: echeance {valeurs['avant']} -> {valeurs['apres']}")
+
+        print(f"\nDevenues critiques: {', '.join(diff['devenues_critiques']) or '-'}")
+        print(f"Plus critiques: {', '.join(diff['devenues_non_critiques']) or '-'}")
+        for tache, valeurs in diff["marges_modifiees"].items():
+            print(f"  {tache}: marge {valeurs['avant']} -> {valeurs['apres']} min")
@@ -0,0 +1,232 @@
+import heapq
+from itertools import count
+
+import networkx as nx
+import numpy as np
+
+# Politiques de choix du prochain job quand un runner se libere
+POLITIQUES = ("fifo", "chemin_critique", "plus_court_restant")
+
+# Types d'evenements du tas (l'ordre departage les evenements simultanes)
+_FIN, _PRET = 0, 1
+
+
+def _distribution(valeurs) -> dict[str, float]:
+    """
+    Resume d'une distribution: moyenne, p50, p90, p99 et max
+    """
+    valeurs = np.asarray(valeurs, dtype=float)
+    if len(valeurs) == 0:
+        return {"moyenne": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+
+    p50, p90, p99 = np.percentile(valeurs, [50, 90, 99])
+    return {
+        "moyenne": float(valeurs.mean()),
+        "p50": float(p50),
+        "p90": float(p90),
+        "p99": float(p99),
+        "max": float(valeurs.max()),
+    }
+
+
+class SimulateurFlotte:
+    """
+    Classe pour simuler des pipelines concurrents sur une flotte de runners
+
+    Simulation a evenements discrets: les arrivees de pipelines (triees), un
+    tas d'evenements (fin de job, job pret apres un decalage) et une file de jobs prets ordonnee selon
+    la politique. Chaque job occupe un runner pendant sa duree. Toutes les
+    relations sont traitees comme fin-debut, le decalage retardant le job.
+    """
+
+    def __init__(self, nb_runners: int, politique: str = "fifo"):
+        """
+        Args:
+            nb_runners: Nombre de runners partages
+            politique: 'fifo' (ordre d'arrivee dans la file), 'chemin_critique'
+                (plus longue chaine restante d'abord) ou 'plus_court_restant'
+                (pipeline au plus petit travail restant d'abord)
+        """
+        if nb_runners < 1:
+            raise ValueError("Il faut au moins un runner")
+        if politique not in POLITIQUES:
+            raise ValueError(
+                f"Politique inconnue: {politique} (attendu: {', '.join(POLITIQUES)})"
+            )
+
+        self.nb_runners = nb_runners
+        self.politique = politique
+        self._modeles = {}
+
+    def _compiler(self, graphe_pert) -> dict:
+        """
+        Convertit un pipeline en listes indexees, une seule fois par GraphePERT
+
+        Le rang d'un job est la plus longue chaine (durees et decalages) du
+        debut du job a la fin du pipeline.
+        """
+        cle = id(graphe_pert)
+        if cle in self._modeles and self._modeles[cle]["graphe_pert"] is graphe_pert:
+            return self._modeles[cle]
+
+        graphe = graphe_pert.graphe
+        ordre = list(nx.topological_sort(graphe))
+        index = {tache: i for i, tache in enumerate(ordre)}
+        durees = [graphe.nodes[tache]["duree"] for tache in ordre]
+        successeurs = [
+            [
+                (index[succ], arc.get("decalage", 0))
+                for succ, arc in graphe.succ[tache].items()
+            ]
+            for tache in ordre
+        ]
+
+        rangs = [0] * len(ordre)
+        for i in range(len(ordre) - 1, -1, -1):
+            rangs[i] = durees[i] + max(
+                (rangs[j] + decalage for j, decalage in successeurs[i]), default=0
+            )
+
+        modele = {
+            "graphe_pert": graphe_pert,
+            "durees": durees,
+            "successeurs": successeurs,
+            "degres": [graphe.in_degree(tache) for tache in ordre],
+            "sources": [i for i, tache in enumerate(ordre) if not graphe.pred[tache]],
+            "rangs": rangs,
+            "travail": sum(durees),
+            "duree_isolee": max(rangs, default=0),
+        }
+        self._modeles[cle] = modele
+        return modele
+
+    def simuler(self, arrivees) -> dict:
+        """
+        Simule une trace d'arrivees de pipelines
+
+        Args:
+            arrivees: Liste de tuples (instant d'arrivee, GraphePERT)
+
+        Returns:
+            Dictionnaire {'nb_pipelines', 'nb_jobs', 'duree_simulee', 'attente',
+            'delai', 'ralentissement', 'utilisation', 'attentes', 'delais'} ou
+            attentes (par job, ordre de demarrage) et delais (par pipeline,
+            ordre de la trace) sont des tableaux numpy et attente / delai /
+            ralentissement des resumes de distribution
+        """
+        politique = self.politique
+        heappush, heappop = heapq.heappush, heapq.heappop
+        sequence = count()
+        evenements = []
+        modeles = [self._compiler(graphe_pert) for _, graphe_pert in arrivees]
+        instants_arrivee = [instant for instant, _ in arrivees]
+
+        # Les arrivees, connues d'avance, sont lues dans l'ordre plutot que
+        # placees dans le tas (qui ne contient que les jobs en cours)
+        ordre_arrivees = sorted(range(len(modeles)), key=instants_arrivee.__getitem__)
+        prochaine = 0
+
+        # Etat de chaque pipeline en cours (listes indexees par le numero k)
+        degres = [None] * len(modeles)
+        prets = [None] * len(modeles)
+        restants = [0] * len(modeles)
+        travail_restant = [0] * len(modeles)
+        debuts = [0] * len(modeles)
+        fins = [0] * len(modeles)
+
+        file_prets = []
+        attentes = []
+        libres = self.nb_runners
+        occupation = 0
+        premier = instants_arrivee[ordre_arrivees[0]] if modeles else 0
+        instant = premier
+
+        def rendre_pret(k, j, instant_pret):
+            modele = modeles[k]
+            if politique == "fifo":
+                priorite = instant_pret
+            elif politique == "chemin_critique":
+                priorite = -modele["rangs"][j]
+            else:
+                priorite = travail_restant[k]
+            heappush(file_prets, (priorite, instant_pret, next(sequence), k, j))
+
+        while evenements or prochaine < len(ordre_arrivees):
+            if prochaine < len(ordre_arrivees):
+                instant = instants_arrivee[ordre_arrivees[prochaine]]
+                if evenements and evenements[0][0] < instant:
+                    instant = evenements[0][0]
+            else:
+                instant = evenements[0][0]
+
+            # Traiter tous les evenements simultanes avant d'affecter les runners
+            while evenements and evenements[0][0] == instant:
+                _, genre, _, k, j = heappop(evenements)
+                modele = modeles[k]
+
+                if genre == _FIN:
+                    libres += 1
+                    restants[k] -= 1
+                    if restants[k] == 0:
+                        fins[k] = instant
+                        degres[k] = prets[k] = None
+                    for succ, decalage in modele["successeurs"][j]:
+                        degres[k][succ] -= 1
+                        prets[k][succ] = max(prets[k][succ], instant + decalage)
+                        if degres[k][succ] == 0:
+                            if prets[k][succ] > instant:
+                                heappush(
+                                    evenements,
+                                    (prets[k][succ], _PRET, next(sequence), k, succ),
+                                )
+                            else:
+                                rendre_pret(k, succ, instant)
+
+                else:
+                    rendre_pret(k, j, instant)
+
+            while (
+                prochaine < len(ordre_arrivees)
+                and instants_arrivee[ordre_arrivees[prochaine]] == instant
+            ):
+                k = ordre_arrivees[prochaine]
+                prochaine += 1
+                modele = modeles[k]
+                degres[k] = list(modele["degres"])
+                prets[k] = [instant] * len(modele["durees"])
+                restants[k] = len(modele["durees"])
+                travail_restant[k] = modele["travail"]
+                debuts[k] = fins[k] = instant
+                for source in modele["sources"]:
+                    rendre_pret(k, source, instant)
+
+            # Affecter les runners libres aux jobs prets
+            while libres and file_prets:
+                _, instant_pret, _, k, j = heappop(file_prets)
+                duree = modeles[k]["durees"][j]
+                libres -= 1
+                occupation += duree
+                travail_restant[k] -= duree
+                attentes.append(instant - instant_pret)
+                heappush(evenements, (instant + duree, _FIN, next(sequence), k, j))
+
+        delais = np.array(fins, dtype=float) - np.array(debuts, dtype=float)
+        durees_isolees = np.array(
+            [modele["duree_isolee"] for modele in modeles], dtype=float
+        )
+        ralentissements = delais / np.where(durees_isolees > 0, durees_isolees, 1)
+        duree_simulee = instant - premier
+
+        return {
+            "nb_pipelines": len(modeles),
+            "nb_jobs": len(attentes),
+            "duree_simulee": duree_simulee,
+            "attente": _distribution(attentes),
+            "delai": _distribution(delais),
+            "ralentissement": _distribution(ralentissements),
+            "utilisation": (
+                occupation / (self.nb_runners * duree_simulee) if duree_simulee else 0.0
+            ),
+            "attentes": np.array(attentes, dtype=float),
+            "delais": delais,
+        }
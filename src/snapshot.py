@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import networkx as nx
+import numpy as np
+
+
+def _tableau_lecture_seule(valeurs) -> np.ndarray:
+    """
+    Convertit des valeurs en tableau numpy non modifiable
+    """
+    tableau = np.array(valeurs)
+    tableau.setflags(write=False)
+    return tableau
+
+
+@dataclass(frozen=True)
+class InstantaneAnalyse:
+    """
+    Resultats figes d'une analyse PERT
+
+    Les tableaux sont en lecture seule et indexes par la position de la tache
+    dans `taches` (ordre topologique). Un instantane n'est jamais modifie: il
+    peut etre partage entre threads sans copie ni verrou.
+    """
+
+    version: int
+    duree_totale: int
+    taches: tuple[str, ...]
+    index: MappingProxyType
+    es: np.ndarray
+    ef: np.ndarray
+    ls: np.ndarray
+    lf: np.ndarray
+    marges: np.ndarray
+    marges_libres: np.ndarray
+    chemin_critique: tuple[str, ...]
+
+    @classmethod
+    def depuis_calculateur(cls, calculateur, version: int = 0):
+        """
+        Fige les resultats courants d'un CalculateurPERT (analyse executee)
+
+        Args:
+            calculateur: Instance de CalculateurPERT
+            version: Numero de l'instantane
+
+        Returns:
+            Nouvel InstantaneAnalyse
+        """
+        taches = tuple(nx.topological_sort(calculateur.graphe))
+        dates_tot = calculateur.dates_tot
+        dates_tard = calculateur.dates_tard
+
+        return cls(
+            version=version,
+            duree_totale=calculateur.duree_totale,
+            taches=taches,
+            index=MappingProxyType({tache: i for i, tache in enumerate(taches)}),
+            es=_tableau_lecture_seule([dates_tot[t]["ES"] for t in taches]),
+            ef=_tableau_lecture_seule([dates_tot[t]["EF"] for t in taches]),
+            ls=_tableau_lecture_seule([dates_tard[t]["LS"] for t in taches]),
+            lf=_tableau_lecture_seule([dates_tard[t]["LF"] for t in taches]),
+            marges=_tableau_lecture_seule([calculateur.marges[t] for t in taches]),
+            marges_libres=_tableau_lecture_seule(
+                [calculateur.marges_libres[t] for t in taches]
+            ),
+            chemin_critique=tuple(calculateur.chemin_critique),
+        )
+
+    def dates_tache(self, tache: str) -> dict[str, int]:
+        """
+        Retourne les dates et marges d'une tache
+
+        Args:
+            tache: Code de la tache
+
+        Returns:
+            Dictionnaire {'ES', 'EF', 'LS', 'LF', 'marge', 'marge_libre'}
+        """
+        i = self.index[tache]
+        return {
+            "ES": self.es[i].item(),
+            "EF": self.ef[i].item(),
+            "LS": self.ls[i].item(),
+            "LF": self.lf[i].item(),
+            "marge": self.marges[i].item(),
+            "marge_libre": self.marges_libres[i].item(),
+        }
+
+    def taches_critiques(self) -> tuple[str, ...]:
+        """
+        Retourne les taches de marge minimale (nulle sans echeance, negative
+        si un jalon est intenable), en ordre topologique
+        """
+        if len(self.marges) == 0:
+            return ()
+        return tuple(
+            self.taches[i] for i in np.flatnonzero(self.marges == self.marges.min())
+        )
@@ -0,0 +1,506 @@
+import copy
+import random
+import time
+
+import networkx as nx
+
+from .graph_builder import TYPES_RELATIONS, GraphePERT
+from .pert_calculator import CalculateurPERT
+from .reachability import IndexAccessibilite
+from .schedule_diff import ComparateurPERT
+
+# Champs compares entre moteurs (un moteur peut n'en fournir qu'une partie)
+CHAMPS = ("ES", "EF", "LS", "LF", "marge", "marge_libre", "critiques")
+
+# Formes de DAG generees par defaut
+FORMES = ("chaine", "eventail", "aleatoire", "dense", "relations_typees", "echeances")
+
+# Registre {nom: fonction(graphe_pert) -> resultats}
+MOTEURS = {}
+
+
+def enregistrer_moteur(nom: str):
+    """
+    Decorateur ajoutant un moteur de calcul au registre MOTEURS
+
+    Le moteur recoit un GraphePERT (qu'il ne doit pas modifier) et retourne un
+    dictionnaire {champ: {code_tache: valeur}} pour tout ou partie de CHAMPS,
+    'critiques' etant un ensemble de taches. Un moteur qui n'analyse qu'une
+    partie du graphe ajoute la cle 'graphe': la reference est alors calculee
+    sur ce GraphePERT.
+
+    Un moteur qui tire des perturbations au hasard doit le faire avec une
+    graine deduite du graphe (voir _aleatoire_du_cas) pour que la reduction
+    d'un cas en echec soit reproductible.
+    """
+
+    def decorateur(fonction):
+        MOTEURS[nom] = fonction
+        return fonction
+
+    return decorateur
+
+
+def _resultats_calculateur(calc: CalculateurPERT) -> dict:
+    """
+    Extrait les champs compares d'un CalculateurPERT analyse
+    """
+    return {
+        "ES": {t: d["ES"] for t, d in calc.dates_tot.items()},
+        "EF": {t: d["EF"] for t, d in calc.dates_tot.items()},
+        "LS": {t: d["LS"] for t, d in calc.dates_tard.items()},
+        "LF": {t: d["LF"] for t, d in calc.dates_tard.items()},
+        "marge": dict(calc.marges),
+        "marge_libre": dict(calc.marges_libres),
+        "critiques": {t for t in calc.marges if calc.est_critique(t)},
+    }
+
+
+@enregistrer_moteur("reference")
+def moteur_reference(graphe_pert) -> dict:
+    """Analyse complete networkx (CalculateurPERT)"""
+    calc = CalculateurPERT(graphe_pert)
+    calc.executer_analyse_complete()
+    return _resultats_calculateur(calc)
+
+
+def _aleatoire_du_cas(cas: list[tuple]) -> random.Random:
+    """
+    Generateur aleatoire dont la graine est le cas lui-meme (deterministe)
+    """
+    return random.Random(repr(cas))
+
+
+def _perturber_cas(cas: list[tuple], aleatoire: random.Random) -> list[tuple]:
+    """
+    Version voisine d'un cas: quelques durees et echeances modifiees, arcs
+    retires et ajoutes, une tache retiree et une tache ajoutee
+
+    L'ordre topologique est conserve: un arc ajoute va toujours d'une tache
+    vers une tache placee apres elle.
+    """
+    cas = [
+        (code, duree, list(relations), echeance)
+        for code, duree, relations, echeance in cas
+    ]
+    nb = len(cas)
+
+    for i in aleatoire.sample(range(nb), min(nb, 3)):
+        code, duree, relations, echeance = cas[i]
+        cas[i] = (code, max(0, duree + aleatoire.randint(-5, 5)), relations, echeance)
+
+    # Echeances ajoutees, deplacees ou retirees
+    for i in aleatoire.sample(range(nb), min(nb, 2)):
+        code, duree, relations, echeance = cas[i]
+        if echeance is None or aleatoire.random() < 0.5:
+            echeance = aleatoire.randint(0, 10 * (nb + 2))
+        else:
+            echeance = None
+        cas[i] = (code, duree, relations, echeance)
+
+    arcs = [
+        (i, j)
+        for i, (_, _, relations, _) in enumerate(cas)
+        for j in range(len(relations))
+    ]
+    for i, j in sorted(aleatoire.sample(arcs, min(len(arcs), 2)), reverse=True):
+        del cas[i][2][j]
+
+    for _ in range(2 if nb > 1 else 0):
+        i, j = sorted(aleatoire.sample(range(nb), 2))
+        pred = cas[i][0]
+        if all(r[0] != pred for r in cas[j][2]):
+            cas[j][2].append((pred, "FS", aleatoire.randint(0, 3)))
+
+    # Tache absente de la base (ajoutee par la nouvelle version)
+    if nb > 1:
+        retiree = cas.pop(aleatoire.randrange(nb))[0]
+        cas = [
+            (code, duree, [r for r in relations if r[0] != retiree], echeance)
+            for code, duree, relations, echeance in cas
+        ]
+
+    # Tache de la base absente de la nouvelle version (supprimee)
+    position = aleatoire.randint(0, len(cas))
+    predecesseurs = aleatoire.sample(range(position), min(position, 2))
+    cas.insert(
+        position,
+        (
+            "supprimee",
+            aleatoire.randint(0, 20),
+            [(cas[k][0], "FS", 0) for k in predecesseurs],
+            None,
+        ),
+    )
+    if position + 1 < len(cas):
+        j = aleatoire.randrange(position + 1, len(cas))
+        cas[j][2].append(("supprimee", "FS", 0))
+
+    return cas
+
+
+@enregistrer_moteur("incremental")
+def moteur_incremental(graphe_pert) -> dict:
+    """Recalcul incremental depuis une version voisine (durees, arcs, taches)"""
+    cas = extraire_cas(graphe_pert)
+    base = construire_graphe(_perturber_cas(cas, _aleatoire_du_cas(cas)))
+    comparateur = ComparateurPERT(base, graphe_pert)
+    comparateur.comparer()
+    return _resultats_calculateur(comparateur.calc_nouveau)
+
+
+@enregistrer_moteur("instantane")
+def moteur_instantane(graphe_pert) -> dict:
+    """Tableaux figes de l'InstantaneAnalyse"""
+    calc = CalculateurPERT(graphe_pert)
+    instantane = calc.obtenir_instantane()
+    resultats = {
+        champ: dict(zip(instantane.taches, tableau.tolist()))
+        for champ, tableau in (
+            ("ES", instantane.es),
+            ("EF", instantane.ef),
+            ("LS", instantane.ls),
+            ("LF", instantane.lf),
+            ("marge", instantane.marges),
+            ("marge_libre", instantane.marges_libres),
+        )
+    }
+    resultats["critiques"] = set(instantane.taches_critiques())
+    return resultats
+
+
+@enregistrer_moteur("vectorise")
+def moteur_vectorise(graphe_pert) -> dict:
+    """Dates au plus tard par decomposition LF = min(T - Q, L) (numpy)"""
+    calc = CalculateurPERT(graphe_pert)
+    calc.calculer_dates_au_plus_tot()
+    dates = calc.calculer_debuts_au_plus_tard([calc.duree_totale])
+    durees = {t: graphe_pert.graphe.nodes[t]["duree"] for t in dates["taches"]}
+    ls = {t: dates["LS"][i, 0].item() for i, t in enumerate(dates["taches"])}
+    marges = {t: dates["marges"][i, 0].item() for i, t in enumerate(dates["taches"])}
+    marge_critique = min(marges.values(), default=0)
+    return {
+        "LS": ls,
+        "LF": {t: ls[t] + durees[t] for t in ls},
+        "marge": marges,
+        "critiques": {t for t, marge in marges.items() if marge == marge_critique},
+    }
+
+
+@enregistrer_moteur("sous_pipeline")
+def moteur_sous_pipeline(graphe_pert) -> dict:
+    """Sous-pipeline des descendants de taches tirees au hasard (bitsets)"""
+    cas = extraire_cas(graphe_pert)
+    aleatoire = _aleatoire_du_cas(cas)
+    codes = [code for code, _, _, _ in cas]
+    taches = aleatoire.sample(codes, aleatoire.randint(1, len(codes)))
+
+    index = IndexAccessibilite(graphe_pert)
+    resultats = _resultats_calculateur(index.analyser_sous_pipeline(taches))
+
+    # Reference: sous-graphe induit des descendants, calcule avec networkx
+    graphe = graphe_pert.graphe
+    gardees = set(taches).union(*(nx.descendants(graphe, t) for t in taches))
+    resultats["graphe"] = construire_graphe(
+        [
+            (code, duree, [r for r in relations if r[0] in gardees], echeance)
+            for code, duree, relations, echeance in cas
+            if code in gardees
+        ]
+    )
+    return resultats
+
+
+@enregistrer_moteur("reduction_transitive")
+def moteur_reduction_transitive(graphe_pert) -> dict:
+    """Analyse apres retrait des arcs redondants"""
+    reduit = construire_graphe(extraire_cas(graphe_pert))
+    reduit.reduire_arcs_redondants()
+    calc = CalculateurPERT(reduit)
+    calc.executer_analyse_complete()
+    return _resultats_calculateur(calc)
+
+
+def extraire_cas(graphe_pert) -> list[tuple]:
+    """
+    Convertit un GraphePERT en liste
+    [(code, duree, [(pred, type, decalage)], echeance)] en ordre topologique
+    (forme manipulee par la reduction des cas)
+    """
+    graphe = graphe_pert.graphe
+    ordre = list(nx.topological_sort(graphe))
+    return [
+        (
+            tache,
+            graphe.nodes[tache]["duree"],
+            [
+                (pred, arc.get("type", "FS"), arc.get("decalage", 0))
+                for pred, arc in graphe.pred[tache].items()
+            ],
+            graphe.nodes[tache].get("echeance"),
+        )
+        for tache in ordre
+    ]
+
+
+def construire_graphe(cas: list[tuple]) -> GraphePERT:
+    """
+    Construit un GraphePERT depuis une liste [(code, duree, relations, echeance)]
+    """
+    graphe = GraphePERT()
+    for code, duree, relations, echeance in cas:
+        graphe.ajouter_tache(code, code, duree, relations, echeance=echeance)
+    return graphe
+
+
+def generer_dag(forme: str, nb_taches: int, graine: int = 0) -> GraphePERT:
+    """
+    Genere un DAG aleatoire d'une forme donnee
+
+    Args:
+        forme: 'chaine', 'eventail' (une source, des branches paralleles, un
+            puits), 'aleatoire' (peu dense, predecesseurs proches), 'dense',
+            'relations_typees' (FS/SS/FF/SF avec decalages) ou 'echeances'
+            (comme 'aleatoire', avec des jalons tenables ou intenables)
+        nb_taches: Nombre de taches
+        graine: Graine du generateur aleatoire
+
+    Returns:
+        GraphePERT genere
+    """
+    if forme not in FORMES:
+        raise ValueError(f"Forme inconnue: {forme} (attendu: {', '.join(FORMES)})")
+
+    aleatoire = random.Random(graine)
+    cas = []
+    for i in range(nb_taches):
+        duree = aleatoire.randint(0, 20)
+        if i == 0:
+            predecesseurs = []
+        elif forme == "chaine":
+            predecesseurs = [i - 1]
+        elif forme == "eventail":
+            predecesseurs = [0] if i < nb_taches - 1 else list(range(1, i)) or [0]
+        elif forme == "dense":
+            predecesseurs = aleatoire.sample(range(i), aleatoire.randint(1, i))
+        else:
+            nb = aleatoire.randint(1, min(3, i))
+            predecesseurs = aleatoire.sample(range(max(0, i - 10), i), nb)
+
+        relations = []
+        for j in sorted(predecesseurs):
+            if forme == "relations_typees" and aleatoire.random() < 0.5:
+                relations.append(
+                    (
+                        f"T{j}",
+                        aleatoire.choice(TYPES_RELATIONS),
+                        aleatoire.randint(-3, 5),
+                    )
+                )
+            else:
+                relations.append((f"T{j}", "FS", 0))
+
+        echeance = None
+        if forme == "echeances" and aleatoire.random() < 0.3:
+            echeance = aleatoire.randint(0, 10 * (i + 2))
+        cas.append((f"T{i}", duree, relations, echeance))
+
+    return construire_graphe(cas)
+
+
+def comparer_resultats(reference: dict, resultats: dict) -> list[str]:
+    """
+    Liste les differences entre les resultats d'un moteur et la reference
+
+    Seuls les champs fournis par le moteur sont compares.
+    """
+    differences = []
+    for champ in CHAMPS:
+        if champ not in resultats:
+            continue
+        if champ == "critiques":
+            if resultats[champ] != reference[champ]:
+                differences.append(
+                    f"critiques: {sorted(reference[champ])} != "
+                    f"{sorted(resultats[champ])}"
+                )
+            continue
+        for tache, valeur in reference[champ].items():
+            if resultats[champ].get(tache) != valeur:
+                differences.append(
+                    f"{champ}[{tache}]: {valeur} != {resultats[champ].get(tache)}"
+                )
+    return differences
+
+
+class VerificateurMoteurs:
+    """
+    Classe pour verifier que des moteurs de calcul PERT donnent les memes
+    resultats que la reference, sur des DAG aleatoires
+
+    Un cas en echec est reduit (suppression de taches et d'arcs, durees
+    ramenees a 0 ou 1) tant que l'echec persiste, pour ne rapporter qu'un
+    contre-exemple minimal. Les temps de calcul sont cumules par moteur.
+    """
+
+    def __init__(self, moteurs: dict | None = None, reference: str = "reference"):
+        """
+        Args:
+            moteurs: Dictionnaire {nom: fonction} (par defaut: MOTEURS)
+            reference: Nom du moteur de reference
+        """
+        self.moteurs = dict(MOTEURS if moteurs is None else moteurs)
+        self.reference = reference
+        if reference not in self.moteurs:
+            raise ValueError(f"Moteur de reference absent: {reference}")
+
+    def _differences(self, nom: str, cas: list[tuple]) -> list[str]:
+        """
+        Differences du moteur `nom` avec la reference sur un cas (une
+        exception du moteur compte comme une difference)
+        """
+        graphe = construire_graphe(cas)
+        reference = self.moteurs[self.reference](graphe)
+        try:
+            resultats = self.moteurs[nom](graphe)
+        except Exception as erreur:
+            return [f"exception: {erreur!r}"]
+        return self._comparer(reference, resultats)
+
+    def _comparer(self, reference: dict, resultats: dict) -> list[str]:
+        """
+        Compare a la reference, recalculee sur le graphe du moteur s'il n'a
+        analyse qu'une partie du graphe
+        """
+        if "graphe" in resultats:
+            reference = self.moteurs[self.reference](resultats["graphe"])
+        return comparer_resultats(reference, resultats)
+
+    def reduire_cas(self, nom: str, cas: list[tuple]) -> list[tuple]:
+        """
+        Reduit un cas en echec pour le moteur `nom` tant qu'il echoue
+
+        Args:
+            nom: Nom du moteur en echec
+            cas: Cas [(code, duree, relations, echeance)] en ordre topologique
+
+        Returns:
+            Cas reduit, toujours en echec
+        """
+        ameliore = True
+        while ameliore:
+            ameliore = False
+            for candidat in self._candidats(cas):
+                if self._differences(nom, candidat):
+                    cas = candidat
+                    ameliore = True
+                    break
+        return cas
+
+    @staticmethod
+    def _candidats(cas: list[tuple]):
+        """
+        Genere les simplifications d'un cas, des plus fortes aux plus fines
+        """
+        # Retirer une tache (et les arcs qui la touchent), sans vider le graphe
+        for i in range(len(cas) if len(cas) > 1 else 0):
+            code = cas[i][0]
+            yield [
+                (autre, duree, [r for r in relations if r[0] != code], echeance)
+                for autre, duree, relations, echeance in cas[:i] + cas[i + 1 :]
+            ]
+
+        # Retirer un arc, puis une echeance
+        for i, (code, duree, relations, echeance) in enumerate(cas):
+            for j in range(len(relations)):
+                yield (
+                    cas[:i]
+                    + [(code, duree, relations[:j] + relations[j + 1 :], echeance)]
+                    + cas[i + 1 :]
+                )
+            if echeance is not None:
+                yield cas[:i] + [(code, duree, relations, None)] + cas[i + 1 :]
+
+        # Simplifier une duree, puis une relation en FS sans decalage
+        for i, (code, duree, relations, echeance) in enumerate(cas):
+            for simple in (0, 1):
+                if duree > simple:
+                    yield cas[:i] + [(code, simple, relations, echeance)] + cas[i + 1 :]
+            for j, (pred, type_relation, decalage) in enumerate(relations):
+                if (type_relation, decalage) != ("FS", 0):
+                    nouvelles = copy.copy(relations)
+                    nouvelles[j] = (pred, "FS", 0)
+                    yield cas[:i] + [(code, duree, nouvelles, echeance)] + cas[i + 1 :]
+
+    def verifier(
+        self,
+        formes=FORMES,
+        tailles=(1, 2, 5, 20, 100),
+        nb_graines: int = 5,
+        graine: int = 0,
+    ) -> dict:
+        """
+        Execute tous les moteurs sur des DAG generes et compare a la reference
+
+        Args:
+            formes: Formes de DAG (voir generer_dag)
+            tailles: Nombres de taches
+            nb_graines: Nombre de graphes par forme et par taille
+            graine: Graine de depart
+
+        Returns:
+            Dictionnaire {'nb_cas', 'echecs', 'debits'} ou echecs est une liste
+            de {'moteur', 'forme', 'taille', 'graine', 'cas', 'differences'}
+            (cas reduit) et debits {moteur: {'taches', 'secondes',
+            'taches_par_seconde'}}
+        """
+        echecs = []
+        debits = {nom: {"taches": 0, "secondes": 0.0} for nom in self.moteurs}
+        nb_cas = 0
+
+        for forme in formes:
+            for taille in tailles:
+                for decalage_graine in range(nb_graines):
+                    graine_cas = graine + decalage_graine
+                    graphe = generer_dag(forme, taille, graine_cas)
+                    nb_cas += 1
+
+                    resultats = {}
+                    for nom, moteur in self.moteurs.items():
+                        debut = time.perf_counter()
+                        try:
+                            resultats[nom] = moteur(graphe)
+                        except Exception as erreur:
+                            resultats[nom] = erreur
+                        debits[nom]["secondes"] += time.perf_counter() - debut
+                        debits[nom]["taches"] += taille
+
+                    reference = resultats[self.reference]
+                    for nom, resultat in resultats.items():
+                        if nom == self.reference:
+                            continue
+                        if isinstance(resultat, Exception):
+                            differences = [f"exception: {resultat!r}"]
+                        else:
+                            differences = self._comparer(reference, resultat)
+                        if not differences:
+                            continue
+
+                        cas = self.reduire_cas(nom, extraire_cas(graphe))
+                        echecs.append(
+                            {
+                                "moteur": nom,
+                                "forme": forme,
+                                "taille": taille,
+                                "graine": graine_cas,
+                                "cas": cas,
+                                "differences": self._differences(nom, cas),
+                            }
+                        )
+
+        for debit in debits.values():
+            debit["taches_par_seconde"] = (
+                debit["taches"] / debit["secondes"] if debit["secondes"] else 0.0
+            )
+
+        return {"nb_cas": nb_cas, "echecs": echecs, "debits": debits}
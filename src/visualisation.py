@@ -3,6 +3,7 @@ import networkx as nx
 from matplotlib.patches import Patch
 
 
+from src.concurrency import AnalyseurConcurrence
 from src.graph_builder import GraphePERT
 from src.pert_calculator import CalculateurPERT
 
@@ -27,12 +28,13 @@ class VisualisateurPERT:
             noeuds_par_niveau.setdefault(niveau, []).append(node)
 
         # Positionner
-        resultats = self.calc.executer_analyse_complete()
-        dates_tot = resultats["dates_tot"]
+        # (dernier instantane publie: pas de recalcul de l'analyse)
+        instantane = self.calc.obtenir_instantane()
         pos = {}
         for niveau, noeuds in noeuds_par_niveau.items():
             for i, node in enumerate(sorted(noeuds)):
-                x = (dates_tot[node]["ES"] + dates_tot[node]["EF"]) / 2
+                j = instantane.index[node]
+                x = (instantane.es[j] + instantane.ef[j]) / 2
                 y = (i - (len(noeuds) - 1) / 2) * 2.5
                 pos[node] = (x, y)
 
@@ -41,9 +43,11 @@ class VisualisateurPERT:
     def dessiner_pert(self, fichier_sortie="../rapport/figures/graphe_pert.png"):
         """Génère le graphe PERT circulaire avec chemin critique et labels [ES-EF]."""
         fig, ax = plt.subplots(figsize=(16, 9))
+        # Positions d'abord: l'instantane peut lancer l'analyse et remplacer
+        # les dictionnaires de resultats
+        pos = self._calculer_positions()
         chemin = self.calc.chemin_critique
         dates_tot = self.calc.dates_tot
-        pos = self._calculer_positions()
 
         # Dessin des Arcs
         arcs_critiques = [(chemin[i], chemin[i + 1]) for i in range(len(chemin) - 1)]
@@ -121,8 +125,15 @@ class VisualisateurPERT:
             plt.savefig(fichier_sortie, dpi=300)
         plt.show()
 
-    def dessiner_gantt(self, fichier_sortie="../rapport/figures/graphe_gantt.png"):
-        """Génère le diagramme de Gantt avec les marges hachurées."""
+    def dessiner_gantt(
+        self,
+        fichier_sortie="../rapport/figures/graphe_gantt.png",
+        afficher_concurrence=False,
+    ):
+        """Génère le diagramme de Gantt avec les marges hachurées.
+
+        Avec afficher_concurrence, superpose le nombre de jobs simultanés (ES/EF).
+        """
         fig, ax = plt.subplots(figsize=(14, 8))
         taches = list(nx.topological_sort(self.graphe))
         taches.reverse()
@@ -131,7 +142,7 @@ class VisualisateurPERT:
             es = self.calc.dates_tot[code]["ES"]
             ef = self.calc.dates_tot[code]["EF"]
             marge = self.calc.marges[code]
-            est_critique = marge == 0
+            est_critique = self.calc.est_critique(code)
 
             # Barre de la tâche
             ax.barh(
@@ -174,6 +185,23 @@ class VisualisateurPERT:
         )
         ax.grid(axis="x", linestyle="--", alpha=0.5)
 
+        # Courbe de concurrence sur un axe secondaire
+        if afficher_concurrence:
+            profil = AnalyseurConcurrence(self.calc).calculer_profil()
+            ax2 = ax.twinx()
+            ax2.step(
+                profil["temps"],
+                profil["nombre"],
+                where="post",
+                color="darkgreen",
+                linewidth=1.5,
+                alpha=0.7,
+            )
+            ax2.set_ylabel(
+                f"Jobs simultanés (pic: {profil['pic']})", color="darkgreen"
+            )
+            ax2.set_ylim(0, profil["pic"] + 1)
+
         plt.tight_layout()
         if fichier_sortie:
             plt.savefig(fichier_sortie, dpi=300)
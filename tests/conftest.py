@@ -0,0 +1,35 @@
+import pytest
+import tempfile
+import os
+
+from src.graph_builder import GraphePERT
+
+# Pipeline CI/CD de reference (duree totale 64, chemin critique A-B-F-H-I)
+CSV_CICD = """code,nom,duree,predecesseurs
+A,Git Checkout,2,
+B,Compile Backend,15,A
+C,Compile Frontend,10,A
+D,Unit Tests Back,8,B
+E,Unit Tests Front,5,C
+F,Build Docker Image,12,"B,C"
+G,Security Scan (SAST),20,A
+H,Integration Tests,25,"D,E,F"
+I,Deploy to Prod,10,"G,H"
+"""
+
+
+@pytest.fixture
+def fichier_cicd():
+    """Fixture: fichier CSV du pipeline CI/CD"""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+        f.write(CSV_CICD)
+        temp_path = f.name
+
+    yield temp_path
+    os.unlink(temp_path)
+
+
+@pytest.fixture
+def graphe_cicd(fichier_cicd):
+    """Fixture: graphe complet du pipeline CI/CD"""
+    return GraphePERT(fichier_cicd)
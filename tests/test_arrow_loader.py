@@ -0,0 +1,149 @@
+import pytest
+import tempfile
+import os
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from src.graph_builder import GraphePERT
+from src.pert_calculator import CalculateurPERT
+
+
+class TestChargementArrow:
+    """Tests pour le chargement Parquet/Arrow de GraphePERT"""
+
+    @pytest.fixture
+    def table_cicd(self):
+        """Fixture: pipeline CI/CD avec une colonne de listes de predecesseurs"""
+        return pa.table(
+            {
+                "code": list("ABCDEFGHI"),
+                "nom": [
+                    "Git Checkout",
+                    "Compile Backend",
+                    "Compile Frontend",
+                    "Unit Tests Back",
+                    "Unit Tests Front",
+                    "Build Docker Image",
+                    "Security Scan (SAST)",
+                    "Integration Tests",
+                    "Deploy to Prod",
+                ],
+                "duree": [2, 15, 10, 8, 5, 12, 20, 25, 10],
+                "predecesseurs": [
+                    None,
+                    ["A"],
+                    ["A"],
+                    ["B"],
+                    ["C"],
+                    ["B", "C"],
+                    ["A"],
+                    ["D", "E", "F"],
+                    ["G", "H"],
+                ],
+                "proprietaire": ["equipe"] * 9,
+            }
+        )
+
+    @pytest.fixture
+    def dossier(self):
+        """Fixture: dossier temporaire"""
+        with tempfile.TemporaryDirectory() as chemin:
+            yield chemin
+
+    def test_charger_parquet(self, table_cicd, dossier):
+        """Test de chargement d'un fichier Parquet"""
+        chemin = os.path.join(dossier, "taches.parquet")
+        pq.write_table(table_cicd, chemin)
+
+        graphe = GraphePERT()
+        graphe.charger_arrow(chemin)
+
+        assert len(graphe.taches) == 9
+        assert graphe.taches["A"]["predecesseurs"] == []
+        assert graphe.taches["H"]["predecesseurs"] == ["D", "E", "F"]
+        assert graphe.graphe.number_of_edges() == 12
+        assert graphe.graphe.nodes["B"] == {"duree": 15, "nom": "Compile Backend"}
+
+        calc = CalculateurPERT(graphe)
+        calc.executer_analyse_complete()
+        assert calc.duree_totale == 64
+        assert calc.chemin_critique == ["A", "B", "F", "H", "I"]
+
+    def test_charger_arrow_ipc(self, table_cicd, dossier):
+        """Test de chargement d'un fichier Arrow IPC en memory map"""
+        chemin = os.path.join(dossier, "taches.arrow")
+        with pa.OSFile(chemin, "wb") as sortie:
+            with pa.ipc.new_file(sortie, table_cicd.schema) as ecrivain:
+                ecrivain.write_table(table_cicd)
+
+        graphe = GraphePERT()
+        graphe.charger_arrow(chemin)
+
+        assert set(graphe.taches["I"]["predecesseurs"]) == {"G", "H"}
+        assert graphe.graphe.number_of_edges() == 12
+
+    def test_projection_colonnes(self, table_cicd, dossier):
+        """Test que seules les colonnes utiles sont lues"""
+        from src.arrow_loader import lire_table_taches
+
+        chemin = os.path.join(dossier, "taches.parquet")
+        pq.write_table(table_cicd, chemin)
+
+        table = lire_table_taches(chemin)
+        assert "proprietaire" not in table.column_names
+
+    def test_colonnes_renommees(self):
+        """Test avec des noms de colonnes personnalises et sans nom"""
+        table = pa.table({"job": ["A", "B"], "minutes": [3, 4], "needs": [[], ["A"]]})
+        graphe = GraphePERT()
+        graphe.charger_arrow(
+            table, {"code": "job", "duree": "minutes", "predecesseurs": "needs"}
+        )
+
+        assert graphe.taches["B"] == {"nom": "B", "duree": 4, "predecesseurs": ["A"]}
+        assert graphe.graphe.has_edge("A", "B")
+
+    def test_predecesseurs_texte_et_relations(self):
+        """Test d'une colonne texte au format CSV avec relation typee"""
+        table = pa.table(
+            {
+                "code": ["A", "B", "C"],
+                "duree": [10, 4, 6],
+                "predecesseurs": [None, "", "A:SS+2, B"],
+            }
+        )
+        graphe = GraphePERT()
+        graphe.charger_arrow(table)
+
+        assert graphe.taches["B"]["predecesseurs"] == []
+        assert graphe.taches["C"]["predecesseurs"] == ["A", "B"]
+        assert graphe.graphe.edges["A", "C"] == {"type": "SS", "decalage": 2}
+        assert graphe.graphe.edges["B", "C"] == {"type": "FS", "decalage": 0}
+
+    def test_predecesseurs_liste_avec_nuls(self):
+        """Test qu'un element nul dans une liste de predecesseurs est ignore"""
+        table = pa.table(
+            {
+                "code": ["A", "B", "C"],
+                "duree": [10, 4, 6],
+                "predecesseurs": [None, [None], ["A", None, "B"]],
+            }
+        )
+        graphe = GraphePERT()
+        graphe.charger_arrow(table)
+
+        assert graphe.taches["B"]["predecesseurs"] == []
+        assert graphe.taches["C"]["predecesseurs"] == ["A", "B"]
+
+    def test_duree_manquante(self):
+        """Test qu'une duree nulle leve une erreur au lieu d'etre convertie"""
+        table = pa.table({"code": ["A", "B"], "duree": [10, None]})
+        graphe = GraphePERT()
+
+        with pytest.raises(ValueError, match="Duree manquante pour B"):
+            graphe.charger_arrow(table)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
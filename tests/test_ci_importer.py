@@ -0,0 +1,176 @@
+import pytest
+import os
+import tempfile
+from pathlib import Path
+
+pytest.importorskip("yaml")
+
+from src.ci_importer import ImportateurCI, analyser_workflow
+from src.pert_calculator import CalculateurPERT
+
+WORKFLOW_GITHUB = """
+name: CI
+on: [push]
+jobs:
+  checkout:
+    runs-on: ubuntu-latest
+  build:
+    needs: checkout
+    strategy:
+      matrix:
+        os: [linux, windows]
+        python: ["3.11", "3.12"]
+        exclude:
+          - os: windows
+            python: "3.11"
+        include:
+          - os: macos
+            python: "3.12"
+  deploy:
+    needs: [build]
+"""
+
+GITLAB_CI = """
+stages: [build, test, deploy]
+variables:
+  GIT_DEPTH: 1
+.template:
+  image: python
+prepare:
+  stage: .pre
+compile:
+  stage: build
+lint:
+  stage: build
+unit:
+  stage: test
+  parallel: 2
+e2e:
+  stage: test
+  needs: [compile]
+  parallel:
+    matrix:
+      - BROWSER: [firefox, chrome]
+release:
+  stage: deploy
+  needs:
+    - job: unit
+    - job: docs
+      optional: true
+    - project: group/schemas
+      job: generate
+      ref: main
+      artifacts: true
+    - pipeline: $PARENT_PIPELINE_ID
+      job: prepare
+pages:
+  stage: deploy
+  needs: [compile]
+"""
+
+
+class TestImportateurCI:
+    """Tests pour l'import de workflows CI"""
+
+    @pytest.fixture
+    def depot(self):
+        """Fixture: monorepo avec deux workflows GitHub et un GitLab CI"""
+        with tempfile.TemporaryDirectory() as racine:
+            for service in ("api", "web"):
+                dossier = Path(racine, service, ".github", "workflows")
+                dossier.mkdir(parents=True)
+                (dossier / "ci.yml").write_text(WORKFLOW_GITHUB)
+            Path(racine, ".gitlab-ci.yml").write_text(GITLAB_CI)
+            yield racine
+
+    def test_analyser_workflow_github_matrice(self):
+        """Test de l'expansion d'une matrice GitHub Actions"""
+        jobs = analyser_workflow(WORKFLOW_GITHUB)
+        cellules = [cellule for job, cellule, _ in jobs if job == "build"]
+
+        assert cellules == [
+            "build (linux, 3.11)",
+            "build (linux, 3.12)",
+            "build (windows, 3.12)",
+            "build (macos, 3.12)",
+        ]
+
+    def test_charger_fichier_github(self, depot):
+        """Test de construction du graphe avec durees d'une table annexe"""
+        importateur = ImportateurCI(
+            durees={"checkout": 1, "build": 10, "build (windows, 3.12)": 15},
+            duree_defaut=3,
+        )
+        graphe = importateur.charger_fichier(
+            os.path.join(depot, "api", ".github", "workflows", "ci.yml")
+        )
+
+        assert len(graphe.taches) == 6
+        # deploy attend toutes les cellules de la matrice build
+        assert len(graphe.taches["deploy"]["predecesseurs"]) == 4
+        assert graphe.taches["build (linux, 3.11)"]["predecesseurs"] == ["checkout"]
+
+        calc = CalculateurPERT(graphe)
+        calc.executer_analyse_complete()
+        assert calc.duree_totale == 1 + 15 + 3
+        assert calc.chemin_critique == ["checkout", "build (windows, 3.12)", "deploy"]
+
+    def test_charger_fichier_gitlab(self, depot):
+        """Test des stages, needs et parallel d'un .gitlab-ci.yml"""
+        graphe = ImportateurCI().charger_fichier(os.path.join(depot, ".gitlab-ci.yml"))
+
+        assert ".template" not in graphe.taches
+        assert "variables" not in graphe.taches
+        assert set(graphe.taches["unit 1/2"]["predecesseurs"]) == {"compile", "lint"}
+        assert graphe.taches["e2e: [chrome]"]["predecesseurs"] == ["compile"]
+        assert graphe.taches["release"]["predecesseurs"] == ["unit 1/2", "unit 2/2"]
+        assert graphe.taches["pages"]["predecesseurs"] == ["compile"]
+        # .pre existe sans etre declare et precede le premier stage
+        assert graphe.taches["prepare"]["predecesseurs"] == []
+        assert graphe.taches["compile"]["predecesseurs"] == ["prepare"]
+
+    def test_stage_non_declare(self):
+        """Test d'un job dont le stage n'est pas dans 'stages'"""
+        with pytest.raises(ValueError, match="stage non declare 'qa'"):
+            analyser_workflow(GITLAB_CI + "smoke:\n  stage: qa\n")
+
+    def test_besoin_inconnu(self):
+        """Test d'un needs vers un job inexistant"""
+        importateur = ImportateurCI()
+        with pytest.raises(ValueError):
+            importateur.construire_graphe(analyser_workflow("jobs: {a: {needs: b}}"))
+
+    def test_scanner_depot(self, depot):
+        """Test du scan d'un monorepo"""
+        graphes = ImportateurCI(nb_processus=2).scanner(depot)
+
+        assert len(graphes) == 3
+        assert all(len(g.taches) >= 6 for g in graphes.values())
+
+    def test_cache_par_mtime_et_empreinte(self, depot):
+        """Test que seuls les fichiers modifies sont re-analyses"""
+        fichier_cache = os.path.join(depot, "cache.json")
+        importateur = ImportateurCI(fichier_cache=fichier_cache, nb_processus=1)
+        importateur.scanner(depot)
+        assert os.path.exists(fichier_cache)
+
+        # Nouveau processus: cache recharge depuis le disque
+        importateur = ImportateurCI(fichier_cache=fichier_cache, nb_processus=1)
+        chemin = os.path.join(depot, "web", ".github", "workflows", "ci.yml")
+        empreinte = importateur.cache[chemin]["empreinte"]
+
+        # Contenu identique mais mtime modifiee: empreinte reutilisee
+        os.utime(chemin, ns=(0, 0))
+        importateur.cache[chemin]["jobs"] = [["seul", "seul", []]]
+        assert list(importateur.scanner(depot)[chemin].taches) == ["seul"]
+        assert importateur.cache[chemin]["mtime"] == 0
+
+        # Contenu modifie: nouvelle analyse
+        Path(chemin).write_text(WORKFLOW_GITHUB.replace("deploy", "publish"))
+        graphes = importateur.scanner(depot)
+        assert "publish" in graphes[chemin].taches
+        assert importateur.cache[chemin]["empreinte"] != empreinte
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,73 @@
+import pytest
+
+import numpy as np
+
+from src.concurrency import AnalyseurConcurrence, profil_depuis_intervalles
+from src.graph_builder import GraphePERT
+from src.pert_calculator import CalculateurPERT
+
+
+class TestAnalyseurConcurrence:
+    """Tests pour le profil de concurrence"""
+
+    @pytest.fixture
+    def calc_cicd(self, fichier_cicd):
+        """Fixture: pipeline CI/CD analyse"""
+        calc = CalculateurPERT(GraphePERT(fichier_cicd))
+        calc.executer_analyse_complete()
+        return calc
+
+    def test_profil_intervalles(self):
+        """Test du balayage sur des intervalles simples"""
+        profil = profil_depuis_intervalles([0, 2, 5, 5], [4, 6, 5, 8])
+
+        assert profil["temps"].tolist() == [0, 2, 4, 5, 6, 8]
+        assert profil["nombre"].tolist() == [1, 2, 1, 2, 1, 0]
+        assert profil["pic"] == 2
+        assert profil["fenetre_pic"] == (2, 4)
+        assert profil["aire"] == 4 + 4 + 3
+
+    def test_fin_et_debut_simultanes(self):
+        """Test qu'une fin et un debut au meme instant ne se chevauchent pas"""
+        profil = profil_depuis_intervalles([0, 3], [3, 6])
+        assert profil["pic"] == 1
+
+    def test_profil_cicd(self, calc_cicd):
+        """Test du profil au plus tot du pipeline CI/CD"""
+        profil = AnalyseurConcurrence(calc_cicd).calculer_profil()
+
+        # B, C et G tournent en parallele de 2 a 12
+        assert profil["pic"] == 3
+        assert profil["fenetre_pic"] == (2, 22)
+        assert profil["aire"] == sum(
+            calc_cicd.graphe.nodes[t]["duree"] for t in calc_cicd.graphe.nodes()
+        )
+        assert isinstance(profil["nombre"], np.ndarray)
+
+    def test_profil_au_plus_tard(self, calc_cicd):
+        """Test du profil au plus tard (LS/LF)"""
+        profil = AnalyseurConcurrence(calc_cicd).calculer_profil("tard")
+
+        assert profil["temps"][-1] == 64
+        assert profil["nombre"][-1] == 0
+
+        with pytest.raises(ValueError):
+            AnalyseurConcurrence(calc_cicd).calculer_profil("autre")
+
+    def test_profil_lot(self, fichier_cicd, calc_cicd):
+        """Test du profil cumule de plusieurs plannings"""
+        profil = AnalyseurConcurrence.calculer_profil_lot([fichier_cicd, calc_cicd])
+
+        assert profil["pics"] == [3, 3]
+        assert profil["pic"] == 6
+        assert profil["aire"] == 2 * 107
+
+        decale = AnalyseurConcurrence.calculer_profil_lot(
+            [fichier_cicd, calc_cicd], decalages=[0, 64]
+        )
+        assert decale["pic"] == 3
+        assert decale["temps"][-1] == 128
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
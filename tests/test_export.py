@@ -0,0 +1,105 @@
+import io
+import json
+import os
+import tempfile
+
+import networkx as nx
+import pytest
+
+from src.export import ExportateurPERT
+from src.graph_builder import GraphePERT
+from src.pert_calculator import CalculateurPERT
+
+
+class TestExportateurPERT:
+    """Tests pour les exports DOT, GraphML et JSON"""
+
+    @pytest.fixture
+    def calc_parallele(self):
+        """Fixture: graphe avec taches paralleles, analyse executee"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Start", 5)
+        graphe.ajouter_tache("B", 'Branch "1"', 10, ["A"])
+        graphe.ajouter_tache("C", "Branch <2> & co", 15, ["A"])
+        graphe.ajouter_tache("D", "End", 8, ["B", ("C", "FS", 0)])
+        calc = CalculateurPERT(graphe)
+        calc.executer_analyse_complete()
+        return calc
+
+    def test_exporter_graphml(self, calc_parallele):
+        """Le GraphML se relit avec networkx et conserve les attributs"""
+        with tempfile.NamedTemporaryFile(suffix=".graphml", delete=False) as f:
+            temp_path = f.name
+
+        try:
+            ExportateurPERT(calc_parallele).exporter_graphml(temp_path)
+            graphe = nx.read_graphml(temp_path)
+        finally:
+            os.unlink(temp_path)
+
+        assert set(graphe.edges()) == set(calc_parallele.graphe.edges())
+        assert graphe.nodes["C"]["nom"] == "Branch <2> & co"
+        assert graphe.nodes["B"]["LS"] == 10
+        assert graphe.nodes["B"]["marge"] == 5
+        assert graphe.nodes["C"]["critique"] is True
+        assert graphe.edges["C", "D"]["critique"] is True
+        assert graphe.edges["B", "D"]["critique"] is False
+        assert graphe.edges["A", "B"]["type"] == "FS"
+
+    def test_exporter_json(self, calc_parallele):
+        """Le JSON liste les taches puis les arcs en ordre topologique"""
+        sortie = io.StringIO()
+        ExportateurPERT(calc_parallele).exporter_json(sortie)
+        donnees = json.loads(sortie.getvalue())
+
+        assert donnees["duree_totale"] == 28
+        assert donnees["chemin_critique"] == ["A", "C", "D"]
+        assert [t["code"] for t in donnees["taches"]][0] == "A"
+        assert donnees["taches"][-1] == {
+            "code": "D",
+            "nom": "End",
+            "duree": 8,
+            "ES": 20,
+            "EF": 28,
+            "LS": 20,
+            "LF": 28,
+            "marge": 0,
+            "marge_libre": 0,
+            "critique": True,
+        }
+        arcs = {(a["source"], a["cible"]): a["critique"] for a in donnees["arcs"]}
+        assert arcs == {
+            ("A", "B"): False,
+            ("A", "C"): True,
+            ("B", "D"): False,
+            ("C", "D"): True,
+        }
+
+    def test_exporter_dot(self, calc_parallele):
+        """Le DOT declare chaque tache avant ses arcs entrants"""
+        sortie = io.StringIO()
+        ExportateurPERT(calc_parallele).exporter_dot(sortie)
+        lignes = sortie.getvalue().splitlines()
+
+        assert lignes[0] == "digraph PERT {"
+        assert lignes[-1] == "}"
+        assert any('Branch \\"1\\"' in ligne for ligne in lignes)
+
+        declarations = [i for i, l in enumerate(lignes) if l.startswith('  "D" [')]
+        arcs = [i for i, l in enumerate(lignes) if '-> "D"' in l]
+        assert len(declarations) == 1 and len(arcs) == 2
+        assert all(i > declarations[0] for i in arcs)
+        assert 'color="red"' in lignes[arcs[0]] or 'color="red"' in lignes[arcs[1]]
+
+    def test_analyse_executee_si_absente(self):
+        """L'exportateur lance l'analyse si elle n'a pas ete faite"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Seule", 3)
+        sortie = io.StringIO()
+        ExportateurPERT(CalculateurPERT(graphe)).exporter_json(sortie)
+
+        assert json.loads(sortie.getvalue())["duree_totale"] == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,87 @@
+import pytest
+
+from src.fusion import OptimiseurFusion
+from src.graph_builder import GraphePERT
+from src.pert_calculator import CalculateurPERT
+
+
+class TestOptimiseurFusion:
+    """Tests pour la recommandation de fusions de jobs"""
+
+    @pytest.fixture
+    def graphe_fusionnable(self):
+        """Fixture: une chaine critique et deux petits jobs paralleles"""
+        graphe = GraphePERT(surcout_job=2)
+        graphe.ajouter_tache("A", "Checkout", 5)
+        graphe.ajouter_tache("B", "Build", 10, ["A"])
+        graphe.ajouter_tache("C", "Package", 4, ["B"])
+        graphe.ajouter_tache("L", "Lint", 1, ["A"])
+        graphe.ajouter_tache("M", "Format", 1, ["A"])
+        graphe.ajouter_tache("D", "Deploy", 3, ["C", "L", "M"])
+        return graphe
+
+    def test_chaine_et_freres(self, graphe_fusionnable):
+        """La chaine raccourcit le planning, les freres economisent un runner"""
+        optimiseur = OptimiseurFusion(graphe_fusionnable)
+        resultats = optimiseur.proposer()
+
+        assert [f["taches"] for f in resultats["fusions"]] == [["B", "C"], ["L", "M"]]
+        assert [f["type"] for f in resultats["fusions"]] == ["chaine", "freres"]
+        assert resultats["fusions"][0]["duree"] == 16
+        assert resultats["fusions"][0]["gain_duree_totale"] == 2
+        assert resultats["duree_totale_avant"] == 30
+        assert resultats["duree_totale_apres"] == 28
+        assert resultats["minutes_runner_avant"] == 36
+        assert resultats["minutes_runner_apres"] == 32
+
+        # Le graphe d'origine n'est pas modifie
+        assert "B+C" not in graphe_fusionnable.graphe
+        fusionne = optimiseur.graphe_fusionne
+        assert fusionne.taches["D"]["predecesseurs"] == ["B+C", "L+M"]
+        assert fusionne.graphe.nodes["L+M"]["nom"] == "Lint + Format"
+
+    def test_dates_incrementales(self, graphe_fusionnable):
+        """Les dates mises a jour localement sont celles d'une analyse complete"""
+        optimiseur = OptimiseurFusion(graphe_fusionnable)
+        optimiseur.proposer()
+
+        calc = CalculateurPERT(optimiseur.graphe_fusionne)
+        calc.calculer_dates_au_plus_tot()
+        calc.calculer_dates_au_plus_tard()
+        assert optimiseur._calc.dates_tot == calc.dates_tot
+        assert optimiseur._calc.dates_tard == calc.dates_tard
+
+    def test_duree_max(self, graphe_fusionnable):
+        """Aucun job fusionne ne depasse la duree maximale"""
+        resultats = OptimiseurFusion(graphe_fusionnable, duree_max=15).proposer()
+
+        assert [f["taches"] for f in resultats["fusions"]] == [["L", "M"]]
+        assert resultats["duree_totale_apres"] == 30
+
+    def test_chemin_critique_preserve(self, fichier_cicd):
+        """Les freres sans marge suffisante ne sont pas fusionnes"""
+        graphe = GraphePERT(fichier_cicd, surcout_job=3)
+        resultats = OptimiseurFusion(graphe).proposer()
+
+        assert resultats["fusions"] == []
+        assert resultats["duree_totale_apres"] == resultats["duree_totale_avant"] == 79
+
+    def test_echeance_au_dela_de_la_fin(self):
+        """Une echeance tardive ne permet pas d'allonger la duree totale"""
+        graphe = GraphePERT(surcout_job=2)
+        graphe.ajouter_tache("A", "Build", 10)
+        graphe.ajouter_tache("B", "Publish", 6, ["A"], echeance=40)
+        graphe.ajouter_tache("C", "Notify", 6, ["A"], echeance=40)
+        resultats = OptimiseurFusion(graphe).proposer()
+
+        assert resultats["fusions"] == []
+        assert resultats["duree_totale_apres"] == resultats["duree_totale_avant"] == 20
+
+    def test_sans_surcout(self, graphe_fusionnable):
+        """Sans surcout de demarrage, aucune fusion n'a d'interet"""
+        graphe_fusionnable.surcout_job = 0
+        assert OptimiseurFusion(graphe_fusionnable).proposer()["fusions"] == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
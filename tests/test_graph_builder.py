@@ -3,7 +3,7 @@ import tempfile
 import os
 
 
-from src.graph_builder import GraphePERT
+from src.graph_builder import GraphePERT, analyser_relation
 
 
 class TestGraphePERT:
@@ -186,6 +186,193 @@ class TestGraphePERT:
         assert set(initiales) == {"A", "B"}
         assert set(finales) == {"D", "E"}
 
+    def test_ajouter_tache_relations_typees(self):
+        """Test d'ajout de relations typees avec decalage"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Deploy", 10)
+        graphe.ajouter_tache("B", "Logs", 4)
+        graphe.ajouter_tache("C", "Tests", 6, ["A:SS+2", ("B", "FF", 1)])
+
+        assert graphe.taches["C"]["predecesseurs"] == ["A", "B"]
+        assert graphe.graphe.edges["A", "C"] == {"type": "SS", "decalage": 2}
+        assert graphe.graphe.edges["B", "C"] == {"type": "FF", "decalage": 1}
+
+    def test_ajouter_tache_relation_par_defaut(self):
+        """Test qu'un code simple donne une relation FS sans decalage"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Tache A", 5)
+        graphe.ajouter_tache("B", "Tache B", 5, ["A"])
+
+        assert graphe.graphe.edges["A", "B"] == {"type": "FS", "decalage": 0}
+
+    def test_analyser_relation(self):
+        """Test de l'analyse de la syntaxe texte des relations"""
+        assert analyser_relation("A") == ("A", "FS", 0)
+        assert analyser_relation(" A:ss-3 ") == ("A", "SS", -3)
+        assert analyser_relation("B:FF") == ("B", "FF", 0)
+        # Un suffixe qui n'est pas une relation fait partie du code
+        assert analyser_relation("ns:job") == ("ns:job", "FS", 0)
+
+        with pytest.raises(ValueError):
+            analyser_relation(("A", "XX", 1))
+        # Un suffixe en forme de relation mais invalide est une erreur
+        for texte in ("A:SX+2", "A:SS+x", "A:XX-1", "A:FS 2"):
+            with pytest.raises(ValueError, match="Relation invalide"):
+                analyser_relation(texte)
+        # Les codes avec espace de noms de deux lettres restent des codes
+        for code in ("deploy:qa", "build:ui", "test:js", "lint:go"):
+            assert analyser_relation(code) == (code, "FS", 0)
+
+    def test_charger_donnees_csv_relations(self):
+        """Test de chargement de relations typees depuis un CSV"""
+        csv_content = """code,nom,duree,predecesseurs
+                A,Deploy,10,
+                B,Integration Tests,5,"A:SS+2"
+        """
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write(csv_content)
+            temp_path = f.name
+
+        try:
+            graphe = GraphePERT(temp_path)
+            assert graphe.taches["B"]["predecesseurs"] == ["A"]
+            assert graphe.graphe.edges["A", "B"] == {"type": "SS", "decalage": 2}
+        finally:
+            os.unlink(temp_path)
+
+    def test_reduire_arcs_redondants(self):
+        """Test de la reduction transitive: seuls les arcs FS sans decalage impliques sont retires"""
+        from src.pert_calculator import CalculateurPERT
+
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Build", 3)
+        graphe.ajouter_tache("B", "Test", 2, ["A"])
+        graphe.ajouter_tache("C", "Lint", 1, ["A", ("B", "FS", 0)])
+        graphe.ajouter_tache("D", "Deploy", 4, ["A", "B", "C"])
+        graphe.ajouter_tache("E", "Notify", 1, ["B", ("A", "FS", 5), ("C", "SS", 0)])
+
+        avant = CalculateurPERT(graphe)
+        avant.executer_analyse_complete()
+
+        assert graphe.reduire_arcs_redondants() == 3
+        assert set(graphe.graphe.edges()) == {
+            ("A", "B"),
+            ("B", "C"),
+            ("C", "D"),
+            ("A", "E"),
+            ("B", "E"),
+            ("C", "E"),
+        }
+        assert graphe.taches["D"]["predecesseurs"] == ["C"]
+
+        apres = CalculateurPERT(graphe)
+        apres.executer_analyse_complete()
+        assert apres.dates_tot == avant.dates_tot
+        assert apres.dates_tard == avant.dates_tard
+        assert apres.marges_libres == avant.marges_libres
+
+    def test_echeance_csv(self):
+        """Test du chargement de la colonne optionnelle echeance"""
+        csv_content = """code,nom,duree,predecesseurs,echeance
+                A,Build,10,,
+                B,Deploy,5,A,45
+        """
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write(csv_content)
+            temp_path = f.name
+
+        try:
+            graphe = GraphePERT(temp_path)
+            assert graphe.graphe.nodes["B"]["echeance"] == 45
+            assert "echeance" not in graphe.graphe.nodes["A"]
+
+            graphe.definir_echeance("B", None)
+            assert "echeance" not in graphe.taches["B"]
+        finally:
+            os.unlink(temp_path)
+
+    def test_surcout_job(self):
+        """Le surcout de demarrage s'ajoute a la duree de chaque job"""
+        graphe = GraphePERT(surcout_job=3)
+        graphe.ajouter_tache("A", "Build", 10)
+
+        assert graphe.graphe.nodes["A"]["duree"] == 13
+        assert graphe.taches["A"]["duree"] == 13
+
+    def test_fusionner_taches(self):
+        """Le job fusionne herite des relations et ne paie qu'un surcout"""
+        graphe = GraphePERT(surcout_job=2)
+        graphe.ajouter_tache("A", "Checkout", 3)
+        graphe.ajouter_tache("B", "Lint", 1, ["A"], durees_classes={"rapide": 0})
+        graphe.ajouter_tache("C", "Format", 2, [("A", "FS", 1)])
+        graphe.ajouter_tache("D", "Deploy", 4, ["B", "C"], echeance=30)
+
+        code = graphe.fusionner_taches(["B", "C"])
+
+        assert code == "B+C"
+        assert graphe.graphe.nodes[code]["duree"] == 3 + 4 - 2
+        assert graphe.graphe.nodes[code]["durees_classes"] == {"rapide": 2 + 4 - 2}
+        assert graphe.graphe.edges["A", code]["decalage"] == 1
+        assert set(graphe.graphe.predecessors("D")) == {code}
+        assert graphe.taches["D"]["predecesseurs"] == [code]
+        assert graphe.taches[code]["predecesseurs"] == ["A"]
+
+        with pytest.raises(ValueError):
+            graphe.fusionner_taches(["A", "D"])
+
+    def test_fusionner_taches_relation_typee(self):
+        """Seules les relations FS peuvent etre fusionnees"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Build", 3)
+        graphe.ajouter_tache("B", "Tests", 5, ["A:SS+1"])
+
+        with pytest.raises(ValueError):
+            graphe.fusionner_taches(["A", "B"])
+
+    def test_relances_csv(self):
+        """Test du chargement des colonnes optionnelles de jobs instables"""
+        csv_content = """code,nom,duree,predecesseurs,proba_echec,max_relances
+                A,Build,10,,,
+                B,Tests,5,A,0.2,3
+                C,Lint,2,A,0.1,
+        """
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write(csv_content)
+            temp_path = f.name
+
+        try:
+            graphe = GraphePERT(temp_path)
+            assert graphe.graphe.nodes["B"]["proba_echec"] == 0.2
+            assert graphe.graphe.nodes["B"]["max_relances"] == 3
+            assert graphe.taches["C"]["max_relances"] == 0
+            assert "proba_echec" not in graphe.graphe.nodes["A"]
+        finally:
+            os.unlink(temp_path)
+
+        with pytest.raises(ValueError):
+            graphe.ajouter_tache("D", "Flaky", 3, relances=(1.0, 2))
+
+    def test_estimation_trois_points(self):
+        """Test du chargement des estimations trois points depuis un CSV"""
+        csv_content = """code,nom,duree,predecesseurs,optimiste,probable,pessimiste
+                A,Build,10,,6,10,20
+                B,Deploy,5,A,,,
+        """
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write(csv_content)
+            temp_path = f.name
+
+        try:
+            graphe = GraphePERT(temp_path)
+            assert graphe.graphe.nodes["A"]["optimiste"] == 6
+            assert graphe.graphe.nodes["A"]["pessimiste"] == 20
+            assert "probable" not in graphe.graphe.nodes["B"]
+        finally:
+            os.unlink(temp_path)
+
+        with pytest.raises(ValueError):
+            GraphePERT().ajouter_tache("X", "Invalide", 5, estimation=(8, 5, 10))
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
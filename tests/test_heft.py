@@ -0,0 +1,120 @@
+import pytest
+import tempfile
+import os
+
+from src.graph_builder import GraphePERT
+from src.heft import OrdonnanceurHEFT
+
+CLASSES = {
+    "rapide": {"nb_runners": 1, "cout_minute": 0.10},
+    "eco": {"nb_runners": 2, "cout_minute": 0.02},
+}
+
+
+class TestOrdonnanceurHEFT:
+    """Tests pour l'affectation des jobs a des classes de runners"""
+
+    @pytest.fixture
+    def graphe_chaine(self):
+        """Fixture: chaine A -> B, deux fois plus rapide sur la classe rapide"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Build", 10, durees_classes={"rapide": 5})
+        graphe.ajouter_tache("B", "Tests", 8, ["A"], durees_classes={"rapide": 4})
+        return graphe
+
+    @pytest.fixture
+    def graphe_eventail(self):
+        """Fixture: un build suivi de trois suites de tests paralleles"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Build", 10, durees_classes={"rapide": 5})
+        for code in ("B", "C", "D"):
+            graphe.ajouter_tache(
+                code, f"Tests {code}", 8, ["A"], durees_classes={"rapide": 4}
+            )
+        return graphe
+
+    def test_classes_invalides(self, graphe_chaine):
+        """Test du refus d'une classe vide ou inconnue"""
+        with pytest.raises(ValueError):
+            OrdonnanceurHEFT(graphe_chaine, {})
+        with pytest.raises(ValueError):
+            OrdonnanceurHEFT(graphe_chaine, {"rapide": {"nb_runners": 0}})
+        with pytest.raises(ValueError):
+            OrdonnanceurHEFT(graphe_chaine, {"eco": {"nb_runners": 1}}).ordonnancer()
+
+    def test_chaine_rapide_ou_economique(self, graphe_chaine):
+        """Sans poids du cout tout va sur la classe rapide, sinon sur l'eco"""
+        ordonnanceur = OrdonnanceurHEFT(graphe_chaine, CLASSES)
+
+        rapide = ordonnanceur.ordonnancer()
+        assert rapide["duree_totale"] == 9
+        assert rapide["cout"] == pytest.approx(0.9)
+        assert rapide["minutes_par_classe"] == {"rapide": 9, "eco": 0}
+
+        eco = ordonnanceur.ordonnancer(poids_cout=1000)
+        assert eco["duree_totale"] == 18
+        assert eco["cout"] == pytest.approx(0.36)
+        assert eco["affectation"]["B"] == {
+            "classe": "eco",
+            "runner": 1,
+            "debut": 10,
+            "fin": 18,
+        }
+
+    def test_classes_combinees(self, graphe_eventail):
+        """Les jobs paralleles debordent sur les runners economiques"""
+        resultat = OrdonnanceurHEFT(graphe_eventail, CLASSES).ordonnancer()
+        affectation = resultat["affectation"]
+
+        assert affectation["A"]["classe"] == "rapide"
+        classes = sorted(affectation[code]["classe"] for code in ("B", "C", "D"))
+        assert classes == ["eco", "eco", "rapide"]
+        assert resultat["duree_totale"] == 13
+
+    def test_contraintes_respectees(self, graphe_eventail):
+        """Decalages respectes et pas de chevauchement sur un runner"""
+        graphe_eventail.ajouter_tache("E", "Deploy", 3, [("B", "FS", 5), "C", "D"])
+        resultat = OrdonnanceurHEFT(graphe_eventail, CLASSES).ordonnancer()
+        affectation = resultat["affectation"]
+
+        for pred, succ, arc in graphe_eventail.graphe.edges(data=True):
+            assert (
+                affectation[succ]["debut"] >= affectation[pred]["fin"] + arc["decalage"]
+            )
+        occupations = {}
+        for job in affectation.values():
+            cle = (job["classe"], job["runner"])
+            occupations.setdefault(cle, []).append((job["debut"], job["fin"]))
+        for intervalles in occupations.values():
+            intervalles.sort()
+            for (_, fin), (debut, _) in zip(intervalles, intervalles[1:]):
+                assert debut >= fin
+
+    def test_compromis_pareto(self, graphe_chaine):
+        """Les solutions non dominees vont du moins cher au plus rapide"""
+        solutions = OrdonnanceurHEFT(graphe_chaine, CLASSES).compromis()
+        pareto = [(s["cout"], s["duree_totale"]) for s in solutions if s["pareto"]]
+
+        assert pareto == [(pytest.approx(0.36), 18), (pytest.approx(0.9), 9)]
+
+    def test_durees_classes_csv(self):
+        """Test du chargement des colonnes duree_<classe>"""
+        csv_content = """code,nom,duree,predecesseurs,duree_rapide,duree_eco
+A,Build,10,,5,12
+B,Tests,8,A,4,
+"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write(csv_content)
+            temp_path = f.name
+
+        graphe = GraphePERT(temp_path)
+        os.unlink(temp_path)
+
+        assert graphe.graphe.nodes["A"]["durees_classes"] == {"rapide": 5, "eco": 12}
+        assert graphe.graphe.nodes["B"]["durees_classes"] == {"rapide": 4}
+        resultat = OrdonnanceurHEFT(graphe, CLASSES).ordonnancer(poids_cout=1000)
+        assert resultat["duree_totale"] == 20
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
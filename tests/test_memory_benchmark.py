@@ -0,0 +1,77 @@
+import os
+import tempfile
+
+import networkx as nx
+import pytest
+
+from src.generator import generer_csv, generer_taches
+from src.graph_builder import GraphePERT
+from src.memory_benchmark import executer_benchmark, verifier_budget
+
+
+class TestGenerateur:
+    """Tests pour le generateur de pipelines synthetiques"""
+
+    def test_generer_taches_reproductible(self):
+        """Meme graine, meme pipeline; predecesseurs dans la fenetre"""
+        taches = list(generer_taches(200, nb_predecesseurs=3, fenetre=10, graine=4))
+
+        assert taches == list(
+            generer_taches(200, nb_predecesseurs=3, fenetre=10, graine=4)
+        )
+        assert taches[0][3] == []
+        for i, (_, _, duree, predecesseurs) in enumerate(taches[1:], start=1):
+            assert 1 <= duree <= 30
+            assert 1 <= len(predecesseurs) <= 3
+            assert all(i - 10 <= int(p[1:]) < i for p in predecesseurs)
+
+    def test_generer_csv(self):
+        """Le CSV genere se charge dans GraphePERT et forme un DAG"""
+        with tempfile.TemporaryDirectory() as dossier:
+            chemin = os.path.join(dossier, "taches.csv")
+            generer_csv(chemin, 500)
+            graphe = GraphePERT(chemin)
+
+        assert graphe.graphe.number_of_nodes() == 500
+        assert graphe.graphe.number_of_edges() == 2 * 500 - 3
+        assert nx.is_directed_acyclic_graph(graphe.graphe)
+
+
+class TestBenchmarkMemoire:
+    """Tests pour la mesure memoire par structure"""
+
+    @pytest.fixture
+    def mesures(self):
+        """Fixture: mesures sur deux petits pipelines"""
+        return executer_benchmark([200, 800])
+
+    def test_structures_mesurees(self, mesures):
+        """Chaque structure principale est mesuree a la bonne etape"""
+        mesure = mesures[-1]
+        chargement = mesure["etapes"]["chargement"]
+        analyse = mesure["etapes"]["analyse"]
+
+        assert mesure["nb_taches"] == 800
+        assert chargement["graphe_networkx"]["octets"] > 0
+        assert chargement["taches"]["octets"] > 0
+        assert analyse["resultats"]["octets"] > 0
+        assert analyse["instantane"]["octets"] > 0
+        assert mesure["pic"] >= chargement["total"]["octets"]
+        assert chargement["taches"]["par_tache"] == pytest.approx(
+            chargement["taches"]["octets"] / 800
+        )
+
+    def test_verifier_budget(self, mesures):
+        """Un budget trop serre est signale, un budget large est respecte"""
+        mesure = mesures[-1]
+        assert verifier_budget(mesure, {"analyse": {"resultats": 10**6}}) == []
+
+        depassements = verifier_budget(
+            mesure, {"chargement": {"taches": 1}, "analyse": {"resultats": 10**6}}
+        )
+        assert len(depassements) == 1
+        assert depassements[0].startswith("chargement/taches")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,88 @@
+import pytest
+
+from src.graph_builder import GraphePERT
+from src.partitioning import PartitionneurPERT
+from src.pert_calculator import CalculateurPERT
+
+
+class TestPartitionneurPERT:
+    """Tests pour le partitionnement du pipeline sur plusieurs machines"""
+
+    @pytest.fixture
+    def graphe_deux_chaines(self):
+        """Fixture: deux chaines independantes de meme charge"""
+        graphe = GraphePERT()
+        for prefixe in ("X", "Y"):
+            graphe.ajouter_tache(f"{prefixe}1", "Build", 4)
+            graphe.ajouter_tache(f"{prefixe}2", "Test", 3, [f"{prefixe}1"])
+            graphe.ajouter_tache(f"{prefixe}3", "Package", 2, [f"{prefixe}2"])
+        return graphe
+
+    def test_nb_partitions_invalide(self, graphe_cicd):
+        """Test du refus d'un nombre de partitions nul"""
+        with pytest.raises(ValueError):
+            PartitionneurPERT(graphe_cicd, 0)
+
+    def test_une_seule_partition(self, graphe_cicd):
+        """Une seule machine: aucun transfert"""
+        partitionneur = PartitionneurPERT(graphe_cicd, 1, cout_transfert=5)
+        planning = partitionneur.estimer_planning()
+
+        assert set(partitionneur.affectation.values()) == {0}
+        assert planning["arcs_coupes"] == []
+        assert planning["duree_totale"] == planning["duree_totale_sans_transfert"]
+        assert planning["partitions"][0]["charge"] == 107
+
+    def test_chaines_independantes_non_coupees(self, graphe_deux_chaines):
+        """Deux chaines de meme charge sont placees chacune sur une machine"""
+        partitionneur = PartitionneurPERT(graphe_deux_chaines, 2, cout_transfert=3)
+        affectation = partitionneur.partitionner()
+
+        assert affectation["X1"] == affectation["X2"] == affectation["X3"]
+        assert affectation["Y1"] == affectation["Y2"] == affectation["Y3"]
+        assert affectation["X1"] != affectation["Y1"]
+
+        planning = partitionneur.estimer_planning()
+        assert planning["arcs_coupes"] == []
+        assert planning["duree_totale"] == 9
+        assert [p["charge"] for p in planning["partitions"]] == [9, 9]
+
+    def test_chemin_critique_regroupe(self, graphe_cicd):
+        """Les arcs du chemin critique ne sont coupes que si la charge l'impose"""
+        partitionneur = PartitionneurPERT(graphe_cicd, 2, cout_transfert=3)
+        affectation = partitionneur.partitionner()
+
+        # Chemin critique A-B-F-H-I (64) plus long que la capacite (58.85):
+        # un seul arc critique coupe
+        critique = ["A", "B", "F", "H", "I"]
+        coupes = [
+            (a, b)
+            for a, b in zip(critique, critique[1:])
+            if affectation[a] != affectation[b]
+        ]
+        assert len(coupes) == 1
+
+        charges = [0, 0]
+        for tache, partition in affectation.items():
+            charges[partition] += graphe_cicd.graphe.nodes[tache]["duree"]
+        assert max(charges) <= 1.1 * 107 / 2
+
+    def test_estimer_planning_cout_transfert(self, graphe_cicd):
+        """La duree estimee inclut le cout de transfert des arcs coupes"""
+        partitionneur = PartitionneurPERT(graphe_cicd, 2, cout_transfert=3)
+        planning = partitionneur.estimer_planning()
+
+        calc = CalculateurPERT(partitionneur.construire_graphe_distribue())
+        calc.calculer_dates_au_plus_tot()
+        assert planning["duree_totale"] == calc.duree_totale
+        assert planning["duree_totale"] > planning["duree_totale_sans_transfert"] == 64
+
+        for pred, succ in planning["arcs_coupes"]:
+            assert calc.dates_tot[succ]["ES"] >= calc.dates_tot[pred]["EF"] + 3
+
+        taches = [t for p in planning["partitions"] for t in p["taches"]]
+        assert sorted(taches) == sorted(graphe_cicd.graphe.nodes())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,3 +1,4 @@
+import math
 import pytest
 import tempfile
 import os
@@ -376,6 +377,490 @@ class TestCalculateurPERT:
         assert calc.chemin_critique == ["A"]
         assert calc.marges["A"] == 0
 
+    def test_relation_fs_avec_decalage(self):
+        """Test d'une relation FS avec decalage"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Build", 5)
+        graphe.ajouter_tache("B", "Deploy", 3, [("A", "FS", 2)])
+
+        calc = CalculateurPERT(graphe)
+        calc.executer_analyse_complete()
+
+        assert calc.dates_tot["B"] == {"ES": 7, "EF": 10}
+        assert calc.duree_totale == 10
+        assert calc.chemin_critique == ["A", "B"]
+
+    def test_relation_ss(self):
+        """Test d'une relation debut-debut (SS) avec decalage"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Deploy", 10)
+        graphe.ajouter_tache("B", "Integration Tests", 5, ["A:SS+2"])
+
+        calc = CalculateurPERT(graphe)
+        calc.executer_analyse_complete()
+
+        assert calc.dates_tot["B"] == {"ES": 2, "EF": 7}
+        assert calc.duree_totale == 10
+        assert calc.dates_tard["B"] == {"LS": 5, "LF": 10}
+        assert calc.marges["A"] == 0
+        assert calc.marges["B"] == 3
+        assert calc.marges_libres["A"] == 0
+
+    def test_relation_ff(self):
+        """Test d'une relation fin-fin (FF) avec decalage"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Log Collector", 10)
+        graphe.ajouter_tache("B", "Tests", 5, ["A:FF+3"])
+
+        calc = CalculateurPERT(graphe)
+        calc.executer_analyse_complete()
+
+        assert calc.dates_tot["B"] == {"ES": 8, "EF": 13}
+        assert calc.duree_totale == 13
+        assert calc.marges["A"] == 0
+        assert calc.marges["B"] == 0
+        assert calc.chemin_critique == ["A", "B"]
+
+    def test_relation_sf(self):
+        """Test d'une relation debut-fin (SF) avec decalage"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Long Job", 10)
+        graphe.ajouter_tache("B", "Short Job", 4, ["A:SF+6"])
+
+        calc = CalculateurPERT(graphe)
+        calc.executer_analyse_complete()
+
+        assert calc.dates_tot["B"] == {"ES": 2, "EF": 6}
+        assert calc.duree_totale == 10
+        assert calc.marges["B"] == 4
+
+    def test_relation_ne_commence_pas_avant_zero(self):
+        """Test qu'un decalage negatif ne donne pas de date negative"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Job A", 2)
+        graphe.ajouter_tache("B", "Job B", 8, ["A:FF"])
+
+        calc = CalculateurPERT(graphe)
+        calc.executer_analyse_complete()
+
+        assert calc.dates_tot["B"] == {"ES": 0, "EF": 8}
+        assert calc.duree_totale == 8
+
+    def test_chemins_quasi_critiques_cicd(self, graphe_cicd):
+        """Test des k plus longs chemins du pipeline CI/CD"""
+        calc = CalculateurPERT(graphe_cicd)
+        calc.executer_analyse_complete()
+        chemins = calc.identifier_chemins_quasi_critiques(3)
+
+        assert [c["duree"] for c in chemins] == [64, 60, 59]
+        assert [c["marge"] for c in chemins] == [0, 4, 5]
+        assert chemins[0]["chemin"] == ["A", "B", "F", "H", "I"]
+        assert chemins[1]["chemin"] == ["A", "B", "D", "H", "I"]
+        assert chemins[2]["chemin"] == ["A", "C", "F", "H", "I"]
+
+    def test_chemins_quasi_critiques_tous(self, graphe_cicd):
+        """Test avec k superieur au nombre de chemins"""
+        calc = CalculateurPERT(graphe_cicd)
+        calc.executer_analyse_complete()
+        chemins = calc.identifier_chemins_quasi_critiques(100)
+
+        assert [c["duree"] for c in chemins] == [64, 60, 59, 52, 32]
+        assert len({tuple(c["chemin"]) for c in chemins}) == 5
+
+    def test_chemins_quasi_critiques_aleatoire(self):
+        """Test contre l'enumeration exhaustive sur des petits graphes"""
+        import random
+
+        import networkx as nx
+
+        for graine in range(20):
+            rng = random.Random(graine)
+            graphe = GraphePERT()
+            for i in range(10):
+                nb_preds = rng.randint(0, 3) if i else 0
+                preds = {f"T{rng.randrange(i)}" for _ in range(nb_preds)}
+                graphe.ajouter_tache(f"T{i}", "Job", rng.randint(0, 9), sorted(preds))
+
+            calc = CalculateurPERT(graphe)
+            calc.executer_analyse_complete()
+            g = graphe.graphe
+
+            tous = set()
+            for debut in [n for n in g if g.in_degree(n) == 0]:
+                for fin in [n for n in g if g.out_degree(n) == 0]:
+                    if debut == fin:
+                        tous.add((debut,))
+                    tous.update(map(tuple, nx.all_simple_paths(g, debut, fin)))
+            attendues = [sum(g.nodes[n]["duree"] for n in c) for c in tous]
+
+            chemins = calc.identifier_chemins_quasi_critiques(1000)
+            assert [c["duree"] for c in chemins] == sorted(attendues, reverse=True)
+            assert len({tuple(c["chemin"]) for c in chemins}) == len(chemins)
+
+    def test_calculer_drag_cicd(self, graphe_cicd):
+        """Test du drag des taches du pipeline CI/CD"""
+        calc = CalculateurPERT(graphe_cicd)
+        calc.executer_analyse_complete()
+        drag = calc.calculer_drag()
+
+        # A: tout decale de 2; B: A-C-F-H-I (59) devient critique
+        # F: A-B-D-H-I (60); H: A-G-I (32) < 64 - 25; I: fin apres H (54)
+        assert drag == {
+            "A": 2,
+            "B": 5,
+            "C": 0,
+            "D": 0,
+            "E": 0,
+            "F": 4,
+            "G": 0,
+            "H": 25,
+            "I": 10,
+        }
+
+    def test_calculer_drag_contre_recalcul(self, graphe_cicd):
+        """Test que le drag correspond a un recalcul avec duree nulle"""
+        calc = CalculateurPERT(graphe_cicd)
+        calc.executer_analyse_complete()
+        drag = calc.calculer_drag()
+
+        for tache in graphe_cicd.graphe.nodes():
+            duree = graphe_cicd.graphe.nodes[tache]["duree"]
+            graphe_cicd.graphe.nodes[tache]["duree"] = 0
+            recalcul = CalculateurPERT(graphe_cicd)
+            recalcul.calculer_dates_au_plus_tot()
+            graphe_cicd.graphe.nodes[tache]["duree"] = duree
+
+            assert drag[tache] == calc.duree_totale - recalcul.duree_totale
+
+    def test_calculer_drag_echeance_contraignante(self, graphe_cicd):
+        """Un jalon qui borne LF ne change pas le drag (duree totale inchangee)"""
+        graphe_cicd.definir_echeance("F", 25)
+        calc = CalculateurPERT(graphe_cicd)
+        calc.executer_analyse_complete()
+        drag = calc.calculer_drag()
+
+        assert calc.dates_tard["F"]["LF"] == 25
+        assert drag == {
+            "A": 2,
+            "B": 5,
+            "C": 0,
+            "D": 0,
+            "E": 0,
+            "F": 4,
+            "G": 0,
+            "H": 25,
+            "I": 10,
+        }
+        for tache in graphe_cicd.graphe.nodes():
+            duree = graphe_cicd.graphe.nodes[tache]["duree"]
+            graphe_cicd.graphe.nodes[tache]["duree"] = 0
+            recalcul = CalculateurPERT(graphe_cicd)
+            recalcul.calculer_dates_au_plus_tot()
+            graphe_cicd.graphe.nodes[tache]["duree"] = duree
+
+            assert drag[tache] == calc.duree_totale - recalcul.duree_totale
+
+        sensibilites = calc.calculer_sensibilites()
+        assert sensibilites["H"] == {"reduction_max": 25, "allongement_max": None}
+        assert sensibilites["G"] == {"reduction_max": 20, "allongement_max": 32}
+
+    def test_drag_chemins_critiques_paralleles(self):
+        """Test que le drag est nul quand deux chemins critiques sont paralleles"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Start", 5)
+        graphe.ajouter_tache("B", "Branch 1", 10, ["A"])
+        graphe.ajouter_tache("C", "Branch 2", 10, ["A"])
+        graphe.ajouter_tache("D", "End", 3, ["B", "C"])
+
+        calc = CalculateurPERT(graphe)
+        calc.executer_analyse_complete()
+        drag = calc.calculer_drag()
+
+        assert drag["B"] == 0
+        assert drag["C"] == 0
+        assert drag["A"] == 5
+        assert drag["D"] == 3
+
+    def test_calculer_sensibilites(self, graphe_cicd):
+        """Test des marges de variation des durees"""
+        calc = CalculateurPERT(graphe_cicd)
+        calc.executer_analyse_complete()
+        sensibilites = calc.calculer_sensibilites()
+
+        assert sensibilites["B"] == {"reduction_max": 5, "allongement_max": None}
+        assert sensibilites["G"] == {"reduction_max": 20, "allongement_max": 32}
+
+    def test_prevision_en_direct(self, graphe_cicd):
+        """Test de la re-prevision a partir des evenements d'execution"""
+        calc = CalculateurPERT(graphe_cicd)
+        calc.executer_analyse_complete()
+        assert calc.duree_totale == 64
+
+        # Checkout termine avec 1 minute de retard
+        assert calc.signaler_fin("A", 3) == 65
+        assert calc.dates_tot["G"] == {"ES": 3, "EF": 23}
+
+        # Compile Backend toujours en cours apres 20 minutes (estime: 15)
+        for tache in ("B", "C", "G"):
+            calc.signaler_debut(tache, 3)
+        assert calc.signaler_progression("B", 23, 20) == 70
+        assert calc.dates_tot["F"] == {"ES": 23, "EF": 35}
+        assert calc.chemin_critique_restant() == ["B", "F", "H", "I"]
+        assert calc.marge_prevue("G") == 37
+        assert calc.marge_prevue("F") == 0
+
+        assert calc.signaler_fin("B", 25) == 72
+        assert calc.chemin_critique_restant() == ["F", "H", "I"]
+
+    def test_prevision_en_direct_instant_courant(self, graphe_cicd):
+        """Une tache non demarree ne peut pas demarrer avant le dernier evenement"""
+        calc = CalculateurPERT(graphe_cicd)
+        calc.executer_analyse_complete()
+        calc.signaler_fin("A", 10)
+        assert calc.dates_tot["B"] == {"ES": 10, "EF": 25}
+
+        duree_prevue = calc.signaler_progression("C", 60, 60)
+
+        assert calc.maintenant == 60
+        assert calc.dates_tot["B"] == {"ES": 60, "EF": 75}
+        assert calc.dates_tot["G"] == {"ES": 60, "EF": 80}
+        assert duree_prevue == 60 + 15 + 12 + 25 + 10
+        assert calc.chemin_critique_restant() == ["B", "F", "H", "I"]
+
+    def test_prevision_en_direct_contre_recalcul(self, graphe_cicd):
+        """La propagation incrementale donne les memes dates qu'un calcul complet"""
+        calc = CalculateurPERT(graphe_cicd)
+        calc.executer_analyse_complete()
+        evenements = [
+            ("debut", "A", 1),
+            ("fin", "A", 4),
+            ("debut", "G", 4),
+            ("debut", "C", 5),
+            ("fin", "C", 11),
+            ("progression", "G", 30, 26),
+            ("fin", "E", 20),
+        ]
+        for evenement, tache, instant, *ecoule in evenements:
+            if evenement == "debut":
+                calc.signaler_debut(tache, instant)
+            elif evenement == "fin":
+                calc.signaler_fin(tache, instant)
+            else:
+                calc.signaler_progression(tache, instant, *ecoule)
+
+            reference = CalculateurPERT(graphe_cicd)
+            reference.avancement = {t: dict(a) for t, a in calc.avancement.items()}
+            reference.maintenant = calc.maintenant
+            reference.executer_analyse_complete()
+            assert calc.dates_tot == reference.dates_tot
+            assert calc.duree_totale == reference.duree_totale
+            assert calc.dates_tard == reference.dates_tard
+            assert calc.marges == reference.marges
+            assert calc.chemin_critique == reference.chemin_critique
+            assert calc.instantane.duree_totale == reference.duree_totale
+
+    def test_prevision_en_direct_publie_instantane(self, graphe_cicd):
+        """Un evenement publie un instantane sans modifier les resultats rendus"""
+        calc = CalculateurPERT(graphe_cicd)
+        resultats = calc.executer_analyse_complete()
+        instantane = calc.instantane
+
+        assert calc.signaler_fin("A", 10) == 72
+
+        assert resultats["dates_tot"]["B"] == {"ES": 2, "EF": 17}
+        assert instantane.duree_totale == 64
+        assert calc.instantane.version > instantane.version
+        assert calc.instantane.duree_totale == 72
+        assert calc.instantane.dates_tache("B")["ES"] == 10
+
+    def test_recalcul_ne_modifie_pas_resultats_rendus(self, graphe_cicd):
+        """Le recalcul incremental ecrit dans de nouveaux dictionnaires"""
+        calc = CalculateurPERT(graphe_cicd)
+        resultats = calc.executer_analyse_complete()
+
+        graphe_cicd.graphe.nodes["A"]["duree"] = 10
+        calc.recalculer_dates_au_plus_tot(["A"])
+        calc.recalculer_dates_au_plus_tard(["A"], duree_totale_precedente=64)
+
+        assert calc.dates_tot["B"] == {"ES": 10, "EF": 25}
+        assert calc.dates_tard["I"] == {"LS": 62, "LF": 72}
+        assert resultats["dates_tot"]["B"] == {"ES": 2, "EF": 17}
+        assert resultats["dates_tard"]["I"] == {"LS": 54, "LF": 64}
+
+    def test_distributions_max_de_clark(self):
+        """Fin de deux taches paralleles N(5, 1) independantes"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Lint", 5, estimation=(2, 5, 8))
+        graphe.ajouter_tache("B", "Audit", 5, estimation=(2, 5, 8))
+        calc = CalculateurPERT(graphe)
+        calc.calculer_distributions()
+
+        # Moments exacts du max de deux normales de meme loi
+        assert calc.distribution_fin["moyenne"] == pytest.approx(
+            5 + 1 / math.sqrt(math.pi)
+        )
+        assert calc.distribution_fin["variance"] == pytest.approx(1 - 1 / math.pi)
+        assert calc.probabilites_echeances(5)[0] < 0.5
+
+        # Lois certaines: max exact
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Lint", 3)
+        graphe.ajouter_tache("B", "Audit", 5)
+        calc = CalculateurPERT(graphe)
+        calc.calculer_distributions()
+        assert calc.distribution_fin == {"moyenne": 5, "variance": 0}
+
+    def test_distributions_chaine(self):
+        """Sur une chaine, moyennes et variances s'additionnent"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Build", 5, estimation=(2, 5, 14))
+        graphe.ajouter_tache("B", "Test", 10, ["A"], estimation=(4, 10, 16))
+        calc = CalculateurPERT(graphe)
+        calc.calculer_distributions()
+
+        assert calc.distributions["A"] == {"moyenne": 6.0, "variance": 4.0}
+        assert calc.distribution_fin["moyenne"] == pytest.approx(16.0)
+        assert calc.distribution_fin["variance"] == pytest.approx(8.0)
+
+        probabilites = calc.probabilites_echeances([16, 16 + math.sqrt(8), 100])
+        assert probabilites == pytest.approx([0.5, 0.841345, 1.0], abs=1e-6)
+
+    def test_distributions_sans_estimation(self, graphe_cicd):
+        """Sans estimation trois points, on retrouve le calcul CPM"""
+        calc = CalculateurPERT(graphe_cicd)
+        calc.executer_analyse_complete()
+        calc.calculer_distributions()
+
+        for tache, dates in calc.dates_tot.items():
+            assert calc.distributions[tache] == {"moyenne": dates["EF"], "variance": 0}
+        assert calc.probabilites_echeances([63, 64]).tolist() == [0.0, 1.0]
+
+    def test_distributions_noeuds_de_convergence(self):
+        """Au point de convergence, la moyenne du max depasse chaque branche"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Checkout", 2)
+        graphe.ajouter_tache("B", "Backend", 15, ["A"], estimation=(9, 15, 21))
+        graphe.ajouter_tache("C", "Frontend", 15, ["A"], estimation=(9, 15, 21))
+        graphe.ajouter_tache("D", "Deploy", 5, ["B", "C"])
+        calc = CalculateurPERT(graphe)
+        calc.calculer_distributions()
+
+        # Deux branches N(17, 4): E[max] = 17 + 2/sqrt(pi)
+        assert calc.distribution_fin["moyenne"] == pytest.approx(
+            22 + 2 / math.sqrt(math.pi)
+        )
+        assert calc.probabilites_echeances(22)[0] < 0.5
+
+    def test_echeance_jalon_depassee(self, graphe_cicd):
+        """Un jalon intenable donne une marge negative a la tache et ses ancetres"""
+        graphe_cicd.definir_echeance("F", 25)
+        calc = CalculateurPERT(graphe_cicd)
+        calc.executer_analyse_complete()
+
+        assert calc.dates_tard["F"] == {"LS": 13, "LF": 25}
+        assert calc.marges["F"] == -4
+        assert calc.marges["B"] == -4
+        assert calc.marges["A"] == -4
+        assert calc.marges["H"] == 0
+        assert calc.echeances_depassees() == {"F": 4}
+
+    def test_chemin_critique_echeance_intenable(self):
+        """Avec un jalon intenable, la chaine de marge minimale reste critique"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Build", 10)
+        graphe.ajouter_tache("B", "Deploy", 10, ["A"], echeance=15)
+        calc = CalculateurPERT(graphe)
+        calc.executer_analyse_complete()
+
+        assert calc.marges == {"A": -5, "B": -5}
+        assert calc.marge_critique == -5
+        assert calc.chemin_critique == ["A", "B"]
+        assert calc.est_arc_critique("A", "B")
+        assert calc.obtenir_instantane().taches_critiques() == ("A", "B")
+        tableau = calc.generer_tableau_resultats()
+        assert all(ligne["Critique"] == "Oui" for ligne in tableau)
+
+    def test_chemin_critique_jalon_intermediaire(self, graphe_cicd):
+        """Le chemin critique s'arrete sur le jalon qui depasse le plus"""
+        graphe_cicd.definir_echeance("F", 25)
+        calc = CalculateurPERT(graphe_cicd)
+        calc.executer_analyse_complete()
+
+        assert calc.chemin_critique == ["A", "B", "F"]
+        assert not calc.est_critique("H")
+
+    def test_echeances_puits_independants(self):
+        """Chaque tache finale avec SLA est bornee par son echeance"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Build", 10)
+        graphe.ajouter_tache("X", "Publish", 5, ["A"], echeance=50)
+        graphe.ajouter_tache("Y", "Deploy", 20, ["A"])
+        calc = CalculateurPERT(graphe)
+        calc.executer_analyse_complete()
+
+        assert calc.duree_totale == 30
+        assert calc.dates_tard["X"] == {"LS": 45, "LF": 50}
+        assert calc.dates_tard["Y"] == {"LS": 10, "LF": 30}
+        assert calc.marges["X"] == 35
+        assert calc.echeances_depassees() == {}
+
+    def test_calculer_debuts_au_plus_tard_vecteur(self, graphe_cicd):
+        """Dates de debut au plus tard pour plusieurs echeances en une passe"""
+        graphe_cicd.definir_echeance("F", 30)
+        calc = CalculateurPERT(graphe_cicd)
+        calc.executer_analyse_complete()
+        resultats = calc.calculer_debuts_au_plus_tard([64, 70, 60])
+        ligne = {t: i for i, t in enumerate(resultats["taches"])}
+
+        assert resultats["LS"].shape == (9, 3)
+        assert resultats["LS"][ligne["I"]].tolist() == [54, 60, 50]
+        assert resultats["marges"][ligne["G"]].tolist() == [32, 38, 28]
+        # B est borne par le jalon de F (30 - 12 = 18) au-dela de T = 64
+        assert resultats["LS"][ligne["B"]].tolist() == [2, 3, -2]
+        for tache, i in ligne.items():
+            assert resultats["LS"][i, 0] == calc.dates_tard[tache]["LS"]
+
+    def test_relances_sans_job_instable(self, graphe_cicd):
+        """Sans job instable, chaque tirage donne la duree CPM"""
+        calc = CalculateurPERT(graphe_cicd)
+        resultats = calc.analyser_relances(nb_tirages=100, graine=0)
+
+        assert (resultats["durees_totales"] == 64).all()
+        assert resultats["centiles"] == {50: 64, 90: 64, 99: 64}
+        assert resultats["proba_echec"] == 0
+        assert resultats["contributions"] == {}
+
+    def test_relances_chaine(self):
+        """Sur une chaine, chaque relance ajoute la duree du job"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Build", 5)
+        graphe.ajouter_tache("B", "Tests", 10, ["A"], relances=(0.5, 1))
+        calc = CalculateurPERT(graphe)
+        resultats = calc.analyser_relances(nb_tirages=20000, graine=1)
+
+        assert set(resultats["durees_totales"].tolist()) == {15, 25}
+        assert resultats["duree_esperee"] == pytest.approx(20, abs=0.2)
+        assert resultats["centiles"][99] == 25
+        assert resultats["surcouts"] == {"B": 5}
+        assert resultats["proba_echec"] == 0.25
+        assert resultats["contributions"]["B"] == pytest.approx(
+            resultats["duree_esperee"] - 15
+        )
+
+    def test_relances_classement(self, graphe_parallele):
+        """Un job instable hors chemin critique ne contribue qu'au-dela de sa marge"""
+        graphe_parallele.graphe.nodes["B"].update(proba_echec=0.3, max_relances=1)
+        graphe_parallele.graphe.nodes["C"].update(proba_echec=0.3, max_relances=1)
+        graphe_parallele.graphe.nodes["B"]["duree"] = 4
+        calc = CalculateurPERT(graphe_parallele)
+        resultats = calc.analyser_relances(nb_tirages=5000, graine=2)
+
+        # B (4 min, marge 11) relance reste sous les 15 minutes de C
+        assert list(resultats["contributions"]) == ["C", "B"]
+        assert resultats["contributions"]["B"] == 0
+        assert resultats["contributions"]["C"] == pytest.approx(0.3 * 15, abs=0.5)
+        assert resultats["surcouts"]["B"] == pytest.approx(0.3 * 4)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
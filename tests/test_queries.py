@@ -0,0 +1,86 @@
+import pytest
+
+from src.graph_builder import GraphePERT
+from src.pert_calculator import CalculateurPERT
+from src.queries import RequetesPlanning
+
+
+class TestRequetesPlanning:
+    """Tests pour les requetes indexees sur les resultats d'analyse"""
+
+    @pytest.fixture
+    def calc_cicd(self, graphe_cicd):
+        """Fixture: analyse complete du pipeline CI/CD"""
+        calc = CalculateurPERT(graphe_cicd)
+        calc.executer_analyse_complete()
+        return calc
+
+    def test_taches_actives(self, calc_cicd):
+        """Taches en cours a un instant, plan au plus tot et au plus tard"""
+        requetes = calc_cicd.obtenir_requetes()
+
+        assert requetes.actives(0) == ["A"]
+        assert sorted(requetes.actives(2)) == ["B", "C", "G"]
+        assert sorted(requetes.actives(17)) == ["D", "F", "G"]
+        assert requetes.actives(64) == []
+        # Au plus tard, G (marge 32) ne demarre qu'a 34
+        assert requetes.actives(30, plan="tard") == ["H"]
+        assert sorted(requetes.actives(40, plan="tard")) == ["G", "H"]
+
+        with pytest.raises(ValueError):
+            requetes.actives(0, plan="reel")
+
+    def test_actives_par_lot(self, calc_cicd):
+        """Le lot donne les memes reponses que les requetes unitaires"""
+        requetes = calc_cicd.obtenir_requetes()
+        instants = [0, 2, 12, 17, 29, 63, 64]
+
+        lot = requetes.actives_par_lot(instants)
+        assert lot == [requetes.actives(t) for t in instants]
+        assert requetes.nb_actives(instants).tolist() == [len(r) for r in lot]
+
+    def test_fenetre_et_seuil(self, calc_cicd):
+        """Fenetre sur les debuts et seuil sur les marges"""
+        requetes = calc_cicd.obtenir_requetes()
+
+        assert sorted(requetes.dans_intervalle("ES", 2, 12)) == ["B", "C", "E", "G"]
+        assert sorted(requetes.sous_seuil("marge", 5)) == ["A", "B", "D", "F", "H", "I"]
+        assert requetes.sous_seuil("marge", 0) == []
+        fenetres = requetes.dans_intervalle_par_lot("LS", [0, 29], [2, 40])
+        assert [sorted(taches) for taches in fenetres] == [["A", "B"], ["G", "H"]]
+        # Resultats en ordre topologique
+        ordre = calc_cicd.obtenir_instantane().index
+        assert fenetres[0] == sorted(fenetres[0], key=ordre.__getitem__)
+
+        with pytest.raises(ValueError):
+            requetes.sous_seuil("duree", 5)
+
+    def test_index_par_analyse(self, calc_cicd):
+        """L'index est reutilise puis reconstruit apres une nouvelle analyse"""
+        requetes = calc_cicd.obtenir_requetes()
+        assert calc_cicd.obtenir_requetes() is requetes
+
+        calc_cicd.graphe.nodes["G"]["duree"] = 70
+        calc_cicd.executer_analyse_complete()
+        nouvelles = calc_cicd.obtenir_requetes()
+
+        assert nouvelles is not requetes
+        assert nouvelles.actives(70) == ["G"]
+        assert requetes.actives(70) == []
+
+    def test_taches_de_duree_nulle(self):
+        """Un jalon de duree nulle n'est jamais actif"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Build", 5)
+        graphe.ajouter_tache("M", "Jalon", 0, ["A"])
+        calc = CalculateurPERT(graphe)
+        calc.executer_analyse_complete()
+        requetes = RequetesPlanning(calc.obtenir_instantane())
+
+        assert requetes.actives(5) == []
+        assert requetes.nb_actives([4, 5]).tolist() == [1, 0]
+        assert requetes.dans_intervalle("ES", 5, 5) == ["M"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
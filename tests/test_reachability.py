@@ -0,0 +1,105 @@
+import pytest
+
+import networkx as nx
+
+from src.graph_builder import GraphePERT
+from src.reachability import IndexAccessibilite
+
+
+class TestIndexAccessibilite:
+    """Tests pour la classe IndexAccessibilite"""
+
+    @pytest.fixture
+    def graphe_cicd(self):
+        """Fixture: pipeline CI/CD avec un arc redondant A -> H"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Git Checkout", 2)
+        graphe.ajouter_tache("B", "Compile Backend", 15, ["A"])
+        graphe.ajouter_tache("C", "Compile Frontend", 10, ["A"])
+        graphe.ajouter_tache("D", "Unit Tests Back", 8, ["B"])
+        graphe.ajouter_tache("E", "Unit Tests Front", 5, ["C"])
+        graphe.ajouter_tache("F", "Build Docker Image", 12, ["B", "C"])
+        graphe.ajouter_tache("G", "Security Scan (SAST)", 20, ["A"])
+        graphe.ajouter_tache("H", "Integration Tests", 25, ["A", "D", "E", "F"])
+        graphe.ajouter_tache("I", "Deploy to Prod", 10, ["G", "H"])
+        return graphe
+
+    def test_est_ancetre(self, graphe_cicd):
+        """Test des requetes d'accessibilite contre networkx"""
+        index = IndexAccessibilite(graphe_cicd)
+        g = graphe_cicd.graphe
+
+        for x in g.nodes():
+            for y in g.nodes():
+                attendu = x != y and nx.has_path(g, x, y)
+                assert index.est_ancetre(x, y) == attendu, (x, y)
+
+    def test_taches_affectees(self, graphe_cicd):
+        """Test de l'ensemble des taches en aval d'un changement"""
+        index = IndexAccessibilite(graphe_cicd)
+
+        assert set(index.taches_affectees("C")) == {"C", "E", "F", "H", "I"}
+        assert set(index.taches_affectees(["D", "G"])) == {"D", "G", "H", "I"}
+        assert index.taches_affectees([]) == []
+
+    def test_taches_affectees_ordre_topologique(self, graphe_cicd):
+        """Test que les taches affectees sont en ordre topologique"""
+        index = IndexAccessibilite(graphe_cicd)
+        affectees = index.taches_affectees("A")
+
+        assert len(affectees) == 9
+        rang = {tache: i for i, tache in enumerate(affectees)}
+        for pred, succ in graphe_cicd.graphe.edges():
+            assert rang[pred] < rang[succ]
+
+    def test_arcs_redondants(self, graphe_cicd):
+        """Test que la construction detecte les arcs de la reduction transitive"""
+        index = IndexAccessibilite(graphe_cicd)
+        assert index.arcs_redondants == [("A", "H")]
+
+    def test_analyser_sous_pipeline(self, graphe_cicd):
+        """Test du planning du seul sous-pipeline affecte"""
+        index = IndexAccessibilite(graphe_cicd)
+        calc = index.analyser_sous_pipeline(["E", "G"])
+
+        assert set(calc.graphe.nodes()) == {"E", "G", "H", "I"}
+        assert not calc.graphe.has_edge("A", "H")
+        # E(5) -> H(25) -> I(10), G(20) en parallele
+        assert calc.duree_totale == 40
+        assert calc.chemin_critique == ["E", "H", "I"]
+        assert calc.marges["G"] == 10
+
+    def test_sous_pipeline_garde_echeances(self, graphe_cicd):
+        """Test que les jalons des taches affectees sont conserves"""
+        graphe_cicd.definir_echeance("H", 20)
+        index = IndexAccessibilite(graphe_cicd)
+        calc = index.analyser_sous_pipeline(["E"])
+
+        assert calc.graphe.nodes["H"]["echeance"] == 20
+        assert calc.marges["E"] == -10
+        assert calc.chemin_critique == ["E", "H"]
+
+    def test_sous_pipeline_garde_attributs(self):
+        """Test que le sous-pipeline conserve tous les attributs des taches"""
+        graphe = GraphePERT(surcout_job=1)
+        graphe.ajouter_tache("A", "Build", 5)
+        graphe.ajouter_tache(
+            "B",
+            "Tests",
+            8,
+            ["A:SS+2"],
+            estimation=(6, 8, 14),
+            echeance=30,
+            relances=(0.2, 2),
+            durees_classes={"rapide": 4},
+        )
+        sous_pipeline = IndexAccessibilite(graphe).construire_sous_pipeline(["A"])
+
+        assert sous_pipeline.surcout_job == 1
+        assert dict(sous_pipeline.graphe.nodes["B"]) == dict(graphe.graphe.nodes["B"])
+        assert sous_pipeline.graphe.edges["A", "B"] == {"type": "SS", "decalage": 2}
+        assert sous_pipeline.taches["B"] == graphe.taches["B"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
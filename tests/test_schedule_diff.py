@@ -0,0 +1,116 @@
+import pytest
+
+from src.graph_builder import GraphePERT
+from src.pert_calculator import CalculateurPERT
+from src.schedule_diff import ComparateurPERT
+
+
+class TestComparateurPERT:
+    """Tests pour la classe ComparateurPERT"""
+
+    def _verifier_contre_analyse_complete(self, comparateur):
+        """Verifie l'analyse incrementale contre une analyse complete"""
+        reference = CalculateurPERT(comparateur.nouveau)
+        reference.executer_analyse_complete()
+        calc = comparateur.calc_nouveau
+
+        assert calc.duree_totale == reference.duree_totale
+        assert calc.dates_tot == reference.dates_tot
+        assert calc.dates_tard == reference.dates_tard
+        assert calc.marges == reference.marges
+        assert calc.marges_libres == reference.marges_libres
+
+    def test_versions_identiques(self, fichier_cicd):
+        """Test qu'aucune tache n'est recalculee sans modification"""
+        comparateur = ComparateurPERT(fichier_cicd, fichier_cicd)
+        diff = comparateur.comparer()
+
+        assert diff["duree_totale"] == {"avant": 64, "apres": 64, "delta": 0}
+        assert diff["taches_ajoutees"] == []
+        assert diff["taches_supprimees"] == []
+        assert diff["marges_modifiees"] == {}
+        assert diff["taches_recalculees"] == 0
+
+    def test_duree_modifiee(self, fichier_cicd):
+        """Test d'une tache non critique qui devient critique"""
+        nouveau = GraphePERT(fichier_cicd)
+        nouveau.graphe.nodes["G"]["duree"] = 60
+        nouveau.taches["G"]["duree"] = 60
+
+        comparateur = ComparateurPERT(fichier_cicd, nouveau)
+        diff = comparateur.comparer()
+
+        assert diff["durees_modifiees"] == {"G": {"avant": 20, "apres": 60}}
+        assert diff["duree_totale"]["delta"] == 8
+        assert "G" in diff["devenues_critiques"]
+        assert {"B", "F", "H"} <= set(diff["devenues_non_critiques"])
+        assert diff["chemin_critique"]["apres"] == ["A", "G", "I"]
+        self._verifier_contre_analyse_complete(comparateur)
+
+    def test_taches_ajoutees_et_supprimees(self, fichier_cicd):
+        """Test d'ajout et de suppression de taches"""
+        nouveau = GraphePERT()
+        for code, info in GraphePERT(fichier_cicd).taches.items():
+            if code == "E":
+                continue
+            preds = [p for p in info["predecesseurs"] if p != "E"]
+            nouveau.ajouter_tache(code, info["nom"], info["duree"], preds)
+        nouveau.ajouter_tache("J", "Smoke Tests", 5, ["I"])
+
+        comparateur = ComparateurPERT(fichier_cicd, nouveau)
+        diff = comparateur.comparer()
+
+        assert diff["taches_ajoutees"] == ["J"]
+        assert diff["taches_supprimees"] == ["E"]
+        assert diff["duree_totale"] == {"avant": 64, "apres": 69, "delta": 5}
+        self._verifier_contre_analyse_complete(comparateur)
+
+    def test_reutilise_analyse_base(self, fichier_cicd):
+        """Test que l'analyse de base fournie n'est pas recalculee"""
+        base = CalculateurPERT(GraphePERT(fichier_cicd))
+        base.executer_analyse_complete()
+        base.marges["A"] = "sentinelle"
+
+        nouveau = GraphePERT(fichier_cicd)
+        nouveau.graphe.nodes["E"]["duree"] = 6
+
+        comparateur = ComparateurPERT(base, nouveau)
+        diff = comparateur.comparer()
+
+        assert base.marges["A"] == "sentinelle"
+        assert diff["marges_modifiees"]["E"] == {"avant": 12, "apres": 11}
+        # Seule E change: ses predecesseurs et successeurs gardent leurs dates
+        assert diff["taches_recalculees"] == 1
+
+    def test_relation_modifiee(self, fichier_cicd):
+        """Test d'un changement de type de relation sans changement de duree"""
+        nouveau = GraphePERT(fichier_cicd)
+        nouveau.graphe.edges["H", "I"].update(type="SS", decalage=5)
+
+        comparateur = ComparateurPERT(fichier_cicd, nouveau)
+        diff = comparateur.comparer()
+
+        assert diff["durees_modifiees"] == {}
+        assert comparateur.calc_nouveau.dates_tot["I"] == {"ES": 34, "EF": 44}
+        assert diff["duree_totale"]["apres"] == 54
+        self._verifier_contre_analyse_complete(comparateur)
+
+    def test_echeance_modifiee(self, fichier_cicd):
+        """Test qu'un jalon ajoute relance la passe arriere de ses ancetres"""
+        nouveau = GraphePERT(fichier_cicd)
+        nouveau.definir_echeance("F", 25)
+
+        comparateur = ComparateurPERT(fichier_cicd, nouveau)
+        diff = comparateur.comparer()
+
+        assert diff["echeances_modifiees"] == {"F": {"avant": None, "apres": 25}}
+        assert diff["duree_totale"]["delta"] == 0
+        assert comparateur.calc_nouveau.dates_tard["F"] == {"LS": 13, "LF": 25}
+        assert diff["marges_modifiees"]["B"] == {"avant": 0, "apres": -4}
+        assert "C" in diff["marges_modifiees"]
+        assert comparateur.calc_nouveau.chemin_critique == ["A", "B", "F"]
+        self._verifier_contre_analyse_complete(comparateur)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
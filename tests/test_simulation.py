@@ -0,0 +1,87 @@
+import pytest
+
+from src.graph_builder import GraphePERT
+from src.simulation import SimulateurFlotte
+
+
+class TestSimulateurFlotte:
+    """Tests pour la simulation de pipelines sur une flotte de runners"""
+
+    def test_parametres_invalides(self):
+        """Test du refus d'une flotte vide ou d'une politique inconnue"""
+        with pytest.raises(ValueError):
+            SimulateurFlotte(0)
+        with pytest.raises(ValueError):
+            SimulateurFlotte(2, "aleatoire")
+
+    def test_runners_suffisants(self, graphe_cicd):
+        """Sans contention, le delai est la duree du chemin critique"""
+        resultats = SimulateurFlotte(10).simuler([(5, graphe_cicd)])
+
+        assert resultats["nb_jobs"] == 9
+        assert resultats["delais"].tolist() == [64]
+        assert resultats["attente"]["max"] == 0
+        assert resultats["ralentissement"]["max"] == 1
+        assert resultats["utilisation"] == pytest.approx(107 / (10 * 64))
+
+    def test_un_seul_runner(self, graphe_cicd):
+        """Avec un runner, les jobs sont executes l'un apres l'autre"""
+        resultats = SimulateurFlotte(1).simuler([(0, graphe_cicd)])
+
+        assert resultats["delais"].tolist() == [107]
+        assert resultats["utilisation"] == 1
+        assert resultats["attente"]["max"] > 0
+
+    def test_politique_plus_court_restant(self):
+        """Le pipeline le plus court passe devant avec plus_court_restant"""
+        long = GraphePERT()
+        long.ajouter_tache("L", "Long", 10)
+        court = GraphePERT()
+        court.ajouter_tache("C", "Court", 1)
+        arrivees = [(0, long), (0, court)]
+
+        fifo = SimulateurFlotte(1, "fifo").simuler(arrivees)
+        srpt = SimulateurFlotte(1, "plus_court_restant").simuler(arrivees)
+
+        assert fifo["delais"].tolist() == [10, 11]
+        assert srpt["delais"].tolist() == [11, 1]
+        assert srpt["delai"]["moyenne"] < fifo["delai"]["moyenne"]
+
+    def test_politique_chemin_critique(self):
+        """Le job de plus long rang restant est servi en premier"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Build", 1)
+        graphe.ajouter_tache("B", "Tests", 10, ["A"])
+        graphe.ajouter_tache("C", "Lint", 5)
+
+        resultats = SimulateurFlotte(1, "chemin_critique").simuler([(0, graphe)])
+
+        # A (rang 11), puis B (rang 10) avant C (rang 5, pret depuis 0)
+        assert sorted(resultats["attentes"].tolist()) == [0, 0, 11]
+        assert resultats["delais"].tolist() == [16]
+
+    def test_decalage_retarde_le_job(self):
+        """Un decalage FS rend le successeur pret plus tard"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Build", 3)
+        graphe.ajouter_tache("B", "Deploy", 2, [("A", "FS", 4)])
+
+        resultats = SimulateurFlotte(1).simuler([(0, graphe)])
+
+        assert resultats["delais"].tolist() == [9]
+        assert resultats["attente"]["max"] == 0
+
+    def test_plusieurs_pipelines(self, graphe_cicd):
+        """Contention entre pipelines: le debit est borne par les runners"""
+        arrivees = [(instant, graphe_cicd) for instant in range(0, 100, 10)]
+        resultats = SimulateurFlotte(2).simuler(arrivees)
+
+        assert resultats["nb_pipelines"] == 10
+        assert resultats["nb_jobs"] == 90
+        # 10 x 107 minutes de travail sur 2 runners
+        assert resultats["duree_simulee"] >= 535
+        assert resultats["delai"]["max"] > 64
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
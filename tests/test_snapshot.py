@@ -0,0 +1,104 @@
+import dataclasses
+import threading
+
+import pytest
+
+from src.graph_builder import GraphePERT
+from src.pert_calculator import CalculateurPERT
+
+
+class TestInstantaneAnalyse:
+    """Tests pour les instantanes figes de l'analyse"""
+
+    @pytest.fixture
+    def graphe_parallele(self):
+        """Fixture: graphe avec taches paralleles"""
+        graphe = GraphePERT()
+        graphe.ajouter_tache("A", "Start", 5)
+        graphe.ajouter_tache("B", "Branch 1", 10, ["A"])
+        graphe.ajouter_tache("C", "Branch 2", 15, ["A"])
+        graphe.ajouter_tache("D", "End", 8, ["B", "C"])
+        return graphe
+
+    def test_publication(self, graphe_parallele):
+        """L'analyse complete publie un instantane coherent"""
+        calc = CalculateurPERT(graphe_parallele)
+        assert calc.instantane is None
+        calc.executer_analyse_complete()
+
+        instantane = calc.instantane
+        assert instantane.version == 1
+        assert instantane.duree_totale == 28
+        assert instantane.chemin_critique == ("A", "C", "D")
+        assert instantane.taches_critiques() == ("A", "C", "D")
+        assert instantane.dates_tache("B") == {
+            "ES": 5,
+            "EF": 15,
+            "LS": 10,
+            "LF": 20,
+            "marge": 5,
+            "marge_libre": 5,
+        }
+
+    def test_lecture_seule(self, graphe_parallele):
+        """Ni les champs, ni les tableaux, ni l'index ne sont modifiables"""
+        calc = CalculateurPERT(graphe_parallele)
+        instantane = calc.obtenir_instantane()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            instantane.duree_totale = 0
+        with pytest.raises(ValueError):
+            instantane.es[0] = 1
+        with pytest.raises(TypeError):
+            instantane.index["X"] = 0
+
+    def test_recalcul_ne_modifie_pas_l_ancien(self, graphe_parallele):
+        """Un recalcul publie un nouvel instantane sans toucher aux precedents"""
+        calc = CalculateurPERT(graphe_parallele)
+        resultats = calc.executer_analyse_complete()
+        ancien = calc.instantane
+
+        graphe_parallele.graphe.nodes["B"]["duree"] = 30
+        calc.executer_analyse_complete()
+
+        assert calc.instantane.version == 2
+        assert calc.instantane.duree_totale == 43
+        assert ancien.duree_totale == 28
+        assert ancien.dates_tache("D")["EF"] == 28
+        assert resultats["dates_tot"]["D"]["EF"] == 28
+
+    def test_obtenir_instantane_sans_recalcul(self, graphe_parallele):
+        """obtenir_instantane ne relance pas l'analyse si un instantane existe"""
+        calc = CalculateurPERT(graphe_parallele)
+        premier = calc.obtenir_instantane()
+        assert calc.obtenir_instantane() is premier
+
+    def test_lecteurs_concurrents(self, graphe_parallele):
+        """Des lecteurs concurrents voient toujours un instantane complet"""
+        calc = CalculateurPERT(graphe_parallele)
+        calc.executer_analyse_complete()
+        incoherences = []
+        arret = threading.Event()
+
+        def lire():
+            while not arret.is_set():
+                instantane = calc.instantane
+                fin = instantane.dates_tache("D")["EF"]
+                if fin != instantane.duree_totale:
+                    incoherences.append(instantane.version)
+
+        lecteurs = [threading.Thread(target=lire) for _ in range(4)]
+        for lecteur in lecteurs:
+            lecteur.start()
+        for duree in range(1, 50):
+            graphe_parallele.graphe.nodes["C"]["duree"] = duree
+            calc.executer_analyse_complete()
+        arret.set()
+        for lecteur in lecteurs:
+            lecteur.join()
+
+        assert incoherences == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,86 @@
+import networkx as nx
+import pytest
+
+from src.verification import (
+    FORMES,
+    MOTEURS,
+    VerificateurMoteurs,
+    construire_graphe,
+    extraire_cas,
+    generer_dag,
+    moteur_reference,
+)
+
+
+def moteur_bogue(graphe_pert) -> dict:
+    """Moteur volontairement faux: ignore les decalages des relations"""
+    cas = [
+        (code, duree, [(pred, "FS", 0) for pred, _, _ in relations], echeance)
+        for code, duree, relations, echeance in extraire_cas(graphe_pert)
+    ]
+    return moteur_reference(construire_graphe(cas))
+
+
+class TestVerificateurMoteurs:
+    """Tests pour le harnais de verification differentielle"""
+
+    @pytest.mark.parametrize("forme", FORMES)
+    def test_generer_dag(self, forme):
+        """Chaque forme donne un DAG connexe de la taille demandee"""
+        graphe = generer_dag(forme, 30, graine=3)
+
+        assert graphe.graphe.number_of_nodes() == 30
+        assert nx.is_directed_acyclic_graph(graphe.graphe)
+        assert graphe.valider_graphe()[0]
+        assert extraire_cas(generer_dag(forme, 30, graine=3)) == extraire_cas(graphe)
+
+    def test_generer_dag_forme_inconnue(self):
+        """Test du refus d'une forme inconnue"""
+        with pytest.raises(ValueError):
+            generer_dag("etoile", 10)
+
+    def test_moteurs_enregistres_concordent(self):
+        """Tous les moteurs du depot donnent les resultats de la reference"""
+        rapport = VerificateurMoteurs().verifier(tailles=(1, 3, 15), nb_graines=3)
+
+        assert rapport["nb_cas"] == len(FORMES) * 3 * 3
+        assert rapport["echecs"] == []
+        assert set(rapport["debits"]) == set(MOTEURS)
+        assert all(d["taches_par_seconde"] > 0 for d in rapport["debits"].values())
+
+    def test_reduction_cas_en_echec(self):
+        """Un moteur faux est detecte et le contre-exemple est minimal"""
+        verificateur = VerificateurMoteurs(
+            {"reference": moteur_reference, "bogue": moteur_bogue}
+        )
+        rapport = verificateur.verifier(
+            formes=("relations_typees",), tailles=(20,), nb_graines=2
+        )
+
+        assert rapport["echecs"]
+        for echec in rapport["echecs"]:
+            assert echec["moteur"] == "bogue"
+            assert echec["differences"]
+            # Il suffit de deux taches et d'une relation avec decalage ou type
+            assert len(echec["cas"]) == 2
+            relations = [r for _, _, rels, _ in echec["cas"] for r in rels]
+            assert len(relations) == 1 and relations[0][1:] != ("FS", 0)
+
+    def test_exception_du_moteur(self):
+        """Une exception d'un moteur est rapportee comme un echec"""
+
+        def moteur_plante(graphe_pert):
+            raise RuntimeError("plantage")
+
+        verificateur = VerificateurMoteurs(
+            {"reference": moteur_reference, "plante": moteur_plante}
+        )
+        rapport = verificateur.verifier(formes=("chaine",), tailles=(4,), nb_graines=1)
+
+        assert len(rapport["echecs"]) == 1
+        assert len(rapport["echecs"][0]["cas"]) == 1
+        assert "plantage" in rapport["echecs"][0]["differences"][0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])